@@ -3,48 +3,64 @@
 """A Pyramid app that demonstrates various Deform widgets and
 capabilities and which provides a functional test suite"""
 
-import csv
 import decimal
 import inspect
 import logging
-import pprint
 import random
 import sys
 
 import colander
 from pyramid.config import Configurator
+from pyramid.httpexceptions import HTTPBadRequest
+from pyramid.httpexceptions import HTTPNotModified
 from pyramid.i18n import TranslationStringFactory
 from pyramid.i18n import get_locale_name
-from pyramid.i18n import get_localizer
-from pyramid.renderers import get_renderer
 from pyramid.response import Response
 from pyramid.session import SignedCookieSessionFactory
-from pyramid.threadlocal import get_current_request
+from pyramid.settings import asbool
 from pyramid.view import view_config
 from pyramid.view import view_defaults
 
 import deform
-from deform.renderer import configure_zpt_renderer
 from iso8601 import iso8601
-from pygments import highlight
 from pygments.formatters import HtmlFormatter
-from pygments.lexers import PythonLexer
 
+from deformdemo.adapters import adapts
+from deformdemo.adapters import get_widget_adapters
+from deformdemo.captured import get_capture_renderer
+from deformdemo.columns import ColumnSequence
+from deformdemo.csvtext import StreamingTextAreaCSVWidget
+from deformdemo.csvtext import StreamingTextInputCSVWidget
+from deformdemo.csvtext import iter_rows
+from deformdemo.csvtext import line_errors
+from deformdemo.csvtext import serialize_rows
+from deformdemo.formcache import get_form_cache
+from deformdemo.options import KnownOptions
+from deformdemo.options import RemoteSelect2Widget
+from deformdemo.options import RemoteSelectizeWidget
+from deformdemo.options import get_option_cache
+from deformdemo.options import get_options
+from deformdemo.registry import demonstrate
+from deformdemo.registry import get_demo_registry
+from deformdemo.sourcecode import get_highlighted_module
+from deformdemo.sourcecode import highlight_code
+from deformdemo.sourcecode import page_version
+from deformdemo.sourcecode import warm_code_cache
+from deformdemo.suggestions import get_suggestion_cache
+from deformdemo.suggestions import get_suggestions
+from deformdemo.suggestions import page_params
+from deformdemo.templating import configure_widget_renderer
+from deformdemo.templating import get_macros
+from deformdemo.templating import precompile_templates
+from deformdemo.templating import reloading
+from deformdemo.timing import get_timings
+from deformdemo.tmpstore import get_tmpstore
+from deformdemo.translation import get_widget_translator
 
-log = logging.getLogger(__name__)
 
-try:
-    from StringIO import StringIO
-except ImportError:
-    from io import StringIO
+log = logging.getLogger(__name__)
 
 PY3 = sys.version_info[0] == 3
-PY38MIN = (
-    sys.version_info[0] == 3
-    and sys.version_info[1] >= 8
-    and sys.version_info[1] <= 9
-)
-PY310MIN = sys.version_info[0] == 3 and sys.version_info[1] >= 10
 
 if PY3:
 
@@ -61,35 +77,11 @@ css = formatter.get_style_defs()
 # the zpt_renderer above is referred to within the demo.ini file by dotted name
 
 
-class demonstrate(object):
-    def __init__(self, title):
-        self.title = title
-
-    def __call__(self, method):
-        method.demo = self.title
-        return method
-
-
-# Py2/Py3 compat
-# http://stackoverflow.com/a/16888673/315168
-# eliminate u''
-def my_safe_repr(obj, context, maxlevels, level, sort_dicts=True):
-    if type(obj) is unicode:
-        obj = obj.encode("utf-8")
-
-    # Python 3.8 changed the call signature of pprint._safe_repr.
-    # by adding sort_dicts.
-    if PY38MIN:
-        return pprint._safe_repr(obj, context, maxlevels, level, sort_dicts)
-    else:
-        return pprint._safe_repr(obj, context, maxlevels, level)
-
-
 @view_defaults(route_name="deformdemo")
 class DeformDemo(object):
     def __init__(self, request):
         self.request = request
-        self.macros = get_renderer("templates/main.pt").implementation().macros
+        self.macros = get_macros(request)
 
     def render_form(
         self,
@@ -101,39 +93,50 @@ class DeformDemo(object):
         is_i18n=False,
     ):
         captured = None
+        timings = get_timings(self.request)
 
         if submitted in self.request.POST:
             # the request represents a form submission
             try:
                 # try to validate the submitted values
                 controls = self.request.POST.items()
-                captured = form.validate(controls)
+                with timings.phase("validate"):
+                    captured = form.validate(controls)
                 if success:
                     response = success()
                     if response is not None:
                         return response
-                html = form.render(captured)
+                with timings.phase("render"):
+                    html = form.render(captured)
             except deform.ValidationFailure as e:
                 # the submitted values could not be validated
-                html = e.render()
+                with timings.phase("render"):
+                    html = e.render()
 
         else:
             # the request requires a simple form rendering
-            html = form.render(appstruct, readonly=readonly)
+            with timings.phase("render"):
+                html = form.render(appstruct, readonly=readonly)
 
         if self.request.is_xhr:
             return Response(html)
 
-        code, start, end = self.get_code(2)
+        with timings.phase("code"):
+            code, start, end = self.get_code(2)
         locale_name = get_locale_name(self.request)
 
-        reqts = form.get_widget_resources()
+        demo = self.get_demo()
+        if demo.resources is None:
+            demo.resources = form.get_widget_resources()
+        reqts = demo.resources
 
-        printer = pprint.PrettyPrinter()
-        if not PY310MIN:
-            printer.format = my_safe_repr
-        output = printer.pformat(captured)
-        captured = highlight(output, PythonLexer(), formatter)
+        with timings.phase("captured"):
+            # see deformdemo.captured for the bounds of the panel
+            renderer = get_capture_renderer(self.request.registry)
+            captured = renderer.render(captured)
+
+        # the page template is rendered once we return
+        timings.start("template")
 
         # values passed to template for rendering
         return {
@@ -150,14 +153,19 @@ class DeformDemo(object):
             "js_links": reqts["js"],
         }
 
+    @property
+    def tmpstore(self):
+        # the store of file uploads; see deformdemo.tmpstore
+        return get_tmpstore(self.request.registry)
+
+    def cached_form(self, make_form, *args):
+        # build the form once per distinct ``args``; see deformdemo.formcache
+        forms = get_form_cache(self.request.registry)
+        with get_timings(self.request).phase("form"):
+            return forms.get(make_form, *args)
+
     def get_code(self, level):
-        frame = sys._getframe(level)
-        lines, start = inspect.getsourcelines(frame.f_code)
-        end = start + len(lines)
-        code = "".join(lines)
-        if not PY3:
-            code = unicode(code, "utf-8")
-        return highlight(code, PythonLexer(), formatter), start, end
+        return highlight_code(sys._getframe(level).f_code)
 
     @view_config(name="thanks.html")
     def thanks(self):
@@ -171,29 +179,33 @@ class DeformDemo(object):
         params = self.request.params
         start = params.get("start")
         end = params.get("end")
-        hl_lines = None
         if start and end:
-            start = int(start)
-            end = int(end)
-            hl_lines = list(range(start, end))
-        code = open(inspect.getsourcefile(self.__class__), "r").read()
-        code = code.encode("utf-8")
-        formatter = HtmlFormatter(
-            linenos="table",
-            lineanchors="line",
-            cssclass="hightlight ",
-            hl_lines=hl_lines,
+            try:
+                start = int(start)
+                end = int(end)
+            except ValueError:
+                raise HTTPBadRequest("start and end must be line numbers")
+        else:
+            start = end = None
+        module = get_highlighted_module(inspect.getsourcefile(self.__class__))
+        version = page_version(
+            ("templates/code.pt", "templates/main.pt"),
+            reload=reloading(self.request.registry.settings),
+        )
+        etag = module.etag_for(
+            self.request.application_url, start, end, version
         )
-        html = highlight(code, PythonLexer(), formatter)
-        return {"code": html, "demos": self.get_demos()}
+        if etag in self.request.if_none_match:
+            return HTTPNotModified(etag=etag)
+        self.request.response.etag = etag
+        return {"code": module.render(start, end), "demos": self.get_demos()}
+
+    def get_demo(self):
+        demos = get_demo_registry(self.request.registry)
+        return demos.get("deformdemo", self.request.view_name)
 
     def get_title(self):
-        # gross hack; avert your eyes
-        frame = sys._getframe(3)
-        attr = frame.f_locals["attr"]
-        inst = frame.f_locals["inst"]
-        method = getattr(inst, attr)
-        return method.demo
+        return self.get_demo().title
 
     @view_config(name="pygments.css")
     def cssview(self):
@@ -206,130 +218,147 @@ class DeformDemo(object):
         return {"demos": self.get_demos()}
 
     def get_demos(self):
-        def predicate(value):
-            if getattr(value, "demo", None) is not None:
-                return True
-
-        demos = inspect.getmembers(self, predicate)
-        L = []
-        for name, method in demos:
-            url = self.request.resource_url(
-                self.request.context, name, route_name="deformdemo"
-            )
-            L.append((method.demo, url))
-        L.sort()
-        return L
+        demos = get_demo_registry(self.request.registry)
+        return demos.links(self.request, "deformdemo", self.request.context)
 
     @view_config(renderer="templates/form.pt", name="textinput")
     @demonstrate("Text Input Widget")
     def textinput(self):
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(max=100),
-                widget=deform.widget.TextInputWidget(),
-                description="Enter some text",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(max=100),
+                    widget=deform.widget.TextInputWidget(),
+                    description="Enter some text",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="textinput_with_html5")
     @demonstrate("Text Input Widget (with arbitrary HTML5 attributes)")
     def textinput_with_html5(self):
-        class Schema(colander.Schema):
-            hours_worked = colander.SchemaNode(
-                colander.Decimal(),
-                description="Enter number of hours worked",
-                default=30.00,
-                validator=colander.Range(min=0, max=decimal.Decimal("99.99")),
-                widget=deform.widget.TextInputWidget(
-                    attributes={
-                        "type": "number",
-                        "inputmode": "decimal",
-                        "step": "0.01",
-                        "min": "0",
-                        "max": "99.99",
-                    }
-                ),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                hours_worked = colander.SchemaNode(
+                    colander.Decimal(),
+                    description="Enter number of hours worked",
+                    default=30.00,
+                    validator=colander.Range(
+                        min=0, max=decimal.Decimal("99.99")
+                    ),
+                    widget=deform.widget.TextInputWidget(
+                        attributes={
+                            "type": "number",
+                            "inputmode": "decimal",
+                            "step": "0.01",
+                            "min": "0",
+                            "max": "99.99",
+                        }
+                    ),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="textinput_with_css_class")
     @demonstrate("Text Input Widget (with CSS class)")
     def textinput_with_css_class(self):
-        css_widget = deform.widget.TextInputWidget(
-            css_class="deform-widget-with-style"
-        )
-
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(max=100),
-                widget=css_widget,
-                description="Enter some text",
+        def make_form():
+            css_widget = deform.widget.TextInputWidget(
+                css_class="deform-widget-with-style"
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(max=100),
+                    widget=css_widget,
+                    description="Enter some text",
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="textinput_readonly")
     @demonstrate("Text Input Widget (read-only)")
     def textinput_readonly(self):
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextInputWidget(readonly=True),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextInputWidget(readonly=True),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct={"text": "text"})
 
     @view_config(renderer="templates/form.pt", name="money_input")
     @demonstrate("Money Input")
     def money_input(self):
-        widget = deform.widget.MoneyInputWidget(options={"allowZero": True})
-
-        class Schema(colander.Schema):
-            greenbacks = colander.SchemaNode(
-                colander.Decimal(),
-                widget=widget,
-                description="Enter some money",
+        def make_form():
+            widget = deform.widget.MoneyInputWidget(
+                options={"allowZero": True}
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                greenbacks = colander.SchemaNode(
+                    colander.Decimal(),
+                    widget=widget,
+                    description="Enter some money",
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="autocomplete_input")
     @demonstrate("Autocomplete Input Widget")
     def autocomplete_input(self):
-        choices = ["bar", "baz", "two", "three", "foo & bar", "one < two"]
-        widget = deform.widget.AutocompleteInputWidget(
-            values=choices, min_length=1
-        )
-
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(max=100),
-                widget=widget,
-                description='Enter some text (Hint: try "b" or "t")',
+        def make_form():
+            choices = ["bar", "baz", "two", "three", "foo & bar", "one < two"]
+            widget = deform.widget.AutocompleteInputWidget(
+                values=choices, min_length=1
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(max=100),
+                    widget=widget,
+                    description='Enter some text (Hint: try "b" or "t")',
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -338,183 +367,244 @@ class DeformDemo(object):
     )
     @demonstrate("Autocomplete Input Widget (with Remote Data Source)")
     def autocomplete_remote_input(self):
-        widget = deform.widget.AutocompleteInputWidget(
-            min_length=1,
-            values=self.request.route_path(
-                "deformdemo", traverse=("autocomplete_input_values",)
-            ),
-        )
-
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(max=100),
-                widget=widget,
-                description='Enter some text (Hint: try "b" or "t")',
+        def make_form(values_url):
+            widget = deform.widget.AutocompleteInputWidget(
+                min_length=1, values=values_url
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(max=100),
+                    widget=widget,
+                    description='Enter some text (Hint: try "b" or "t")',
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        values_url = self.request.route_path(
+            "deformdemo", traverse=("autocomplete_input_values",)
+        )
+        form = self.cached_form(make_form, values_url)
 
         return self.render_form(form)
 
-    @view_config(renderer="json", name="autocomplete_input_values")
+    @view_config(name="autocomplete_input_values")
     def autocomplete_input_values(self):
+        # see deformdemo.suggestions for the source of suggestions and the
+        # cache of their JSON responses
+        registry = self.request.registry
+        return self.search_response(
+            get_suggestions(registry), get_suggestion_cache(registry)
+        )
+
+    @view_config(name="remote_option_values")
+    def remote_option_values(self):
+        # see deformdemo.options
+        registry = self.request.registry
+        return self.search_response(
+            get_options(registry), get_option_cache(registry)
+        )
+
+    def search_response(self, source, cache):
+        # a page of what ``source`` finds for the ``term`` of the request,
+        # as JSON
         text = self.request.params.get("term", "")
-        return [
-            x
-            for x in ["bar", "baz", "two", "three", "foo & bar", "one < two"]
-            if x.startswith(text)
-        ]
+        limit, offset = page_params(self.request.params)
+        body, etag = cache.lookup(source, text, limit, offset)
+        response = self.request.response
+        response.content_type = "application/json"
+        response.body = body
+        response.etag = etag
+        response.cache_control = "public, max-age=%d" % cache.max_age
+        # answer If-None-Match with a 304
+        response.conditional_response = True
+        return response
 
     @view_config(renderer="templates/form.pt", name="textarea")
     @demonstrate("Text Area Widget")
     def textarea(self):
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(max=100),
-                widget=deform.widget.TextAreaWidget(rows=10, cols=60),
-                description="Enter some text",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(max=100),
+                    widget=deform.widget.TextAreaWidget(rows=10, cols=60),
+                    description="Enter some text",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="textarea_readonly")
     @demonstrate("Text Area Widget (read-only)")
     def textarea_readonly(self):
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(max=100),
-                widget=deform.widget.TextAreaWidget(readonly=True),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(max=100),
+                    widget=deform.widget.TextAreaWidget(readonly=True),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct={"text": "text"})
 
     @view_config(renderer="templates/form.pt", name="richtext")
     @demonstrate("Rich Text Widget (TinyMCE)")
     def richtext(self):
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                # These options are directly passed to underylying TinyMCE as
-                # browser_spellcheck : true
-                # See https://www.tinymce.com/docs/configure/
-                widget=deform.widget.RichTextWidget(
-                    options=(("browser_spellcheck", True),)
-                ),
-                description="Enter some text",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    # These options are directly passed to underylying
+                    # TinyMCE as browser_spellcheck : true
+                    # See https://www.tinymce.com/docs/configure/
+                    widget=deform.widget.RichTextWidget(
+                        options=(("browser_spellcheck", True),)
+                    ),
+                    description="Enter some text",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="richtext_i18n")
     @demonstrate("Rich Text Widget (internationalized)")
     def richtext_i18n(self):
-        locale_name = get_locale_name(self.request)
+        def make_form(locale_name):
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.RichTextWidget(),
+                    description=_("Enter some text"),
+                )
+                _LOCALE_ = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.HiddenWidget(),
+                    default=locale_name,
+                )
 
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.RichTextWidget(),
-                description=_("Enter some text"),
-            )
-            _LOCALE_ = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.HiddenWidget(),
-                default=locale_name,
+            schema = Schema()
+            form = deform.Form(
+                schema, buttons=[deform.Button("submit", _("Submit"))]
             )
+            return form
 
-        schema = Schema()
-        form = deform.Form(
-            schema, buttons=[deform.Button("submit", _("Submit"))]
-        )
+        form = self.cached_form(make_form, get_locale_name(self.request))
         return self.render_form(form, is_i18n=True)
 
     @view_config(renderer="templates/form.pt", name="delayed_richtext")
     @demonstrate("Rich Text Widget (delayed)")
     def delayed_richtext(self):
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.RichTextWidget(delayed_load=True),
-                description="Enter some text",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.RichTextWidget(delayed_load=True),
+                    description="Enter some text",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="richtext_readonly")
     @demonstrate("Rich Text Widget (read-only)")
     def richtext_readonly(self):
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.RichTextWidget(readonly=True),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.RichTextWidget(readonly=True),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct={"text": "<p>Hi!</p>"})
 
     @view_config(renderer="templates/form.pt", name="password")
     @demonstrate("Password Widget")
     def password(self):
-        class Schema(colander.Schema):
-            password = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(min=5, max=100),
-                widget=deform.widget.PasswordWidget(),
-                description="Enter a password",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                password = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(min=5, max=100),
+                    widget=deform.widget.PasswordWidget(),
+                    description="Enter a password",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="password_redisplay")
     @demonstrate("Password Widget (redisplay on validation failure)")
     def password_redisplay(self):
-        class Schema(colander.Schema):
-            password = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(min=5, max=100),
-                widget=deform.widget.PasswordWidget(redisplay=True),
-                description="Enter a password",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                password = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(min=5, max=100),
+                    widget=deform.widget.PasswordWidget(redisplay=True),
+                    description="Enter a password",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkbox")
     @demonstrate("Checkbox Widget")
     def checkbox(self):
-        class Schema(colander.Schema):
-            want = colander.SchemaNode(
-                colander.Boolean(),
-                description="Check this box!",
-                widget=deform.widget.CheckboxWidget(),
-                title="I Want It!",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                want = colander.SchemaNode(
+                    colander.Boolean(),
+                    description="Check this box!",
+                    widget=deform.widget.CheckboxWidget(),
+                    title="I Want It!",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -548,201 +638,241 @@ class DeformDemo(object):
         https://github.com/Pylons/deformdemo/blob/main/deformdemo/custom_widgets/modal.pt
         """
 
-        class Schema(colander.Schema):
-            title = "Pop up example title"
+        def make_form():
+            class Schema(colander.Schema):
+                title = "Pop up example title"
 
-            # Override default form.pt for rendering <form>
-            widget = deform.widget.FormWidget(template="modal.pt")
+                # Override default form.pt for rendering <form>
+                widget = deform.widget.FormWidget(template="modal.pt")
 
-            name = colander.SchemaNode(
-                colander.String(), description="Enter your name (required)"
-            )
+                name = colander.SchemaNode(
+                    colander.String(), description="Enter your name (required)"
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
 
-        # CSS is used in <button> opener and JS code
-        form.formid = "my-pop-up"
+            # CSS is used in <button> opener and JS code
+            form.formid = "my-pop-up"
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkbox_with_label")
     @demonstrate("Checkbox Widget (with Label)")
     def checkbox_with_label(self):
-        class Schema(colander.Schema):
-            want = colander.SchemaNode(
-                colander.Boolean(),
-                description="Check this box!",
-                widget=deform.widget.CheckboxWidget(),
-                label="Really",
-                title="I Want It!",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                want = colander.SchemaNode(
+                    colander.Boolean(),
+                    description="Check this box!",
+                    widget=deform.widget.CheckboxWidget(),
+                    label="Really",
+                    title="I Want It!",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkbox_readonly")
     @demonstrate("Checkbox Widget (read-only)")
     def checkbox_readonly(self):
-        class Schema(colander.Schema):
-            want = colander.SchemaNode(
-                colander.Boolean(),
-                description="Check this box!",
-                widget=deform.widget.CheckboxWidget(readonly=True),
-                title="I Want It!",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                want = colander.SchemaNode(
+                    colander.Boolean(),
+                    description="Check this box!",
+                    widget=deform.widget.CheckboxWidget(readonly=True),
+                    title="I Want It!",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct={"want": True})
 
     @view_config(renderer="templates/form.pt", name="radiochoice")
     @demonstrate("Radio Choice Widget")
     def radiochoice(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                validator=colander.OneOf([x[0] for x in choices]),
-                widget=deform.widget.RadioChoiceWidget(values=choices),
-                title="Choose your pepper",
-                description="Select a Pepper",
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.OneOf([x[0] for x in choices]),
+                    widget=deform.widget.RadioChoiceWidget(values=choices),
+                    title="Choose your pepper",
+                    description="Select a Pepper",
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="radiochoice_inline")
     @demonstrate("Radio Choice Widget (inline)")
     def radiochoice_inline(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                validator=colander.OneOf([x[0] for x in choices]),
-                widget=deform.widget.RadioChoiceWidget(
-                    values=choices, inline=True
-                ),
-                title="Choose your pepper",
-                description="Select a Pepper",
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.OneOf([x[0] for x in choices]),
+                    widget=deform.widget.RadioChoiceWidget(
+                        values=choices, inline=True
+                    ),
+                    title="Choose your pepper",
+                    description="Select a Pepper",
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="radiochoice_int")
     @demonstrate("Radio Choice Widget (with int values)")
     def radiochoice_int(self):
-        choices = ((0, "Habanero"), (1, "Jalapeno"), (2, "Chipotle"))
+        def make_form():
+            choices = ((0, "Habanero"), (1, "Jalapeno"), (2, "Chipotle"))
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Int(),
+                    validator=colander.OneOf([x[0] for x in choices]),
+                    widget=deform.widget.RadioChoiceWidget(values=choices),
+                    title="Choose your pepper",
+                    description="Select a Pepper",
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Int(),
-                validator=colander.OneOf([x[0] for x in choices]),
-                widget=deform.widget.RadioChoiceWidget(values=choices),
-                title="Choose your pepper",
-                description="Select a Pepper",
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="radiochoice_readonly")
     @demonstrate("Radio Choice Widget (read-only)")
     def radiochoice_readonly(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.RadioChoiceWidget(
-                    values=choices, readonly=True
-                ),
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.RadioChoiceWidget(
+                        values=choices, readonly=True
+                    ),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct={"pepper": "jalapeno"})
 
     @view_config(renderer="templates/form.pt", name="checkedinput")
     @demonstrate("Checked Input Widget")
     def checkedinput(self):
-        widget = deform.widget.CheckedInputWidget(
-            subject="Email", confirm_subject="Confirm Email"
-        )
-
-        class Schema(colander.Schema):
-            email = colander.SchemaNode(
-                colander.String(),
-                title="Email Address",
-                description="Type your email address and confirm it",
-                validator=colander.Email(),
-                widget=widget,
+        def make_form():
+            widget = deform.widget.CheckedInputWidget(
+                subject="Email", confirm_subject="Confirm Email"
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                email = colander.SchemaNode(
+                    colander.String(),
+                    title="Email Address",
+                    description="Type your email address and confirm it",
+                    validator=colander.Email(),
+                    widget=widget,
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkedinput_readonly")
     @demonstrate("Checked Input Widget (read-only)")
     def checkedinput_readonly(self):
-        widget = deform.widget.CheckedInputWidget(
-            subject="Email", confirm_subject="Confirm Email", readonly=True
-        )
-
-        class Schema(colander.Schema):
-            email = colander.SchemaNode(
-                colander.String(),
-                title="Email Address",
-                description="Type your email address and confirm it",
-                validator=colander.Email(),
-                widget=widget,
+        def make_form():
+            widget = deform.widget.CheckedInputWidget(
+                subject="Email", confirm_subject="Confirm Email", readonly=True
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                email = colander.SchemaNode(
+                    colander.String(),
+                    title="Email Address",
+                    description="Type your email address and confirm it",
+                    validator=colander.Email(),
+                    widget=widget,
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct={"email": "ww@graymatter.com"})
 
     @view_config(renderer="templates/form.pt", name="checkedpassword")
     @demonstrate("Checked Password Widget")
     def checkedpassword(self):
-        class Schema(colander.Schema):
-            password = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(min=5),
-                widget=deform.widget.CheckedPasswordWidget(),
-                description="Type your password and confirm it",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                password = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(min=5),
+                    widget=deform.widget.CheckedPasswordWidget(),
+                    description="Type your password and confirm it",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -751,61 +881,76 @@ class DeformDemo(object):
     )
     @demonstrate("Checked Password Widget (redisplay on validation failure)")
     def checkedpassword_redisplay(self):
-        class Schema(colander.Schema):
-            password = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(min=5),
-                widget=deform.widget.CheckedPasswordWidget(redisplay=True),
-                description="Type your password and confirm it",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                password = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(min=5),
+                    widget=deform.widget.CheckedPasswordWidget(redisplay=True),
+                    description="Type your password and confirm it",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkedpassword_readonly")
     @demonstrate("Checked Password Widget (read-only)")
     def checkedpassword_readonly(self):
-        class Schema(colander.Schema):
-            password = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(min=5),
-                widget=deform.widget.CheckedPasswordWidget(readonly=True),
-                description="Type your password and confirm it",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                password = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(min=5),
+                    widget=deform.widget.CheckedPasswordWidget(readonly=True),
+                    description="Type your password and confirm it",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct={"password": "foo"})
 
     @view_config(renderer="templates/form.pt", name="checkedinput_withmask")
     @demonstrate("Checked Input Widget (with Input Mask)")
     def checkedinput_withmask(self):
-        widget = deform.widget.CheckedInputWidget(
-            subject="SSN",
-            confirm_subject="Confirm SSN",
-            mask="999-99-9999",
-            mask_placeholder="#",
-        )
-
-        class Schema(colander.Schema):
-            ssn = colander.SchemaNode(
-                colander.String(),
-                widget=widget,
-                title="Social Security Number",
-                description="Type your Social Security Number and confirm it",
+        def make_form():
+            widget = deform.widget.CheckedInputWidget(
+                subject="SSN",
+                confirm_subject="Confirm SSN",
+                mask="999-99-9999",
+                mask_placeholder="#",
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                ssn = colander.SchemaNode(
+                    colander.String(),
+                    widget=widget,
+                    title="Social Security Number",
+                    description=(
+                        "Type your Social Security Number and confirm it"
+                    ),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="dynamic_field")
     @demonstrate("Dynamic fields: add and remove")
     def dynamic_field(self):
+        # not cached: the schema is bound to the request (see after_bind)
         class Schema(colander.Schema):
             field1 = colander.SchemaNode(
                 colander.String(),
@@ -860,22 +1005,26 @@ class DeformDemo(object):
     @view_config(renderer="templates/form.pt", name="mapping")
     @demonstrate("Mapping Widget")
     def mapping(self):
-        class Mapping(colander.Schema):
-            name = colander.SchemaNode(
-                colander.String(), description="Content name"
-            )
-            date = colander.SchemaNode(
-                colander.Date(),
-                widget=deform.widget.DatePartsWidget(),
-                description="Content date",
-            )
+        def make_form():
+            class Mapping(colander.Schema):
+                name = colander.SchemaNode(
+                    colander.String(), description="Content name"
+                )
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    widget=deform.widget.DatePartsWidget(),
+                    description="Content date",
+                )
 
-        class Schema(colander.Schema):
-            number = colander.SchemaNode(colander.Integer())
-            mapping = Mapping()
+            class Schema(colander.Schema):
+                number = colander.SchemaNode(colander.Integer())
+                mapping = Mapping()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -891,60 +1040,68 @@ class DeformDemo(object):
         http://getbootstrap.com/javascript/#collapse
         """
 
-        class Mapping(colander.Schema):
-            name = colander.SchemaNode(
-                colander.String(), description="Content name"
-            )
-            date = colander.SchemaNode(
-                colander.Date(),
-                widget=deform.widget.DatePartsWidget(),
-                description="Content date",
-            )
+        def make_form():
+            class Mapping(colander.Schema):
+                name = colander.SchemaNode(
+                    colander.String(), description="Content name"
+                )
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    widget=deform.widget.DatePartsWidget(),
+                    description="Content date",
+                )
 
-        class Schema(colander.Schema):
-            number = colander.SchemaNode(colander.Integer())
+            class Schema(colander.Schema):
+                number = colander.SchemaNode(colander.Integer())
 
-            mapping = Mapping(
-                title="Open by default",
-                widget=deform.widget.MappingWidget(
-                    template="mapping_accordion", open=True
-                ),
-            )
+                mapping = Mapping(
+                    title="Open by default",
+                    widget=deform.widget.MappingWidget(
+                        template="mapping_accordion", open=True
+                    ),
+                )
 
-            mapping2 = Mapping(
-                title="Closed by default",
-                widget=deform.widget.MappingWidget(
-                    template="mapping_accordion", open=False
-                ),
-            )
+                mapping2 = Mapping(
+                    title="Closed by default",
+                    widget=deform.widget.MappingWidget(
+                        template="mapping_accordion", open=False
+                    ),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="ajaxform")
     @demonstrate("AJAX form submission (inline success)")
     def ajaxform(self):
-        class Mapping(colander.Schema):
-            name = colander.SchemaNode(
-                colander.String(), description="Content name"
-            )
-            date = colander.SchemaNode(
-                colander.Date(),
-                widget=deform.widget.DatePartsWidget(),
-                description="Content date",
-            )
+        def make_form():
+            class Mapping(colander.Schema):
+                name = colander.SchemaNode(
+                    colander.String(), description="Content name"
+                )
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    widget=deform.widget.DatePartsWidget(),
+                    description="Content date",
+                )
 
-        class Schema(colander.Schema):
-            number = colander.SchemaNode(colander.Integer())
-            mapping = Mapping()
-            richtext = colander.SchemaNode(
-                colander.String(), widget=deform.widget.RichTextWidget()
-            )
+            class Schema(colander.Schema):
+                number = colander.SchemaNode(colander.Integer())
+                mapping = Mapping()
+                richtext = colander.SchemaNode(
+                    colander.String(), widget=deform.widget.RichTextWidget()
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",), use_ajax=True)
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",), use_ajax=True)
+            return form
+
+        form = self.cached_form(make_form)
 
         def succeed():
             return Response('<div id="thanks">Thanks!</div>')
@@ -954,31 +1111,42 @@ class DeformDemo(object):
     @view_config(renderer="templates/form.pt", name="ajaxform_redirect")
     @demonstrate("AJAX form submission (redirect on success)")
     def ajaxform_redirect(self):
-        class Mapping(colander.Schema):
-            name = colander.SchemaNode(
-                colander.String(), description="Content name"
-            )
-            date = colander.SchemaNode(
-                colander.Date(),
-                widget=deform.widget.DatePartsWidget(),
-                description="Content date",
-            )
+        def make_form():
+            class Mapping(colander.Schema):
+                name = colander.SchemaNode(
+                    colander.String(), description="Content name"
+                )
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    widget=deform.widget.DatePartsWidget(),
+                    description="Content date",
+                )
 
-        class Schema(colander.Schema):
-            number = colander.SchemaNode(colander.Integer())
-            mapping = Mapping()
+            class Schema(colander.Schema):
+                number = colander.SchemaNode(colander.Integer())
+                mapping = Mapping()
 
-        schema = Schema()
-        options = """
-        {success:
-          function (rText, sText, xhr, form) {
-            var loc = xhr.getResponseHeader('X-Relocate');
-            if (loc) {
-              document.location = loc;
-            };
-           }
-        }
-        """
+            schema = Schema()
+            options = """
+            {success:
+              function (rText, sText, xhr, form) {
+                var loc = xhr.getResponseHeader('X-Relocate');
+                if (loc) {
+                  document.location = loc;
+                };
+               }
+            }
+            """
+
+            form = deform.Form(
+                schema,
+                buttons=("submit",),
+                use_ajax=True,
+                ajax_options=options,
+            )
+            return form
+
+        form = self.cached_form(make_form)
 
         def succeed():
             location = self.request.resource_url(
@@ -996,35 +1164,35 @@ class DeformDemo(object):
                 ],
             )
 
-        form = deform.Form(
-            schema, buttons=("submit",), use_ajax=True, ajax_options=options
-        )
-
         return self.render_form(form, success=succeed)
 
     @view_config(renderer="templates/form.pt", name="sequence_of_radiochoices")
     @demonstrate("Sequence of Radio Choice Widgets")
     def sequence_of_radiochoices(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Peppers(colander.SequenceSchema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                validator=colander.OneOf([x[0] for x in choices]),
-                widget=deform.widget.RadioChoiceWidget(values=choices),
-                title="Pepper Chooser",
-                description="Select a Pepper",
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        class Schema(colander.Schema):
-            peppers = Peppers()
+            class Peppers(colander.SequenceSchema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.OneOf([x[0] for x in choices]),
+                    widget=deform.widget.RadioChoiceWidget(values=choices),
+                    title="Pepper Chooser",
+                    description="Select a Pepper",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                peppers = Peppers()
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1033,94 +1201,112 @@ class DeformDemo(object):
     )
     @demonstrate("Sequence of Autocomplete Widgets")
     def sequence_of_autocompletes(self):
-        choices = ["bar", "baz", "two", "three"]
+        def make_form():
+            choices = ["bar", "baz", "two", "three"]
 
-        widget = deform.widget.AutocompleteInputWidget(values=choices)
+            widget = deform.widget.AutocompleteInputWidget(values=choices)
 
-        class Sequence(colander.SequenceSchema):
-            text = colander.SchemaNode(
-                colander.String(),
-                validator=colander.Length(max=100),
-                widget=widget,
-                description='Enter some text (Hint: try "b" or "t")',
-            )
+            class Sequence(colander.SequenceSchema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    validator=colander.Length(max=100),
+                    widget=widget,
+                    description='Enter some text (Hint: try "b" or "t")',
+                )
 
-        class Schema(colander.Schema):
-            texts = Sequence()
+            class Schema(colander.Schema):
+                texts = Sequence()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="sequence_of_dateinputs")
     @demonstrate("Sequence of Date Inputs")
     def sequence_of_dateinputs(self):
-        import datetime
+        def make_form():
+            import datetime
 
-        class Sequence(colander.SequenceSchema):
-            date = colander.SchemaNode(
-                colander.Date(),
-                validator=colander.Range(
-                    min=datetime.date(2010, 5, 5),
-                    min_err=_("${val} is earlier than earliest date ${min}"),
-                ),
-            )
+            class Sequence(colander.SequenceSchema):
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    validator=colander.Range(
+                        min=datetime.date(2010, 5, 5),
+                        min_err=_(
+                            "${val} is earlier than earliest date ${min}"
+                        ),
+                    ),
+                )
 
-        class Schema(colander.Schema):
-            dates = Sequence()
+            class Schema(colander.Schema):
+                dates = Sequence()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="sequence_of_i18n")
     @demonstrate("Sequence of I18N")
     def sequence_of_i18n(self):
-        import datetime
+        def make_form(locale_name):
+            import datetime
 
-        locale_name = get_locale_name(self.request)
+            class Sequence(colander.SequenceSchema):
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    title=_("Event date"),
+                    validator=colander.Range(
+                        min=datetime.date(2010, 5, 5),
+                        min_err=_(
+                            "${val} is earlier than earliest date ${min}"
+                        ),
+                    ),
+                )
 
-        class Sequence(colander.SequenceSchema):
-            date = colander.SchemaNode(
-                colander.Date(),
-                title=_("Event date"),
-                validator=colander.Range(
-                    min=datetime.date(2010, 5, 5),
-                    min_err=_("${val} is earlier than earliest date ${min}"),
-                ),
-            )
+            class Schema(colander.Schema):
+                dates = Sequence(title=_("Dates"))
+                _LOCALE_ = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.HiddenWidget(),
+                    default=locale_name,
+                )
 
-        class Schema(colander.Schema):
-            dates = Sequence(title=_("Dates"))
-            _LOCALE_ = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.HiddenWidget(),
-                default=locale_name,
+            schema = Schema()
+            form = deform.Form(
+                schema, buttons=[deform.Button("submit", _("Submit"))]
             )
+            return form
 
-        schema = Schema()
-        form = deform.Form(
-            schema, buttons=[deform.Button("submit", _("Submit"))]
-        )
+        form = self.cached_form(make_form, get_locale_name(self.request))
 
         return self.render_form(form, is_i18n=True)
 
     @view_config(renderer="templates/form.pt", name="sequence_of_richtext")
     @demonstrate("Sequence of Rich Text Widgets")
     def sequence_of_richtext(self):
-        class Sequence(colander.SequenceSchema):
-            text = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.RichTextWidget(),
-                description="Enter some text",
-            )
+        def make_form():
+            class Sequence(colander.SequenceSchema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.RichTextWidget(),
+                    description="Enter some text",
+                )
 
-        class Schema(colander.Schema):
-            texts = Sequence()
+            class Schema(colander.Schema):
+                texts = Sequence()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1129,36 +1315,44 @@ class DeformDemo(object):
     )
     @demonstrate("Sequence of Masked Text Inputs")
     def sequence_of_masked_textinputs(self):
-        class Sequence(colander.SequenceSchema):
-            text = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextInputWidget(mask="999-99-9999"),
-            )
+        def make_form():
+            class Sequence(colander.SequenceSchema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextInputWidget(mask="999-99-9999"),
+                )
 
-        class Schema(colander.Schema):
-            texts = Sequence()
+            class Schema(colander.Schema):
+                texts = Sequence()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="sequence_of_fileuploads")
     @demonstrate("Sequence of File Upload Widgets")
     def sequence_of_fileuploads(self):
-        class Sequence(colander.SequenceSchema):
-            upload = colander.SchemaNode(
-                deform.FileData(),
-                widget=deform.widget.FileUploadWidget(tmpstore),
-            )
+        def make_form():
+            class Sequence(colander.SequenceSchema):
+                upload = colander.SchemaNode(
+                    deform.FileData(),
+                    widget=deform.widget.FileUploadWidget(self.tmpstore),
+                )
 
-        class Schema(colander.Schema):
-            uploads = Sequence()
+            class Schema(colander.Schema):
+                uploads = Sequence()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
-        return self.render_form(form, success=tmpstore.clear)
+        return self.render_form(form, success=self.tmpstore.clear)
 
     @view_config(
         renderer="templates/form.pt",
@@ -1166,38 +1360,46 @@ class DeformDemo(object):
     )
     @demonstrate("Sequence of File Upload Widgets (with Initial Item)")
     def sequence_of_fileuploads_with_initial_item(self):
-        class Sequence(colander.SequenceSchema):
-            upload = colander.SchemaNode(
-                deform.FileData(),
-                widget=deform.widget.FileUploadWidget(tmpstore),
-            )
+        def make_form():
+            class Sequence(colander.SequenceSchema):
+                upload = colander.SchemaNode(
+                    deform.FileData(),
+                    widget=deform.widget.FileUploadWidget(self.tmpstore),
+                )
 
-        class Schema(colander.Schema):
-            uploads = Sequence()
+            class Schema(colander.Schema):
+                uploads = Sequence()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
-        form["uploads"].widget = deform.widget.SequenceWidget(min_len=1)
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            form["uploads"].widget = deform.widget.SequenceWidget(min_len=1)
+            return form
+
+        form = self.cached_form(make_form)
 
-        return self.render_form(form, success=tmpstore.clear)
+        return self.render_form(form, success=self.tmpstore.clear)
 
     @view_config(renderer="templates/form.pt", name="sequence_of_mappings")
     @demonstrate("Sequence of Mapping Widgets")
     def sequence_of_mappings(self):
-        class Person(colander.Schema):
-            name = colander.SchemaNode(colander.String())
-            age = colander.SchemaNode(
-                colander.Integer(), validator=colander.Range(0, 200)
-            )
+        def make_form():
+            class Person(colander.Schema):
+                name = colander.SchemaNode(colander.String())
+                age = colander.SchemaNode(
+                    colander.Integer(), validator=colander.Range(0, 200)
+                )
 
-        class People(colander.SequenceSchema):
-            person = Person()
+            class People(colander.SequenceSchema):
+                person = Person()
 
-        class Schema(colander.Schema):
-            people = People()
+            class Schema(colander.Schema):
+                people = People()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1207,21 +1409,25 @@ class DeformDemo(object):
     )
     @demonstrate("Sequence of Mapping Widgets (with Initial Item)")
     def sequence_of_mappings_with_initial_item(self):
-        class Person(colander.Schema):
-            name = colander.SchemaNode(colander.String())
-            age = colander.SchemaNode(
-                colander.Integer(), validator=colander.Range(0, 200)
-            )
+        def make_form():
+            class Person(colander.Schema):
+                name = colander.SchemaNode(colander.String())
+                age = colander.SchemaNode(
+                    colander.Integer(), validator=colander.Range(0, 200)
+                )
 
-        class People(colander.SequenceSchema):
-            person = Person()
+            class People(colander.SequenceSchema):
+                person = Person()
 
-        class Schema(colander.Schema):
-            people = People()
+            class Schema(colander.Schema):
+                people = People()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
-        form["people"].widget = deform.widget.SequenceWidget(min_len=1)
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            form["people"].widget = deform.widget.SequenceWidget(min_len=1)
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1230,20 +1436,24 @@ class DeformDemo(object):
     )
     @demonstrate("Sequence of Mappings (read-only)")
     def readonly_sequence_of_mappings(self):
-        class Person(colander.Schema):
-            name = colander.SchemaNode(colander.String())
-            age = colander.SchemaNode(
-                colander.Integer(), validator=colander.Range(0, 200)
-            )
+        def make_form():
+            class Person(colander.Schema):
+                name = colander.SchemaNode(colander.String())
+                age = colander.SchemaNode(
+                    colander.Integer(), validator=colander.Range(0, 200)
+                )
 
-        class People(colander.SequenceSchema):
-            person = Person()
+            class People(colander.SequenceSchema):
+                person = Person()
 
-        class Schema(colander.Schema):
-            people = People()
+            class Schema(colander.Schema):
+                people = People()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(
             form,
@@ -1259,23 +1469,27 @@ class DeformDemo(object):
     @view_config(renderer="templates/form.pt", name="sequence_of_sequences")
     @demonstrate("Sequence of Sequence Widgets")
     def sequence_of_sequences(self):
-        class NameAndTitle(colander.Schema):
-            name = colander.SchemaNode(colander.String())
-            title = colander.SchemaNode(colander.String())
+        def make_form():
+            class NameAndTitle(colander.Schema):
+                name = colander.SchemaNode(colander.String())
+                title = colander.SchemaNode(colander.String())
 
-        class NamesAndTitles(colander.SequenceSchema):
-            name_and_title = NameAndTitle(title="Name and Title")
+            class NamesAndTitles(colander.SequenceSchema):
+                name_and_title = NameAndTitle(title="Name and Title")
 
-        class NamesAndTitlesSequences(colander.SequenceSchema):
-            names_and_titles = NamesAndTitles(title="Names and Titles")
+            class NamesAndTitlesSequences(colander.SequenceSchema):
+                names_and_titles = NamesAndTitles(title="Names and Titles")
 
-        class Schema(colander.Schema):
-            names_and_titles_sequence = NamesAndTitlesSequences(
-                title="Sequence of Sequences of Names and Titles"
-            )
+            class Schema(colander.Schema):
+                names_and_titles_sequence = NamesAndTitlesSequences(
+                    title="Sequence of Sequences of Names and Titles"
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
         outer = form["names_and_titles_sequence"]
         outer.widget = deform.widget.SequenceWidget(min_len=1)
         outer["names_and_titles"].widget = deform.widget.SequenceWidget(
@@ -1290,27 +1504,31 @@ class DeformDemo(object):
     @demonstrate("Sequence of Defaulted Selects")
     def sequence_of_defaulted_selects(self):
         # See https://github.com/Pylons/deform/pull/79
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Peppers(colander.SequenceSchema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                default="jalapeno",  # <--- raison d'etre
-                validator=colander.OneOf([x[0] for x in choices]),
-                widget=deform.widget.SelectWidget(values=choices),
-                title="Pepper Chooser",
-                description="Select a Pepper",
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        class Schema(colander.Schema):
-            peppers = Peppers()
+            class Peppers(colander.SequenceSchema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    default="jalapeno",  # <--- raison d'etre
+                    validator=colander.OneOf([x[0] for x in choices]),
+                    widget=deform.widget.SelectWidget(values=choices),
+                    title="Pepper Chooser",
+                    description="Select a Pepper",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                peppers = Peppers()
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1321,30 +1539,34 @@ class DeformDemo(object):
     @demonstrate("Sequence of Defaulted Selects (with Initial Item)")
     def sequence_of_defaulted_selects_with_initial_item(self):
         # See https://github.com/Pylons/deformdemo/pull/15
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Peppers(colander.SequenceSchema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                default="jalapeno",
-                validator=colander.OneOf([x[0] for x in choices]),
-                widget=deform.widget.SelectWidget(values=choices),
-                title="Pepper Chooser",
-                description="Select a Pepper",
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        class Schema(colander.Schema):
-            peppers = Peppers()
+            class Peppers(colander.SequenceSchema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    default="jalapeno",
+                    validator=colander.OneOf([x[0] for x in choices]),
+                    widget=deform.widget.SelectWidget(values=choices),
+                    title="Pepper Chooser",
+                    description="Select a Pepper",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
-        # raison d'etre below (1-length sequence widget means initial item
-        # rendered)
-        form["peppers"].widget = deform.widget.SequenceWidget(min_len=1)
+            class Schema(colander.Schema):
+                peppers = Peppers()
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            # raison d'etre below (1-length sequence widget means initial item
+            # rendered)
+            form["peppers"].widget = deform.widget.SequenceWidget(min_len=1)
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1353,92 +1575,116 @@ class DeformDemo(object):
     )
     @demonstrate("Sequence of Constrained Min and Max Lengths")
     def sequence_of_constrained_len(self):
-        class Names(colander.SequenceSchema):
-            name = colander.SchemaNode(colander.String())
+        def make_form():
+            class Names(colander.SequenceSchema):
+                name = colander.SchemaNode(colander.String())
+
+            class Schema(colander.Schema):
+                names = Names(
+                    validator=colander.Length(2, 4),
+                    title="At Least 2 At Most 4 Names",
+                    widget=deform.widget.SequenceWidget(min_len=2, max_len=4),
+                )
 
-        class Schema(colander.Schema):
-            names = Names(
-                validator=colander.Length(2, 4),
-                title="At Least 2 At Most 4 Names",
-                widget=deform.widget.SequenceWidget(min_len=2, max_len=4),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="sequence_orderable")
     @demonstrate("Sequence (of Mappings) with Ordering Enabled")
     def sequence_orderable(self):
-        class Person(colander.Schema):
-            name = colander.SchemaNode(colander.String())
-            age = colander.SchemaNode(
-                colander.Integer(), validator=colander.Range(0, 200)
-            )
+        def make_form():
+            class Person(colander.Schema):
+                name = colander.SchemaNode(colander.String())
+                age = colander.SchemaNode(
+                    colander.Integer(), validator=colander.Range(0, 200)
+                )
 
-        class People(colander.SequenceSchema):
-            person = Person()
+            class People(colander.SequenceSchema):
+                person = Person()
 
-        class Schema(colander.Schema):
-            people = People(
-                widget=deform.widget.SequenceWidget(orderable=True)
-            )
+            class Schema(colander.Schema):
+                people = People(
+                    widget=deform.widget.SequenceWidget(orderable=True)
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="file")
     @demonstrate("File Upload Widget")
     def file(self):
-        class Schema(colander.Schema):
-            upload = colander.SchemaNode(
-                deform.FileData(),
-                widget=deform.widget.FileUploadWidget(tmpstore),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                upload = colander.SchemaNode(
+                    deform.FileData(),
+                    widget=deform.widget.FileUploadWidget(self.tmpstore),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        return self.render_form(form, success=tmpstore.clear)
+        form = self.cached_form(make_form)
+
+        return self.render_form(form, success=self.tmpstore.clear)
 
     @view_config(renderer="templates/form.pt", name="file_readonly")
     @demonstrate("File Upload Widget (read-only)")
     def file_readonly(self):
-        class Schema(colander.Schema):
-            upload = colander.SchemaNode(
-                deform.FileData(),
-                widget=deform.widget.FileUploadWidget(tmpstore, readonly=True),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                upload = colander.SchemaNode(
+                    deform.FileData(),
+                    widget=deform.widget.FileUploadWidget(
+                        self.tmpstore, readonly=True
+                    ),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         appstruct = {"upload": {"uid": "123", "filename": "leavesofgrass.png"}}
 
         return self.render_form(
-            form, appstruct=appstruct, success=tmpstore.clear
+            form, appstruct=appstruct, success=self.tmpstore.clear
         )
 
     @view_config(renderer="templates/form.pt", name="dateparts")
     @demonstrate("Date Parts Widget")
     def dateparts(self):
-        import datetime
+        def make_form():
+            import datetime
 
-        class Schema(colander.Schema):
-            date = colander.SchemaNode(
-                colander.Date(),
-                widget=deform.widget.DatePartsWidget(),
-                validator=colander.Range(
-                    min=datetime.date(2010, 1, 1),
-                    min_err=_("${val} is earlier than earliest date ${min}"),
-                ),
-            )
+            class Schema(colander.Schema):
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    widget=deform.widget.DatePartsWidget(),
+                    validator=colander.Range(
+                        min=datetime.date(2010, 1, 1),
+                        min_err=_(
+                            "${val} is earlier than earliest date ${min}"
+                        ),
+                    ),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1447,14 +1693,18 @@ class DeformDemo(object):
     def dateparts_readonly(self):
         import datetime
 
-        class Schema(colander.Schema):
-            date = colander.SchemaNode(
-                colander.Date(),
-                widget=deform.widget.DatePartsWidget(readonly=True),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    widget=deform.widget.DatePartsWidget(readonly=True),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(
             form, appstruct={"date": datetime.date(2010, 5, 5)}
@@ -1465,38 +1715,50 @@ class DeformDemo(object):
     def dateinput(self):
         import datetime
 
-        class Schema(colander.Schema):
-            somedate = colander.SchemaNode(
-                colander.Date(),
-                validator=colander.Range(
-                    min=datetime.date(datetime.date.today().year, 1, 1),
-                    min_err=_("${val} is earlier than earliest date ${min}"),
-                ),
-                title="Date",
-            )
-
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        def make_form(year):
+            class Schema(colander.Schema):
+                somedate = colander.SchemaNode(
+                    colander.Date(),
+                    validator=colander.Range(
+                        min=datetime.date(year, 1, 1),
+                        min_err=_(
+                            "${val} is earlier than earliest date ${min}"
+                        ),
+                    ),
+                    title="Date",
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form, datetime.date.today().year)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="timeinput")
     @demonstrate("Time Input")
     def timeinput(self):
-        import datetime
+        def make_form():
+            import datetime
+
+            class Schema(colander.Schema):
+                sometime = colander.SchemaNode(
+                    colander.Time(),
+                    validator=colander.Range(
+                        min=datetime.time(12, 16),
+                        min_err=_(
+                            "${val} is earlier than earliest time ${min}"
+                        ),
+                    ),
+                    title="Time",
+                )
 
-        class Schema(colander.Schema):
-            sometime = colander.SchemaNode(
-                colander.Time(),
-                validator=colander.Range(
-                    min=datetime.time(12, 16),
-                    min_err=_("${val} is earlier than earliest time ${min}"),
-                ),
-                title="Time",
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1505,26 +1767,25 @@ class DeformDemo(object):
     def datetimeinput(self):
         import datetime
 
-        class Schema(colander.Schema):
-            date_time = colander.SchemaNode(
-                colander.DateTime(),
-                validator=colander.Range(
-                    min=datetime.datetime(
-                        datetime.date.today().year,
-                        1,
-                        1,
-                        12,
-                        30,
-                        tzinfo=iso8601.UTC,
+        def make_form(year):
+            class Schema(colander.Schema):
+                date_time = colander.SchemaNode(
+                    colander.DateTime(),
+                    validator=colander.Range(
+                        min=datetime.datetime(
+                            year, 1, 1, 12, 30, tzinfo=iso8601.UTC
+                        ),
+                        min_err=_(
+                            "${val} is earlier than earliest datetime ${min}"
+                        ),
                     ),
-                    min_err=_(
-                        "${val} is earlier than earliest datetime ${min}"
-                    ),
-                ),
-            )
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form, datetime.date.today().year)
 
         return self.render_form(form)
 
@@ -1535,14 +1796,18 @@ class DeformDemo(object):
 
         then = datetime.datetime(2011, 5, 5, 1, 2)
 
-        class Schema(colander.Schema):
-            date_time = colander.SchemaNode(
-                colander.DateTime(),
-                widget=deform.widget.DateTimeInputWidget(readonly=True),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                date_time = colander.SchemaNode(
+                    colander.DateTime(),
+                    widget=deform.widget.DateTimeInputWidget(readonly=True),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct={"date_time": then})
 
@@ -1551,22 +1816,26 @@ class DeformDemo(object):
     def edit(self):
         import datetime
 
-        class Mapping(colander.Schema):
-            name = colander.SchemaNode(
-                colander.String(), description="Content name"
-            )
-            date = colander.SchemaNode(
-                colander.Date(),
-                widget=deform.widget.DatePartsWidget(),
-                description="Content date",
-            )
+        def make_form():
+            class Mapping(colander.Schema):
+                name = colander.SchemaNode(
+                    colander.String(), description="Content name"
+                )
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    widget=deform.widget.DatePartsWidget(),
+                    description="Content date",
+                )
 
-        class Schema(colander.Schema):
-            number = colander.SchemaNode(colander.Integer())
-            mapping = Mapping()
+            class Schema(colander.Schema):
+                number = colander.SchemaNode(colander.Integer())
+                mapping = Mapping()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
         # We don't need to supply all the values required by the schema
         # for an initial rendering, only the ones the app actually has
         # values for.  Notice below that we don't pass the ``name``
@@ -1581,60 +1850,74 @@ class DeformDemo(object):
     @view_config(renderer="templates/form.pt", name="interfield")
     @demonstrate("Inter-Field Validation")
     def interfield(self):
-        class Schema(colander.Schema):
-            name = colander.SchemaNode(
-                colander.String(), description="Content name"
-            )
-            title = colander.SchemaNode(
-                colander.String(),
-                description="Content title (must start with content name)",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                name = colander.SchemaNode(
+                    colander.String(), description="Content name"
+                )
+                title = colander.SchemaNode(
+                    colander.String(),
+                    description="Content title (must start with content name)",
+                )
 
-        def validator(form, value):
-            if not value["title"].startswith(value["name"]):
-                exc = colander.Invalid(form, "Title must start with name")
-                exc["title"] = "Must start with name %s" % value["name"]
-                raise exc
+            def validator(form, value):
+                if not value["title"].startswith(value["name"]):
+                    exc = colander.Invalid(form, "Title must start with name")
+                    exc["title"] = "Must start with name %s" % value["name"]
+                    raise exc
 
-        schema = Schema(validator=validator)
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema(validator=validator)
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="fielddefaults")
     @demonstrate("Field Defaults")
     def fielddefaults(self):
-        class Schema(colander.Schema):
-            artist = colander.SchemaNode(
-                colander.String(), default="Grandaddy", description="Song name"
-            )
-            album = colander.SchemaNode(
-                colander.String(), default="Just Like the Fambly Cat"
-            )
-            song = colander.SchemaNode(
-                colander.String(), description="Song name"
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                artist = colander.SchemaNode(
+                    colander.String(),
+                    default="Grandaddy",
+                    description="Song name",
+                )
+                album = colander.SchemaNode(
+                    colander.String(), default="Just Like the Fambly Cat"
+                )
+                song = colander.SchemaNode(
+                    colander.String(), description="Song name"
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="nonrequiredfields")
     @demonstrate("Non-Required Fields")
     def nonrequiredfields(self):
-        class Schema(colander.Schema):
-            required = colander.SchemaNode(
-                colander.String(), description="Required Field"
-            )
-            notrequired = colander.SchemaNode(
-                colander.String(),
-                missing=unicode(""),
-                description="Unrequired Field",
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                required = colander.SchemaNode(
+                    colander.String(), description="Required Field"
+                )
+                notrequired = colander.SchemaNode(
+                    colander.String(),
+                    missing=unicode(""),
+                    description="Unrequired Field",
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1643,143 +1926,171 @@ class DeformDemo(object):
     )
     @demonstrate("Non-Required Number Fields")
     def nonrequired_number_fields(self):
-        class Schema(colander.Schema):
-            required = colander.SchemaNode(
-                colander.Int(), description="Required Field"
-            )
-            notrequired = colander.SchemaNode(
-                colander.Float(), missing=0, description="Unrequired Field"
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                required = colander.SchemaNode(
+                    colander.Int(), description="Required Field"
+                )
+                notrequired = colander.SchemaNode(
+                    colander.Float(), missing=0, description="Unrequired Field"
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="unicodeeverywhere")
     @demonstrate("Unicode Everywhere")
     def unicodeeverywhere(self):
-        class Schema(colander.Schema):
-            field = colander.SchemaNode(
-                colander.String(),
-                title=unicode("По оживлённым берегам", "utf-8"),
-                description=unicode(
-                    "子曰：「學而時習之，不亦說乎？有朋自遠方來，不亦樂乎？ "
-                    "人不知而不慍，不亦君子乎？」",
-                    "utf-8",
-                ),
-                default=unicode("☃", "utf-8"),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                field = colander.SchemaNode(
+                    colander.String(),
+                    title=unicode("По оживлённым берегам", "utf-8"),
+                    description=unicode(
+                        "子曰：「學而時習之，不亦說乎？有朋自遠方來，不亦樂乎？ "
+                        "人不知而不慍，不亦君子乎？」",
+                        "utf-8",
+                    ),
+                    default=unicode("☃", "utf-8"),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select")
     @demonstrate("Select Widget")
     def select(self):
-        choices = (
-            ("", "- Select -"),
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(values=choices),
+        def make_form():
+            choices = (
+                ("", "- Select -"),
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(values=choices),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select_with_size")
     @demonstrate("Select Widget (with size)")
     def select_with_size(self):
-        choices = (
-            ("", "- Select -"),
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(values=choices, size=2),
+        def make_form():
+            choices = (
+                ("", "- Select -"),
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(values=choices, size=2),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select_with_unicode")
     @demonstrate("Select Widget (with unicode)")
     def select_with_unicode(self):
-        choices = (
-            ("", "- Select -"),
-            (unicode("ハバネロ", "utf-8"), "Habanero"),
-            (unicode("ハラペーニョ", "utf-8"), "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(values=choices),
+        def make_form():
+            choices = (
+                ("", "- Select -"),
+                (unicode("ハバネロ", "utf-8"), "Habanero"),
+                (unicode("ハラペーニョ", "utf-8"), "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(values=choices),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select_with_default")
     @demonstrate("Select Widget (with default)")
     def select_with_default(self):
-        choices = (
-            ("", "- Select -"),
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                default="jalapeno",
-                widget=deform.widget.SelectWidget(values=choices),
+        def make_form():
+            choices = (
+                ("", "- Select -"),
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    default="jalapeno",
+                    widget=deform.widget.SelectWidget(values=choices),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select_with_multiple")
     @demonstrate("Select Widget (with multiple)")
     def select_with_multiple(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
+            )
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.SelectWidget(
+                        values=choices, multiple=True
+                    ),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.SelectWidget(
-                    values=choices, multiple=True
-                ),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1789,96 +2100,112 @@ class DeformDemo(object):
     )
     @demonstrate("Select Widget (with multiple default integers)")
     def select_with_multiple_default_integers(self):
-        choices = ((1, "Habanero"), (2, "Jalapeno"), (3, "Chipotle"))
+        def make_form():
+            choices = ((1, "Habanero"), (2, "Jalapeno"), (3, "Chipotle"))
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    default=[1, 2],
+                    widget=deform.widget.SelectWidget(
+                        values=choices, multiple=True
+                    ),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                default=[1, 2],
-                widget=deform.widget.SelectWidget(
-                    values=choices, multiple=True
-                ),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select_with_deferred")
     @demonstrate("Select Widget (with deferred choices and default)")
     def select_with_deferred(self):
-        @colander.deferred
-        def deferred_choices_widget(node, kw):
-            choices = kw.get("choices")
-            return deform.widget.SelectWidget(values=choices)
-
-        @colander.deferred
-        def deferred_default(node, kw):
-            return kw["default"]
+        def make_form():
+            @colander.deferred
+            def deferred_choices_widget(node, kw):
+                choices = kw.get("choices")
+                return deform.widget.SelectWidget(values=choices)
+
+            @colander.deferred
+            def deferred_default(node, kw):
+                return kw["default"]
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    default=deferred_default,
+                    widget=deferred_choices_widget,
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                default=deferred_default,
-                widget=deferred_choices_widget,
+            choices = (
+                ("", "- Select -"),
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        choices = (
-            ("", "- Select -"),
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
+            schema = Schema().bind(choices=choices, default="jalapeno")
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema().bind(choices=choices, default="jalapeno")
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select_integer")
     @demonstrate("Select Widget (with Integer values)")
     def select_integer(self):
-        choices = (("", "- Select -"), (0, "Zero"), (1, "One"), (2, "Two"))
+        def make_form():
+            choices = (("", "- Select -"), (0, "Zero"), (1, "One"), (2, "Two"))
 
-        class Schema(colander.Schema):
-            number = colander.SchemaNode(
-                colander.Integer(),
-                widget=deform.widget.SelectWidget(values=choices),
-            )
+            class Schema(colander.Schema):
+                number = colander.SchemaNode(
+                    colander.Integer(),
+                    widget=deform.widget.SelectWidget(values=choices),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select_with_optgroup")
     @demonstrate("Select Widget (with optgroup)")
     def select_with_optgroup(self):
-        from deform.widget import OptGroup
-
-        choices = (
-            ("", "Select your favorite musician"),
-            OptGroup(
-                "Guitarists",
-                ("page", "Jimmy Page"),
-                ("hendrix", "Jimi Hendrix"),
-            ),
-            OptGroup(
-                "Drummers",
-                ("cobham", "Billy Cobham"),
-                ("bonham", "John Bonham"),
-            ),
-        )
-
-        class Schema(colander.Schema):
-            musician = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(values=choices),
+        def make_form():
+            from deform.widget import OptGroup
+
+            choices = (
+                ("", "Select your favorite musician"),
+                OptGroup(
+                    "Guitarists",
+                    ("page", "Jimmy Page"),
+                    ("hendrix", "Jimi Hendrix"),
+                ),
+                OptGroup(
+                    "Drummers",
+                    ("cobham", "Billy Cobham"),
+                    ("bonham", "John Bonham"),
+                ),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                musician = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(values=choices),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -1891,74 +2218,82 @@ class DeformDemo(object):
         # One may or may not notice any difference with
         # 'select_with_optgroup' above, depending on the browser being
         # used. See widget's documentation for further details.
-        from deform.widget import OptGroup
-
-        choices = (
-            ("", "Select your favorite musician"),
-            OptGroup(
-                "Guitarists",
-                ("page", "Jimmy Page"),
-                ("hendrix", "Jimi Hendrix"),
-            ),
-            OptGroup(
-                "Drummers",
-                ("cobham", "Billy Cobham"),
-                ("bonham", "John Bonham"),
-            ),
-        )
-
-        long_label_gener = lambda group, label: " - ".join(  # noQA
-            (group, label)
-        )
-
-        class Schema(colander.Schema):
-            musician = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(
-                    values=choices, long_label_generator=long_label_gener
+        def make_form():
+            from deform.widget import OptGroup
+
+            choices = (
+                ("", "Select your favorite musician"),
+                OptGroup(
+                    "Guitarists",
+                    ("page", "Jimmy Page"),
+                    ("hendrix", "Jimi Hendrix"),
+                ),
+                OptGroup(
+                    "Drummers",
+                    ("cobham", "Billy Cobham"),
+                    ("bonham", "John Bonham"),
                 ),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            long_label_gener = lambda group, label: " - ".join(  # noQA
+                (group, label)
+            )
+
+            class Schema(colander.Schema):
+                musician = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(
+                        values=choices, long_label_generator=long_label_gener
+                    ),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select_readonly")
     @demonstrate("Select Widget (read-only)")
     def select_readonly(self):
-        from deform.widget import OptGroup
-
-        choices = (
-            ("", "Select your favorite musician"),
-            OptGroup(
-                "Guitarists",
-                ("page", "Jimmy Page"),
-                ("hendrix", "Jimi Hendrix"),
-            ),
-            OptGroup(
-                "Drummers",
-                ("cobham", "Billy Cobham"),
-                ("bonham", "John Bonham"),
-            ),
-        )
-
-        class Schema(colander.Schema):
-            musician = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(
-                    values=choices, readonly=True
+        def make_form():
+            from deform.widget import OptGroup
+
+            choices = (
+                ("", "Select your favorite musician"),
+                OptGroup(
+                    "Guitarists",
+                    ("page", "Jimmy Page"),
+                    ("hendrix", "Jimi Hendrix"),
                 ),
-            )
-            multiple_musicians = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.SelectWidget(
-                    values=choices, multiple=True, readonly=True
+                OptGroup(
+                    "Drummers",
+                    ("cobham", "Billy Cobham"),
+                    ("bonham", "John Bonham"),
                 ),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                musician = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(
+                        values=choices, readonly=True
+                    ),
+                )
+                multiple_musicians = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.SelectWidget(
+                        values=choices, multiple=True, readonly=True
+                    ),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         appstruct = {
             "musician": "cobham",
@@ -1970,89 +2305,107 @@ class DeformDemo(object):
     @view_config(renderer="templates/form.pt", name="select2")
     @demonstrate("Select2 Widget")
     def select2(self):
-        choices = (
-            ("", "- Select -"),
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.Select2Widget(values=choices),
+        def make_form():
+            choices = (
+                ("", "- Select -"),
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.Select2Widget(values=choices),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select2_with_multiple")
     @demonstrate("Select2 Widget (with multiple)")
     def select2_with_multiple(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
+            )
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.Select2Widget(
+                        values=choices, multiple=True
+                    ),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.Select2Widget(
-                    values=choices, multiple=True
-                ),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select2_with_optgroup")
     @demonstrate("Select2 Widget (with optgroup)")
     def select2_with_optgroup(self):
-        from deform.widget import OptGroup
-
-        choices = (
-            ("", "Select your favorite musician"),
-            OptGroup(
-                "Guitarists",
-                ("page", "Jimmy Page"),
-                ("hendrix", "Jimi Hendrix"),
-            ),
-            OptGroup(
-                "Drummers",
-                ("cobham", "Billy Cobham"),
-                ("bonham", "John Bonham"),
-            ),
-        )
-
-        class Schema(colander.Schema):
-            musician = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.Select2Widget(values=choices),
+        def make_form():
+            from deform.widget import OptGroup
+
+            choices = (
+                ("", "Select your favorite musician"),
+                OptGroup(
+                    "Guitarists",
+                    ("page", "Jimmy Page"),
+                    ("hendrix", "Jimi Hendrix"),
+                ),
+                OptGroup(
+                    "Drummers",
+                    ("cobham", "Billy Cobham"),
+                    ("bonham", "John Bonham"),
+                ),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                musician = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.Select2Widget(values=choices),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="select2_with_tags")
     @demonstrate("Select2 Widget (with tags)")
     def select2_with_tags(self):
-        choices = ()
+        def make_form():
+            choices = ()
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.Select2Widget(values=choices, tags=True),
-            )
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.Select2Widget(
+                        values=choices, tags=True
+                    ),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -2061,129 +2414,209 @@ class DeformDemo(object):
     )
     @demonstrate("Select2 Widget (with tags and multiple)")
     def select2_with_tags_and_multiple(self):
-        choices = ()
+        def make_form():
+            choices = ()
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.Select2Widget(
+                        values=choices, multiple=True, tags=True
+                    ),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.Select2Widget(
-                    values=choices, multiple=True, tags=True
-                ),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
+    @view_config(renderer="templates/form.pt", name="select2_remote")
+    @demonstrate("Select2 Widget (with Remote Data Source)")
+    def select2_remote(self):
+        def make_form(values_url, options):
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=RemoteSelect2Widget(
+                        values_url=values_url,
+                        options=options,
+                        placeholder="Search peppers...",
+                    ),
+                    validator=KnownOptions(options),
+                    description='Type a pepper (Hint: try "jal")',
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        values_url = self.request.route_path(
+            "deformdemo", traverse=("remote_option_values",)
+        )
+        form = self.cached_form(
+            make_form, values_url, get_options(self.request.registry)
+        )
+
+        return self.render_form(form)
+
+    @view_config(
+        renderer="templates/form.pt", name="select2_remote_with_multiple"
+    )
+    @demonstrate("Select2 Widget (with multiple and Remote Data Source)")
+    def select2_remote_with_multiple(self):
+        def make_form(values_url, options):
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=RemoteSelect2Widget(
+                        values_url=values_url, options=options, multiple=True
+                    ),
+                    validator=KnownOptions(options),
+                    description='Type peppers (Hint: try "ha")',
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        options = get_options(self.request.registry)
+        values_url = self.request.route_path(
+            "deformdemo", traverse=("remote_option_values",)
+        )
+        form = self.cached_form(make_form, values_url, options)
+
+        # only these two options are rendered with the page
+        appstruct = {"pepper": set(options.values[:2])}
+
+        return self.render_form(form, appstruct=appstruct)
+
     @view_config(renderer="templates/form.pt", name="selectize")
     @demonstrate("Selectize Widget")
     def selectize(self):
-        choices = (
-            ("", "- Select -"),
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
-
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectizeWidget(values=choices),
+        def make_form():
+            choices = (
+                ("", "- Select -"),
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectizeWidget(values=choices),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="selectize_with_multiple")
     @demonstrate("Selectize Widget (with multiple)")
     def selectize_with_multiple(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
+            )
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.SelectizeWidget(
+                        values=choices,
+                        multiple=True,
+                        attributes={
+                            "placeholder": "Select...",
+                        },
+                    ),
+                    validator=colander.Length(
+                        min=1, min_err="You must select at least one pepper."
+                    ),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.SelectizeWidget(
-                    values=choices,
-                    multiple=True,
-                    attributes={
-                        "placeholder": "Select...",
-                    },
-                ),
-                validator=colander.Length(
-                    min=1, min_err="You must select at least one pepper."
-                ),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="selectize_with_optgroup")
     @demonstrate("Selectize Widget (with optgroup)")
     def selectize_with_optgroup(self):
-        from deform.widget import OptGroup
-
-        choices = (
-            ("", "Select your favorite musician"),
-            OptGroup(
-                "Guitarists",
-                ("page", "Jimmy Page"),
-                ("hendrix", "Jimi Hendrix"),
-            ),
-            OptGroup(
-                "Drummers",
-                ("cobham", "Billy Cobham"),
-                ("bonham", "John Bonham"),
-            ),
-        )
-
-        class Schema(colander.Schema):
-            musician = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectizeWidget(
-                    values=choices,
-                    attributes={
-                        "placeholder": "Select...",
-                    },
+        def make_form():
+            from deform.widget import OptGroup
+
+            choices = (
+                ("", "Select your favorite musician"),
+                OptGroup(
+                    "Guitarists",
+                    ("page", "Jimmy Page"),
+                    ("hendrix", "Jimi Hendrix"),
+                ),
+                OptGroup(
+                    "Drummers",
+                    ("cobham", "Billy Cobham"),
+                    ("bonham", "John Bonham"),
                 ),
             )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            class Schema(colander.Schema):
+                musician = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectizeWidget(
+                        values=choices,
+                        attributes={
+                            "placeholder": "Select...",
+                        },
+                    ),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="selectize_with_tags")
     @demonstrate("Selectize Widget (with tags)")
     def selectize_with_tags(self):
-        choices = ()
+        def make_form():
+            choices = ()
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectizeWidget(
-                    values=choices,
-                    tags=True,
-                    selectize_options={
-                        "createOnBlur": True,
-                        "create": True,
-                    },
-                    attributes={
-                        "placeholder": "Add a tag...",
-                    },
-                ),
-            )
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectizeWidget(
+                        values=choices,
+                        tags=True,
+                        selectize_options={
+                            "createOnBlur": True,
+                            "create": True,
+                        },
+                        attributes={
+                            "placeholder": "Add a tag...",
+                        },
+                    ),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -2192,121 +2625,212 @@ class DeformDemo(object):
     )
     @demonstrate("Selectize Widget (with tags and multiple)")
     def selectize_with_tags_and_multiple(self):
-        choices = ()
+        def make_form():
+            choices = ()
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.SelectizeWidget(
+                        values=choices,
+                        tags=True,
+                        multiple=True,
+                        selectize_options={
+                            "createOnBlur": True,
+                            "create": True,
+                        },
+                        attributes={
+                            "placeholder": "Add a tag...",
+                        },
+                    ),
+                    validator=colander.Length(
+                        min=1, min_err="You must enter at least one tag."
+                    ),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.SelectizeWidget(
-                    values=choices,
-                    tags=True,
-                    multiple=True,
-                    selectize_options={
-                        "createOnBlur": True,
-                        "create": True,
-                    },
-                    attributes={
-                        "placeholder": "Add a tag...",
-                    },
-                ),
-                validator=colander.Length(
-                    min=1, min_err="You must enter at least one tag."
-                ),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
+
+        return self.render_form(form)
+
+    @view_config(renderer="templates/form.pt", name="selectize_remote")
+    @demonstrate("Selectize Widget (with Remote Data Source)")
+    def selectize_remote(self):
+        def make_form(values_url, options):
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.String(),
+                    widget=RemoteSelectizeWidget(
+                        values_url=values_url,
+                        options=options,
+                        attributes={
+                            "placeholder": "Search peppers...",
+                        },
+                    ),
+                    validator=KnownOptions(options),
+                    description='Type a pepper (Hint: try "jal")',
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        values_url = self.request.route_path(
+            "deformdemo", traverse=("remote_option_values",)
+        )
+        form = self.cached_form(
+            make_form, values_url, get_options(self.request.registry)
+        )
+
+        return self.render_form(form)
+
+    @view_config(
+        renderer="templates/form.pt", name="selectize_remote_with_tags"
+    )
+    @demonstrate("Selectize Widget (with tags and Remote Data Source)")
+    def selectize_remote_with_tags(self):
+        def make_form(values_url, options):
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=RemoteSelectizeWidget(
+                        values_url=values_url,
+                        options=options,
+                        tags=True,
+                        multiple=True,
+                        selectize_options={
+                            "createOnBlur": True,
+                            "create": True,
+                        },
+                        attributes={
+                            "placeholder": "Add a pepper or a tag...",
+                        },
+                    ),
+                    validator=colander.Length(
+                        min=1, min_err="You must enter at least one tag."
+                    ),
+                )
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        values_url = self.request.route_path(
+            "deformdemo", traverse=("remote_option_values",)
+        )
+        form = self.cached_form(
+            make_form, values_url, get_options(self.request.registry)
+        )
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkboxchoice")
     @demonstrate("Checkbox Choice Widget")
     def checkboxchoice(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
+            )
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.CheckboxChoiceWidget(values=choices),
+                    validator=colander.Length(min=1),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.CheckboxChoiceWidget(values=choices),
-                validator=colander.Length(min=1),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkboxchoice_inline")
     @demonstrate("Checkbox Choice Widget (inline)")
     def checkboxchoice_inline(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
+            )
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.CheckboxChoiceWidget(
+                        values=choices, inline=True
+                    ),
+                    validator=colander.Length(min=1),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.CheckboxChoiceWidget(
-                    values=choices, inline=True
-                ),
-                validator=colander.Length(min=1),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkboxchoice2")
     @demonstrate("Checkbox Choice Widget (with required field)")
     def checkboxchoice2(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
+            )
 
-        @colander.deferred
-        def deferred_checkbox_widget(node, kw):
-            return deform.widget.CheckboxChoiceWidget(values=choices)
+            @colander.deferred
+            def deferred_checkbox_widget(node, kw):
+                return deform.widget.CheckboxChoiceWidget(values=choices)
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(), widget=deferred_checkbox_widget
-            )
-            required = colander.SchemaNode(colander.String())
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(), widget=deferred_checkbox_widget
+                )
+                required = colander.SchemaNode(colander.String())
 
-        schema = Schema()
-        schema = schema.bind()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            schema = schema.bind()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="checkboxchoice_readonly")
     @demonstrate("Checkbox Choice Widget (read-only)")
     def checkboxchoice_readonly(self):
-        choices = (
-            ("habanero", "Habanero"),
-            ("jalapeno", "Jalapeno"),
-            ("chipotle", "Chipotle"),
-        )
+        def make_form():
+            choices = (
+                ("habanero", "Habanero"),
+                ("jalapeno", "Jalapeno"),
+                ("chipotle", "Chipotle"),
+            )
+
+            class Schema(colander.Schema):
+                pepper = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.CheckboxChoiceWidget(
+                        values=choices, readonly=True
+                    ),
+                )
 
-        class Schema(colander.Schema):
-            pepper = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.CheckboxChoiceWidget(
-                    values=choices, readonly=True
-                ),
-            )
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form)
 
         return self.render_form(
             form, appstruct={"pepper": ["chipotle", "jalapeno"]}
@@ -2315,97 +2839,150 @@ class DeformDemo(object):
     @view_config(renderer="templates/form.pt", name="i18n")
     @demonstrate("Internationalization")
     def i18n(self):
-        minmax = {"min": 1, "max": 10}
-        locale_name = get_locale_name(self.request)
+        def make_form(locale_name):
+            minmax = {"min": 1, "max": 10}
+
+            class Schema(colander.Schema):
+                number = colander.SchemaNode(
+                    colander.Integer(),
+                    title=_(
+                        "A number between ${min} and ${max}", mapping=minmax
+                    ),
+                    description=_(
+                        "A number between ${min} and ${max}", mapping=minmax
+                    ),
+                    validator=colander.Range(1, 10),
+                )
+                _LOCALE_ = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.HiddenWidget(),
+                    default=locale_name,
+                )
 
-        class Schema(colander.Schema):
-            number = colander.SchemaNode(
-                colander.Integer(),
-                title=_("A number between ${min} and ${max}", mapping=minmax),
-                description=_(
-                    "A number between ${min} and ${max}", mapping=minmax
-                ),
-                validator=colander.Range(1, 10),
-            )
-            _LOCALE_ = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.HiddenWidget(),
-                default=locale_name,
+            schema = Schema()
+            form = deform.Form(
+                schema, buttons=[deform.Button("submit", _("Submit"))]
             )
+            return form
 
-        schema = Schema()
-        form = deform.Form(
-            schema, buttons=[deform.Button("submit", _("Submit"))]
-        )
+        form = self.cached_form(make_form, get_locale_name(self.request))
 
         return self.render_form(form, is_i18n=True)
 
     @view_config(renderer="templates/form.pt", name="hidden_field")
     @demonstrate("Hidden Widget")
     def hidden_field(self):
-        class Schema(colander.Schema):
-            sneaky = colander.SchemaNode(
-                colander.Boolean(),
-                widget=deform.widget.HiddenWidget(),
-                default=True,
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                sneaky = colander.SchemaNode(
+                    colander.Boolean(),
+                    widget=deform.widget.HiddenWidget(),
+                    default=True,
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="hiddenmissing")
     @demonstrate("Hidden Widget (missing, representing an Integer)")
     def hiddenmissing(self):
-        class Schema(colander.Schema):
-            title = colander.SchemaNode(colander.String())
-            number = colander.SchemaNode(
-                colander.Integer(),
-                widget=deform.widget.HiddenWidget(),
-                missing=colander.null,
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                title = colander.SchemaNode(colander.String())
+                number = colander.SchemaNode(
+                    colander.Integer(),
+                    widget=deform.widget.HiddenWidget(),
+                    missing=colander.null,
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="text_input_masks")
     @demonstrate("Text Input Masks")
     def text_input_masks(self):
-        class Schema(colander.Schema):
-            ssn = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextInputWidget(mask="999-99-9999"),
-            )
-            date = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextInputWidget(mask="99/99/9999"),
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                ssn = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextInputWidget(mask="999-99-9999"),
+                )
+                date = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextInputWidget(mask="99/99/9999"),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="textareacsv")
     @demonstrate("Text Area CSV Widget")
     def textareacsv(self):
-        class Row(colander.TupleSchema):
-            first = colander.SchemaNode(colander.Integer())
-            second = colander.SchemaNode(colander.String())
-            third = colander.SchemaNode(colander.Decimal())
+        def make_form():
+            class Row(colander.TupleSchema):
+                first = colander.SchemaNode(colander.Integer())
+                second = colander.SchemaNode(colander.String())
+                third = colander.SchemaNode(colander.Decimal())
 
-        class Rows(colander.SequenceSchema):
-            row = Row()
+            class Rows(colander.SequenceSchema):
+                row = Row()
 
-        class Schema(colander.Schema):
-            csv = Rows()
+            class Schema(colander.Schema):
+                csv = Rows()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
-        form["csv"].widget = deform.widget.TextAreaCSVWidget(rows=10, cols=60)
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            form["csv"].widget = deform.widget.TextAreaCSVWidget(
+                rows=10, cols=60
+            )
+            return form
+
+        form = self.cached_form(make_form)
+        appstruct = {"csv": [(1, "hello", 4.5), (2, "goodbye", 5.5)]}
+
+        return self.render_form(form, appstruct=appstruct)
+
+    @view_config(renderer="templates/form.pt", name="textareacsv_streaming")
+    @demonstrate("Text Area CSV Widget (Streaming)")
+    def textareacsv_streaming(self):
+        def make_form():
+            class Row(colander.TupleSchema):
+                first = colander.SchemaNode(colander.Integer())
+                second = colander.SchemaNode(colander.String())
+                third = colander.SchemaNode(colander.Decimal())
+
+            class Rows(colander.SequenceSchema):
+                # colander.Sequence, converting the rows of large pastes a
+                # column at a time; see deformdemo.columns
+                schema_type = ColumnSequence
+                row = Row()
+
+            class Schema(colander.Schema):
+                csv = Rows()
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            # deform.widget.TextAreaCSVWidget, parsing large pastes a line
+            # at a time; see deformdemo.csvtext
+            form["csv"].widget = StreamingTextAreaCSVWidget(rows=10, cols=60)
+            return form
+
+        form = self.cached_form(make_form)
         appstruct = {"csv": [(1, "hello", 4.5), (2, "goodbye", 5.5)]}
 
         return self.render_form(form, appstruct=appstruct)
@@ -2413,48 +2990,79 @@ class DeformDemo(object):
     @view_config(renderer="templates/form.pt", name="textinputcsv")
     @demonstrate("Text Input CSV Widget")
     def textinputcsv(self):
-        class Row(colander.TupleSchema):
-            first = colander.SchemaNode(colander.Integer())
-            second = colander.SchemaNode(colander.String())
-            third = colander.SchemaNode(colander.Decimal())
+        def make_form():
+            class Row(colander.TupleSchema):
+                first = colander.SchemaNode(colander.Integer())
+                second = colander.SchemaNode(colander.String())
+                third = colander.SchemaNode(colander.Decimal())
 
-        class Schema(colander.Schema):
-            csv = Row()
+            class Schema(colander.Schema):
+                csv = Row()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
         # we don't need to assign a widget; the text input csv widget is the
         # default widget for tuples
         appstruct = {"csv": (1, "hello", 4.5)}
 
         return self.render_form(form, appstruct=appstruct)
 
+    @view_config(renderer="templates/form.pt", name="textinputcsv_streaming")
+    @demonstrate("Text Input CSV Widget (Streaming)")
+    def textinputcsv_streaming(self):
+        def make_form():
+            class Row(colander.TupleSchema):
+                first = colander.SchemaNode(colander.Integer())
+                second = colander.SchemaNode(colander.String())
+                third = colander.SchemaNode(colander.Decimal())
+
+            class Schema(colander.Schema):
+                # deform.widget.TextInputCSVWidget only parsing the first
+                # line of large pastes; see deformdemo.csvtext
+                csv = Row(widget=StreamingTextInputCSVWidget())
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
+        appstruct = {"csv": (1, "hello", 4.5)}
+
+        return self.render_form(form, appstruct=appstruct)
+
     @view_config(renderer="templates/form.pt", name="require_one_or_another")
     @demonstrate("Require One Field or Another")
     def require_one_or_another(self):
-        class Schema(colander.Schema):
-            one = colander.SchemaNode(
-                colander.String(),
-                missing=unicode(""),
-                title="One (required if Two is not supplied)",
-            )
-            two = colander.SchemaNode(
-                colander.String(),
-                missing=unicode(""),
-                title="Two (required if One is not supplied)",
-            )
-
-        def validator(form, value):
-            if not value["one"] and not value["two"]:
-                exc = colander.Invalid(
-                    form, 'A value for either "one" or "two" is required'
+        def make_form():
+            class Schema(colander.Schema):
+                one = colander.SchemaNode(
+                    colander.String(),
+                    missing=unicode(""),
+                    title="One (required if Two is not supplied)",
+                )
+                two = colander.SchemaNode(
+                    colander.String(),
+                    missing=unicode(""),
+                    title="Two (required if One is not supplied)",
                 )
-                exc["one"] = "Required if two is not supplied"
-                exc["two"] = "Required if one is not supplied"
-                raise exc
 
-        schema = Schema(validator=validator)
-        form = deform.Form(schema, buttons=("submit",))
+            def validator(form, value):
+                if not value["one"] and not value["two"]:
+                    exc = colander.Invalid(
+                        form, 'A value for either "one" or "two" is required'
+                    )
+                    exc["one"] = "Required if two is not supplied"
+                    exc["two"] = "Required if one is not supplied"
+                    raise exc
+
+            schema = Schema(validator=validator)
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -2464,27 +3072,31 @@ class DeformDemo(object):
     )
     @demonstrate("Multiple Error Messages For a Single Widget (Mapping)")
     def multiple_error_messages_mapping(self):
-        def v1(node, value):
-            msg = _("Error ${num}", mapping=dict(num=1))
-            raise colander.Invalid(node, msg)
+        def make_form():
+            def v1(node, value):
+                msg = _("Error ${num}", mapping=dict(num=1))
+                raise colander.Invalid(node, msg)
 
-        def v2(node, value):
-            msg = _("Error ${num}", mapping=dict(num=2))
-            raise colander.Invalid(node, msg)
+            def v2(node, value):
+                msg = _("Error ${num}", mapping=dict(num=2))
+                raise colander.Invalid(node, msg)
 
-        def v3(node, value):
-            msg = _("Error ${num}", mapping=dict(num=3))
-            raise colander.Invalid(node, msg)
+            def v3(node, value):
+                msg = _("Error ${num}", mapping=dict(num=3))
+                raise colander.Invalid(node, msg)
 
-        class Schema(colander.Schema):
-            field = colander.SchemaNode(
-                colander.String(),
-                title="Fill in a value and submit to see multiple errors",
-                validator=colander.All(v1, v2, v3),
-            )
+            class Schema(colander.Schema):
+                field = colander.SchemaNode(
+                    colander.String(),
+                    title="Fill in a value and submit to see multiple errors",
+                    validator=colander.All(v1, v2, v3),
+                )
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -2493,30 +3105,34 @@ class DeformDemo(object):
     )
     @demonstrate("Multiple Error Messages For a Single Widget (Sequence)")
     def multiple_error_messages_seq(self):
-        def v1(node, value):
-            msg = _("Error ${num}", mapping=dict(num=1))
-            raise colander.Invalid(node, msg)
+        def make_form():
+            def v1(node, value):
+                msg = _("Error ${num}", mapping=dict(num=1))
+                raise colander.Invalid(node, msg)
 
-        def v2(node, value):
-            msg = _("Error ${num}", mapping=dict(num=2))
-            raise colander.Invalid(node, msg)
+            def v2(node, value):
+                msg = _("Error ${num}", mapping=dict(num=2))
+                raise colander.Invalid(node, msg)
 
-        def v3(node, value):
-            msg = _("Error ${num}", mapping=dict(num=3))
-            raise colander.Invalid(node, msg)
+            def v3(node, value):
+                msg = _("Error ${num}", mapping=dict(num=3))
+                raise colander.Invalid(node, msg)
 
-        class Sequence(colander.SequenceSchema):
-            field = colander.SchemaNode(
-                colander.String(),
-                title="Fill in a value and submit to see multiple errors",
-                validator=colander.All(v1, v2, v3),
-            )
+            class Sequence(colander.SequenceSchema):
+                field = colander.SchemaNode(
+                    colander.String(),
+                    title="Fill in a value and submit to see multiple errors",
+                    validator=colander.All(v1, v2, v3),
+                )
 
-        class Schema(colander.Schema):
-            fields = Sequence()
+            class Schema(colander.Schema):
+                fields = Sequence()
 
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -2525,6 +3141,9 @@ class DeformDemo(object):
     def multiple_forms(self):
         import itertools
 
+        # not cached: both forms share one counter, which a cached copy
+        # would not
+
         # We need to make sure the form field identifiers for the two
         # forms do not overlap so accessibility features continue to work,
         # such as focusing the field related to a legend when the
@@ -2611,30 +3230,36 @@ class DeformDemo(object):
         # is the same as if we had used a TextAreaCSVWidget against
         # the sequence as in the "textareacsv" test method.
         #
-        # N.B.: we haven't automated the lookup of the widget adapter
-        # based on the type of the field and the type of the widget.
-        # Instead, we just construct an adapter manually.  Adding an
-        # abstraction to the lookup based on the widget and schema
-        # types being adapted is easy enough, but trying to follow the
-        # code path of the abstraction becomes brain bending.
-        # Therefore, we don't bother to show it.
-
-        class Row(colander.TupleSchema):
-            first = colander.SchemaNode(colander.Integer())
-            second = colander.SchemaNode(colander.String())
-            third = colander.SchemaNode(colander.Decimal())
-
-        class Rows(colander.SequenceSchema):
-            row = Row()
-
-        class Schema(colander.Schema):
-            csv = Rows()
-
-        schema = Schema()
-        form = deform.Form(schema, buttons=("submit",))
-        inner_widget = deform.widget.TextAreaWidget(rows=10, cols=60)
-        widget = SequenceToTextWidgetAdapter(inner_widget)
-        form["csv"].widget = widget
+        # N.B.: the widget adapter is looked up based on the type of the
+        # field and the type of the widget.  SequenceToTextWidgetAdapter
+        # is registered for sequences rendered by a TextAreaWidget with the
+        # @adapts decorator below, and adapt_form wraps the widget of the
+        # form in it (see deformdemo.adapters).  The form is cached, so the
+        # adapter is built once rather than on every request.
+
+        def make_form(adapters):
+            class Row(colander.TupleSchema):
+                first = colander.SchemaNode(colander.Integer())
+                second = colander.SchemaNode(colander.String())
+                third = colander.SchemaNode(colander.Decimal())
+
+            class Rows(colander.SequenceSchema):
+                # colander.Sequence, converting the rows of large pastes a
+                # column at a time; see deformdemo.columns
+                schema_type = ColumnSequence
+                row = Row()
+
+            class Schema(colander.Schema):
+                csv = Rows()
+
+            schema = Schema()
+            form = deform.Form(schema, buttons=("submit",))
+            form["csv"].widget = deform.widget.TextAreaWidget(rows=10, cols=60)
+            adapters.adapt_form(form)
+            return form
+
+        adapters = get_widget_adapters(self.request.registry)
+        form = self.cached_form(make_form, adapters)
         appstruct = {"csv": [(1, "hello", 4.5), (2, "goodbye", 5.5)]}
 
         return self.render_form(form, appstruct=appstruct)
@@ -2646,105 +3271,110 @@ class DeformDemo(object):
 
         import colander
 
-        @colander.deferred
-        def deferred_date_validator(node, kw):
-            max_date = kw.get("max_date")
-            if max_date is None:
-                max_date = datetime.date.today()
-            return colander.Range(min=datetime.date.min, max=max_date)
-
-        @colander.deferred
-        def deferred_date_description(node, kw):
-            max_date = kw.get("max_date")
-            if max_date is None:
-                max_date = datetime.date.today()
-            return "Blog post date (no earlier than %s)" % max_date.ctime()
-
-        @colander.deferred
-        def deferred_date_missing(node, kw):
-            default_date = kw.get("default_date")
-            if default_date is None:
-                default_date = datetime.date.today()
-            return default_date
-
-        @colander.deferred
-        def deferred_body_validator(node, kw):
-            max_bodylen = kw.get("max_bodylen")
-            if max_bodylen is None:
-                max_bodylen = 1 << 18
-            return colander.Length(max=max_bodylen)
-
-        @colander.deferred
-        def deferred_body_description(node, kw):
-            max_bodylen = kw.get("max_bodylen")
-            if max_bodylen is None:
-                max_bodylen = 1 << 18
-            return "Blog post body (no longer than %s bytes)" % max_bodylen
+        def make_form(today):
+            @colander.deferred
+            def deferred_date_validator(node, kw):
+                max_date = kw.get("max_date")
+                if max_date is None:
+                    max_date = datetime.date.today()
+                return colander.Range(min=datetime.date.min, max=max_date)
+
+            @colander.deferred
+            def deferred_date_description(node, kw):
+                max_date = kw.get("max_date")
+                if max_date is None:
+                    max_date = datetime.date.today()
+                return "Blog post date (no earlier than %s)" % max_date.ctime()
+
+            @colander.deferred
+            def deferred_date_missing(node, kw):
+                default_date = kw.get("default_date")
+                if default_date is None:
+                    default_date = datetime.date.today()
+                return default_date
+
+            @colander.deferred
+            def deferred_body_validator(node, kw):
+                max_bodylen = kw.get("max_bodylen")
+                if max_bodylen is None:
+                    max_bodylen = 1 << 18
+                return colander.Length(max=max_bodylen)
+
+            @colander.deferred
+            def deferred_body_description(node, kw):
+                max_bodylen = kw.get("max_bodylen")
+                if max_bodylen is None:
+                    max_bodylen = 1 << 18
+                return "Blog post body (no longer than %s bytes)" % max_bodylen
+
+            @colander.deferred
+            def deferred_body_widget(node, kw):
+                body_type = kw.get("body_type")
+                if body_type == "richtext":
+                    widget = deform.widget.RichTextWidget()
+                else:
+                    widget = deform.widget.TextAreaWidget()
+                return widget
 
-        @colander.deferred
-        def deferred_body_widget(node, kw):
-            body_type = kw.get("body_type")
-            if body_type == "richtext":
-                widget = deform.widget.RichTextWidget()
-            else:
-                widget = deform.widget.TextAreaWidget()
-            return widget
+            @colander.deferred
+            def deferred_category_validator(node, kw):
+                categories = kw.get("categories", [])
+                return colander.OneOf([x[0] for x in categories])
 
-        @colander.deferred
-        def deferred_category_validator(node, kw):
-            categories = kw.get("categories", [])
-            return colander.OneOf([x[0] for x in categories])
+            @colander.deferred
+            def deferred_category_widget(node, kw):
+                categories = kw.get("categories", [])
+                return deform.widget.RadioChoiceWidget(values=categories)
 
-        @colander.deferred
-        def deferred_category_widget(node, kw):
-            categories = kw.get("categories", [])
-            return deform.widget.RadioChoiceWidget(values=categories)
+            class BlogPostSchema(colander.Schema):
+                title = colander.SchemaNode(
+                    colander.String(),
+                    title="Title",
+                    description="Blog post title",
+                    validator=colander.Length(min=5, max=100),
+                    widget=deform.widget.TextInputWidget(),
+                )
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    title="Date",
+                    missing=deferred_date_missing,
+                    description=deferred_date_description,
+                    validator=deferred_date_validator,
+                    widget=deform.widget.DateInputWidget(),
+                )
+                body = colander.SchemaNode(
+                    colander.String(),
+                    title="Body",
+                    description=deferred_body_description,
+                    validator=deferred_body_validator,
+                    widget=deferred_body_widget,
+                )
+                category = colander.SchemaNode(
+                    colander.String(),
+                    title="Category",
+                    description="Blog post category",
+                    validator=deferred_category_validator,
+                    widget=deferred_category_widget,
+                )
 
-        class BlogPostSchema(colander.Schema):
-            title = colander.SchemaNode(
-                colander.String(),
-                title="Title",
-                description="Blog post title",
-                validator=colander.Length(min=5, max=100),
-                widget=deform.widget.TextInputWidget(),
-            )
-            date = colander.SchemaNode(
-                colander.Date(),
-                title="Date",
-                missing=deferred_date_missing,
-                description=deferred_date_description,
-                validator=deferred_date_validator,
-                widget=deform.widget.DateInputWidget(),
-            )
-            body = colander.SchemaNode(
-                colander.String(),
-                title="Body",
-                description=deferred_body_description,
-                validator=deferred_body_validator,
-                widget=deferred_body_widget,
-            )
-            category = colander.SchemaNode(
-                colander.String(),
-                title="Category",
-                description="Blog post category",
-                validator=deferred_category_validator,
-                widget=deferred_category_widget,
+            schema = BlogPostSchema().bind(
+                max_date=datetime.date.max,
+                max_bodylen=5000,
+                body_type="richtext",
+                default_date=today,
+                categories=[("one", "One"), ("two", "Two")],
             )
 
-        schema = BlogPostSchema().bind(
-            max_date=datetime.date.max,
-            max_bodylen=5000,
-            body_type="richtext",
-            default_date=datetime.date.today(),
-            categories=[("one", "One"), ("two", "Two")],
-        )
+            form = deform.Form(schema, buttons=("submit",))
+            return form
 
-        form = deform.Form(schema, buttons=("submit",))
+        form = self.cached_form(make_form, datetime.date.today())
         return self.render_form(form)
 
     @view_config(renderer="templates/form.pt", name="pyramid_csrf_demo")
     @demonstrate("Pyramid CSRF Demo (using schema binding)")
     def pyramid_csrf_demo(self):
+        # not cached: the default of the CSRF token is bound to the session
         @colander.deferred
         def deferred_csrf_default(node, kw):
             request = kw.get("request")
@@ -2789,15 +3419,19 @@ class DeformDemo(object):
     )
     @demonstrate("Sequence With Prototype that Has No Name")
     def sequence_with_prototype_that_has_no_name(self):
-        class EmailMessage(colander.Schema):
-            subject = colander.SchemaNode(colander.String())
-            to = colander.SchemaNode(
-                colander.Sequence(),
-                colander.SchemaNode(colander.String(), name="foo"),
-            )
+        def make_form():
+            class EmailMessage(colander.Schema):
+                subject = colander.SchemaNode(colander.String())
+                to = colander.SchemaNode(
+                    colander.Sequence(),
+                    colander.SchemaNode(colander.String(), name="foo"),
+                )
 
-        schema = EmailMessage()
-        form = deform.Form(schema, buttons=("submit",))
+            schema = EmailMessage()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form)
 
@@ -2806,24 +3440,29 @@ class DeformDemo(object):
     )
     @demonstrate("Don't Validate Readonly Fields")
     def readonly_value_nonvalidation(self):
-        @colander.deferred
-        def deferred_missing(node, kw):
-            return appstruct["readonly"]
-
-        class Values(colander.Schema):
-            readonly = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextInputWidget(readonly=True),
-                missing=deferred_missing,
-            )
-            readwrite = colander.SchemaNode(colander.String())
-
         appstruct = {
             "readonly": "Read Only",
             "readwrite": "Read and Write",
         }
-        schema = Values().bind()
-        form = deform.Form(schema, buttons=("submit",))
+
+        def make_form():
+            @colander.deferred
+            def deferred_missing(node, kw):
+                return appstruct["readonly"]
+
+            class Values(colander.Schema):
+                readonly = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextInputWidget(readonly=True),
+                    missing=deferred_missing,
+                )
+                readwrite = colander.SchemaNode(colander.String())
+
+            schema = Values().bind()
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         return self.render_form(form, appstruct=appstruct)
 
@@ -2832,56 +3471,64 @@ class DeformDemo(object):
     def readonly_argument(self):
         import datetime
 
-        class Schema(colander.Schema):
-            textinput = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextInputWidget(readonly=True),
-                missing=colander.null,
-                description="Text in a text input",
-            )
-            textarea = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextAreaWidget(readonly=True),
-                missing=colander.null,
-                description="Text in a textarea",
-            )
-            single_select = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(
-                    values=[("a", "The letter a"), ("b", "The letter b")],
-                    readonly=True,
-                ),
-                missing=colander.null,
-                description="A letter",
-            )
-            multi_select = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(
-                    values=[("a", "The letter a"), ("b", "The letter b")],
-                    multiple=True,
-                    readonly=True,
-                ),
-                missing=colander.null,
-                description="Some letters",
-            )
-            richtext = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.RichTextWidget(readonly=True),
-                description="Some text",
-                missing=colander.null,
-            )
-            money = colander.SchemaNode(
-                colander.Decimal(),
-                widget=deform.widget.MoneyInputWidget(readonly=True),
-                description="Some money",
-                missing=colander.null,
-            )
-            date = colander.SchemaNode(
-                colander.Date(),
-                widget=deform.widget.DateInputWidget(readonly=True),
-                description="Some date",
-                missing=colander.null,
-            )
+        def make_form():
+            class Schema(colander.Schema):
+                textinput = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextInputWidget(readonly=True),
+                    missing=colander.null,
+                    description="Text in a text input",
+                )
+                textarea = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextAreaWidget(readonly=True),
+                    missing=colander.null,
+                    description="Text in a textarea",
+                )
+                single_select = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(
+                        values=[("a", "The letter a"), ("b", "The letter b")],
+                        readonly=True,
+                    ),
+                    missing=colander.null,
+                    description="A letter",
+                )
+                multi_select = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(
+                        values=[("a", "The letter a"), ("b", "The letter b")],
+                        multiple=True,
+                        readonly=True,
+                    ),
+                    missing=colander.null,
+                    description="Some letters",
+                )
+                richtext = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.RichTextWidget(readonly=True),
+                    description="Some text",
+                    missing=colander.null,
+                )
+                money = colander.SchemaNode(
+                    colander.Decimal(),
+                    widget=deform.widget.MoneyInputWidget(readonly=True),
+                    description="Some money",
+                    missing=colander.null,
+                )
+                date = colander.SchemaNode(
+                    colander.Date(),
+                    widget=deform.widget.DateInputWidget(readonly=True),
+                    description="Some date",
+                    missing=colander.null,
+                )
+
+            schema = Schema()
+
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         appstruct = {
             "textinput": "readonly text input",
@@ -2893,10 +3540,6 @@ class DeformDemo(object):
             "date": datetime.date(2010, 5, 5),
         }
 
-        schema = Schema()
-
-        form = deform.Form(schema, buttons=("submit",))
-
         return self.render_form(form, appstruct=appstruct)
 
     @view_config(renderer="templates/form.pt", name="readonly_html")
@@ -2906,82 +3549,91 @@ class DeformDemo(object):
         This form shows the widgets that support the HTML attribute
         ``readonly``.
         """
-        values = [
-            ("a", "The letter a"),
-            ("b", "The letter b"),
-            ("c", "The letter c"),
-        ]
 
-        class Schema(colander.Schema):
-            checkbox = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.CheckboxChoiceWidget(
-                    values=values,
-                    attributes={"onclick": "return false;"},
-                ),
-                description="Readonly checkbox choices",
-            )
-            money = colander.SchemaNode(
-                colander.Decimal(),
-                widget=deform.widget.MoneyInputWidget(
-                    attributes={"readonly": "readonly"}
-                ),
-                description="Readonly money",
-            )
-            radio = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.RadioChoiceWidget(
-                    values=values,
-                    attributes={"readonly": "readonly"},
-                ),
-                description="Readonly radio choices",
-            )
-            select_single = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectWidget(
-                    values=values,
-                    attributes={"readonly": "readonly"},
-                ),
-                description="Readonly select single",
-            )
-            selectize_multi = colander.SchemaNode(
-                colander.Set(),
-                widget=deform.widget.SelectizeWidget(
-                    values=values,
-                    multiple=True,
-                    attributes={"readonly": "readonly"},
-                    selectize_options={
-                        "persist": False,
-                        "plugins": ["remove_button"],
-                    },
-                ),
-                description="Readonly selectize multiple",
-            )
-            selectize_single = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.SelectizeWidget(
-                    values=values,
-                    attributes={"readonly": "readonly"},
-                    selectize_options={
-                        "persist": False,
-                    },
-                ),
-                description="Readonly selectize single",
-            )
-            textarea = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextAreaWidget(
-                    attributes={"readonly": "readonly"}
-                ),
-                description="Readonly textarea",
-            )
-            textinput = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextInputWidget(
-                    attributes={"readonly": "readonly"}
-                ),
-                description="Readonly text input",
-            )
+        def make_form():
+            values = [
+                ("a", "The letter a"),
+                ("b", "The letter b"),
+                ("c", "The letter c"),
+            ]
+
+            class Schema(colander.Schema):
+                checkbox = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.CheckboxChoiceWidget(
+                        values=values,
+                        attributes={"onclick": "return false;"},
+                    ),
+                    description="Readonly checkbox choices",
+                )
+                money = colander.SchemaNode(
+                    colander.Decimal(),
+                    widget=deform.widget.MoneyInputWidget(
+                        attributes={"readonly": "readonly"}
+                    ),
+                    description="Readonly money",
+                )
+                radio = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.RadioChoiceWidget(
+                        values=values,
+                        attributes={"readonly": "readonly"},
+                    ),
+                    description="Readonly radio choices",
+                )
+                select_single = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectWidget(
+                        values=values,
+                        attributes={"readonly": "readonly"},
+                    ),
+                    description="Readonly select single",
+                )
+                selectize_multi = colander.SchemaNode(
+                    colander.Set(),
+                    widget=deform.widget.SelectizeWidget(
+                        values=values,
+                        multiple=True,
+                        attributes={"readonly": "readonly"},
+                        selectize_options={
+                            "persist": False,
+                            "plugins": ["remove_button"],
+                        },
+                    ),
+                    description="Readonly selectize multiple",
+                )
+                selectize_single = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.SelectizeWidget(
+                        values=values,
+                        attributes={"readonly": "readonly"},
+                        selectize_options={
+                            "persist": False,
+                        },
+                    ),
+                    description="Readonly selectize single",
+                )
+                textarea = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextAreaWidget(
+                        attributes={"readonly": "readonly"}
+                    ),
+                    description="Readonly textarea",
+                )
+                textinput = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextInputWidget(
+                        attributes={"readonly": "readonly"}
+                    ),
+                    description="Readonly text input",
+                )
+
+            schema = Schema()
+
+            form = deform.Form(schema, buttons=("submit",))
+            return form
+
+        form = self.cached_form(make_form)
 
         appstruct = {
             "checkbox": "b",
@@ -2994,10 +3646,6 @@ class DeformDemo(object):
             "textinput": "readonly text input",
         }
 
-        schema = Schema()
-
-        form = deform.Form(schema, buttons=("submit",))
-
         return self.render_form(form, appstruct=appstruct)
 
     @view_config(
@@ -3008,50 +3656,46 @@ class DeformDemo(object):
     def custom_classes_on_outermost_html_element(self):
         import datetime
 
-        class Mapping(colander.Schema):
-            upload = colander.SchemaNode(
-                deform.FileData(),
-                widget=deform.widget.FileUploadWidget(
-                    tmpstore, item_css_class="mapped_widget_custom_class"
-                ),
-            )
-
-        class Schema(colander.Schema):
-            text = colander.SchemaNode(
-                colander.String(),
-                widget=deform.widget.TextInputWidget(
-                    item_css_class="top_level_mapping_widget_custom_class"
-                ),
-            )
-            sequence = colander.SchemaNode(
-                colander.Sequence(),
-                colander.SchemaNode(
-                    colander.Date(),
-                    name="Sequence Item",
-                    widget=deform.widget.DatePartsWidget(
-                        item_css_class="sequenced_widget_custom_class"
+        def make_form(today):
+            class Mapping(colander.Schema):
+                upload = colander.SchemaNode(
+                    deform.FileData(),
+                    widget=deform.widget.FileUploadWidget(
+                        self.tmpstore,
+                        item_css_class="mapped_widget_custom_class",
                     ),
-                ),
-                default=[datetime.date.today()],
-                description="SequenceWidget",
-            )
-            mapping = Mapping(description="MappingWidget")
-
-        return self.render_form(deform.Form(Schema(), buttons=("submit",)))
-
-
-class MemoryTmpStore(dict):
-    """Instances of this class implement the
-    :class:`deform.interfaces.FileUploadTempStore` interface"""
+                )
 
-    def preview_url(self, uid):
-        return None
+            class Schema(colander.Schema):
+                text = colander.SchemaNode(
+                    colander.String(),
+                    widget=deform.widget.TextInputWidget(
+                        item_css_class="top_level_mapping_widget_custom_class"
+                    ),
+                )
+                sequence = colander.SchemaNode(
+                    colander.Sequence(),
+                    colander.SchemaNode(
+                        colander.Date(),
+                        name="Sequence Item",
+                        widget=deform.widget.DatePartsWidget(
+                            item_css_class="sequenced_widget_custom_class"
+                        ),
+                    ),
+                    default=[today],
+                    description="SequenceWidget",
+                )
+                mapping = Mapping(description="MappingWidget")
 
+            return deform.Form(Schema(), buttons=("submit",))
 
-tmpstore = MemoryTmpStore()
+        form = self.cached_form(make_form, datetime.date.today())
+        return self.render_form(form)
 
 
+@adapts(colander.Sequence, deform.widget.TextAreaWidget)
 class SequenceToTextWidgetAdapter(object):
+    # see deformdemo.csvtext for how rows are parsed and rendered
     def __init__(self, widget):
         self.widget = widget
 
@@ -3059,14 +3703,9 @@ class SequenceToTextWidgetAdapter(object):
         return getattr(self.widget, name)
 
     def serialize(self, field, cstruct, readonly=False):
-        if cstruct is colander.null:
-            cstruct = []
         textrows = getattr(field, "unparseable", None)
         if textrows is None:
-            outfile = StringIO()
-            writer = csv.writer(outfile)
-            writer.writerows(cstruct)
-            textrows = outfile.getvalue()
+            textrows = serialize_rows(field, cstruct)
         return self.widget.serialize(
             field, cstruct=textrows, readonly=readonly
         )
@@ -3077,28 +3716,18 @@ class SequenceToTextWidgetAdapter(object):
             return text
         if not text.strip():
             return colander.null
-        try:
-            infile = StringIO(text)
-            reader = csv.reader(infile)
-            rows = list(reader)
-        except Exception as e:
-            field.unparseable = pstruct
-            raise colander.Invalid(field.schema, str(e))
-        return rows
+        field.submitted_text = text
+        return list(iter_rows(field, text))
 
     def handle_error(self, field, error):
-        msgs = []
-        if error.msg:
-            field.error = error
-        else:
-            for e in error.children:
-                msgs.append("line %s: %s" % (e.pos + 1, e))
-            field.error = colander.Invalid(field.schema, "\n".join(msgs))
+        line_errors(field, error)
 
 
 def main(global_config, **settings):
     # paster serve entry point
-    settings["debug_templates"] = "true"
+    # templates are compiled in debug mode unless the settings turn it off,
+    # as production.ini does
+    settings.setdefault("debug_templates", "true")
 
     session_factory = SignedCookieSessionFactory("seekrit!")
     config = Configurator(settings=settings, session_factory=session_factory)
@@ -3110,27 +3739,51 @@ def main(global_config, **settings):
 
     # Set up Chameleon templates (ZTP) rendering paths
 
-    def translator(term):
-        # i18n localizing function
-        return get_localizer(get_current_request()).translate(term)
+    # i18n localizing function, resolving the localizer once per request
+    # and keeping translations; see deformdemo.translation
+    translator = get_widget_translator(config.registry)
+    config.add_tween("deformdemo.translation.translation_tween_factory")
 
     # Configure renderer
-    configure_zpt_renderer(
+    configure_widget_renderer(
         (
             "deformdemo:custom_widgets",
             "unofficial-deformdemo:custom_widgets",
         ),
         translator,
+        config.registry.settings,
     )
     config.add_static_view("static_deform", "deform:static")
     config.add_route(
         "unofficial-deformdemo", "/unofficial-deformdemo*traverse"
     )
+    config.add_route("upload_preview", "/uploads/{uid}")
     config.add_route("deformdemo", "*traverse")
+    # set up the store of file uploads and the sources of suggestions and
+    # options
+    # before any thread needs them
+    get_tmpstore(config.registry)
+    get_suggestions(config.registry)
+    get_options(config.registry)
+
+    if asbool(settings.get("deformdemo.server_timing", False)):
+        config.add_tween("deformdemo.timing.timing_tween_factory")
+
+    if settings.get("deformdemo.profile_dir"):
+        config.add_tween("deformdemo.profiling.profile_tween_factory")
 
     def onerror(*arg):
         pass
 
     config.scan("deformdemo", onerror=onerror)
     config.include("..unofficial-deformdemo")
-    return config.make_wsgi_app()
+
+    if asbool(settings.get("deformdemo.warm_caches", False)):
+        warm_code_cache(get_demo_registry(config.registry))
+
+    app = config.make_wsgi_app()
+
+    if asbool(settings.get("deformdemo.precompile_templates", False)):
+        precompile_templates(config.registry)
+
+    return app
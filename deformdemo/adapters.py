@@ -0,0 +1,106 @@
+"""A registry of widget adapters, looked up by schema type and widget.
+
+Formish pairs a widget against a type which doesn't "natively" lend itself
+to being represented by it (a textarea against a sequence) through an
+adapter converting the data on the way in and out.  The ``widget_adapter``
+demo does the same with an adapter class decorated with :class:`adapts`,
+which records it in the :class:`WidgetAdapterRegistry` of the application
+when the module containing it is scanned.
+
+The ``make_form`` function of the demo calls
+:meth:`WidgetAdapterRegistry.adapt_form` on the form it builds, so the
+adapter is built once per form kept by the
+:class:`deformdemo.formcache.FormCache` rather than once per request.
+"""
+
+import threading
+
+import venusian
+
+
+class WidgetAdapterRegistry(object):
+    """Widget adapter factories, keyed by schema type and widget class.
+
+    Schema types are matched through their base classes, the closest one
+    first, but widget classes are matched exactly: a subclass of a widget
+    (``TextAreaCSVWidget`` of ``TextAreaWidget``) may well handle the type
+    by itself.  Lookups are memoized.
+    """
+
+    def __init__(self):
+        self.factories = {}
+        self._lookups = {}
+        self._lock = threading.Lock()
+
+    def register(self, schema_type, widget_class, factory):
+        """Adapt the widgets of class ``widget_class`` of the fields of
+        type ``schema_type`` by calling ``factory(widget)``."""
+        with self._lock:
+            self.factories[(schema_type, widget_class)] = factory
+            self._lookups.clear()
+
+    def lookup(self, schema_type, widget_class):
+        """Return the adapter factory of the widgets of class
+        ``widget_class`` of the fields of type ``schema_type``, or
+        ``None``."""
+        key = (schema_type, widget_class)
+        try:
+            return self._lookups[key]
+        except KeyError:
+            pass
+        factory = None
+        for base in schema_type.__mro__:
+            factory = self.factories.get((base, widget_class))
+            if factory is not None:
+                break
+        with self._lock:
+            self._lookups[key] = factory
+        return factory
+
+    def adapt(self, field):
+        """Wrap the widget of ``field`` in its adapter, if there is one."""
+        widget = field.widget
+        factory = self.lookup(type(field.schema.typ), type(widget))
+        if factory is not None:
+            field.widget = factory(widget)
+
+    def adapt_form(self, field):
+        """Wrap the widgets of ``field`` and of all its descendants in their
+        adapters."""
+        self.adapt(field)
+        for child in field.children:
+            self.adapt_form(child)
+
+
+def get_widget_adapters(registry):
+    """Return the :class:`WidgetAdapterRegistry` of a Pyramid registry."""
+    adapters = getattr(registry, "deformdemo_widget_adapters", None)
+    if adapters is None:
+        adapters = registry.deformdemo_widget_adapters = (
+            WidgetAdapterRegistry()
+        )
+    return adapters
+
+
+class adapts(object):
+    """Mark a widget adapter class as adapting the widgets of class
+    ``widget_class`` of the fields of type ``schema_type``.
+
+    The adapter is added to the :class:`WidgetAdapterRegistry` when the
+    module containing it is scanned.
+    """
+
+    venusian = venusian  # for testing injection
+
+    def __init__(self, schema_type, widget_class):
+        self.schema_type = schema_type
+        self.widget_class = widget_class
+
+    def __call__(self, factory):
+        def callback(context, name, ob):
+            get_widget_adapters(context.config.registry).register(
+                self.schema_type, self.widget_class, ob
+            )
+
+        self.venusian.attach(factory, callback, category="pyramid")
+        return factory
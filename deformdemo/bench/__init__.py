@@ -0,0 +1,80 @@
+"""In-process benchmarks of the demo application.
+
+Each module of this package is a script, run with ``python -m``; see its
+docstring for the options it takes.  The demo application is booted from
+its ``demo`` entry point and driven through :mod:`webtest`, so no server
+or browser is needed.
+"""
+
+import json
+import time
+
+from deformdemo import main
+from deformdemo.registry import get_demo_registry
+
+
+#: Settings of ``production.ini`` that change how pages are rendered
+production_settings = {
+    "reload_templates": "false",
+    "debug_templates": "false",
+}
+
+
+def make_app(dev=False, **settings):
+    """Return a :class:`webtest.TestApp` wrapping the demo application.
+
+    The application is configured as in production, unless ``dev`` is true,
+    where it is configured as in ``demo.ini``.
+    """
+    import webtest
+
+    if not dev:
+        settings = dict(production_settings, **settings)
+    return webtest.TestApp(main({}, **settings))
+
+
+def get_demos(app, route_name="deformdemo"):
+    """Return the registered demos of ``app``, sorted by title."""
+    return get_demo_registry(app.app.registry).by_title(route_name)
+
+
+def timed(func, repeat):
+    """Call ``func`` ``repeat`` times and return the durations, in
+    seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def percentile(durations, pct):
+    """Return the ``pct`` percentile of ``durations`` (nearest rank)."""
+    ordered = sorted(durations)
+    if not ordered:
+        return 0.0
+    rank = int(round(pct / 100.0 * (len(ordered) - 1)))
+    return ordered[rank]
+
+
+def summarize(durations):
+    """Return the latency percentiles and throughput of ``durations``."""
+    total = sum(durations)
+    return {
+        "requests": len(durations),
+        "p50_ms": percentile(durations, 50) * 1000,
+        "p95_ms": percentile(durations, 95) * 1000,
+        "p99_ms": percentile(durations, 99) * 1000,
+        "requests_per_second": len(durations) / total if total else 0.0,
+    }
+
+
+def mean(durations):
+    return sum(durations) / len(durations) if durations else 0.0
+
+
+def write_json(results, filename):
+    with open(filename, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
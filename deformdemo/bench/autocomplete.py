@@ -0,0 +1,147 @@
+"""Compare looking up autocomplete suggestions by scanning a list of terms,
+through a :class:`deformdemo.suggestions.PrefixIndex` and through a
+:class:`deformdemo.suggestions.TrigramIndex`.
+
+Usage::
+
+    python -m deformdemo.bench.autocomplete [--sizes N,N,...]
+        [--repeat N] [--output FILE]
+
+For vocabularies of random words of each size (by default a thousand to a
+million), ``repeat`` prefixes of one to three letters of known terms are
+looked up by scanning and with the prefix index, a page of
+:data:`deformdemo.suggestions.DEFAULT_LIMIT` suggestions each.  As many
+misspelt terms and parts of terms are looked up with the trigram index.
+Letters are as frequent in the words as in English text, so that some
+trigrams are in many more words than others, as in real vocabularies.
+The time taken to build each index, its approximate size in MiB and the
+p50 and p99 latencies of each lookup are printed in milliseconds, and
+optionally written as JSON to ``FILE``.
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+
+from deformdemo.bench import summarize
+from deformdemo.bench import write_json
+from deformdemo.suggestions import DEFAULT_LIMIT
+from deformdemo.suggestions import PrefixIndex
+from deformdemo.suggestions import TrigramIndex
+
+
+SIZES = (10**3, 10**4, 10**5, 10**6)
+
+
+#: How often each letter of the alphabet occurs in English text, in percent
+LETTER_FREQUENCIES = (
+    "8.2 1.5 2.8 4.3 12.7 2.2 2.0 6.1 7.0 0.15 0.77 4.0 2.4 6.7 7.5 1.9 "
+    "0.095 6.0 6.3 9.1 2.8 0.98 2.4 0.15 2.0 0.074"
+)
+
+
+def make_terms(size, seed=0):
+    """Return ``size`` random lowercase words, with English letter
+    frequencies."""
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    weights = [float(weight) for weight in LETTER_FREQUENCIES.split()]
+    return [
+        "".join(rng.choices(letters, weights, k=rng.randint(4, 12)))
+        for _ in range(size)
+    ]
+
+
+def scan(terms, prefix, limit=DEFAULT_LIMIT, offset=0):
+    """Look up suggestions as the demo used to, by scanning every term."""
+    matches = [term for term in terms if term.startswith(prefix)]
+    stop = offset + limit
+    return matches[offset:stop]
+
+
+def fuzzy_query(rng, term):
+    """Return a random part of ``term``, or ``term`` with a typo."""
+    if rng.random() < 0.5:
+        start = rng.randint(0, max(len(term) - 4, 0))
+        stop = start + rng.randint(3, 8)
+        return term[start:stop]
+    position = rng.randrange(len(term))
+    typo = rng.choice(string.ascii_lowercase)
+    return term[:position] + typo + term[position:][1:]
+
+
+def _timed_lookups(search, queries):
+    durations = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def run(sizes=SIZES, repeat=200, seed=0):
+    rng = random.Random(seed)
+    results = []
+    for size in sizes:
+        terms = make_terms(size, seed)
+        prefixes = [
+            rng.choice(terms)[: rng.randint(1, 3)] for _ in range(repeat)
+        ]
+        fuzzy = [fuzzy_query(rng, rng.choice(terms)) for _ in range(repeat)]
+        index = PrefixIndex(terms)
+        trigram_index = TrigramIndex(terms)
+        lookups = (
+            ("scan", None, prefixes, lambda q, terms=terms: scan(terms, q)),
+            ("index", index, prefixes, index.search),
+            ("trigram", trigram_index, fuzzy, trigram_index.search),
+        )
+        for name, built, queries, search in lookups:
+            result = summarize(_timed_lookups(search, queries))
+            result.update(
+                source=name,
+                size=size,
+                build_ms=built.build_time * 1000 if built else 0.0,
+                index_mib=built.size() / (1024.0 * 1024.0) if built else 0.0,
+            )
+            results.append(result)
+        del index, trigram_index
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma-separated sizes of the vocabularies",
+    )
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run(sizes, args.repeat)
+    print(
+        "%-7s %9s %10s %8s %9s %9s"
+        % ("source", "size", "build", "MiB", "p50", "p99")
+    )
+    for result in results:
+        print(
+            "%-7s %9d %10.1f %8.1f %9.3f %9.3f"
+            % (
+                result["source"],
+                result["size"],
+                result["build_ms"],
+                result["index_mib"],
+                result["p50_ms"],
+                result["p99_ms"],
+            )
+        )
+    if args.output:
+        write_json(results, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
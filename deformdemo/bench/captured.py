@@ -0,0 +1,113 @@
+"""Compare rendering the "Captured submission" panel in full, as the demos
+used to, and through a :class:`deformdemo.captured.CaptureRenderer`.
+
+Usage::
+
+    python -m deformdemo.bench.captured [--sizes N,N,...] [--repeat N]
+        [--output FILE]
+
+Submissions of each size (by default ten to five thousand items) are made
+up in two shapes: a sequence of mappings, as ``sequence_of_mappings``
+captures, and CSV rows, as ``textareacsv`` captures.  Each is rendered
+``repeat`` times by pretty-printing and highlighting all of it (``full``)
+and with the default bounds (``bounded``).  The size of the HTML in KiB
+and the p50 and p99 render times in milliseconds are printed, and
+optionally written as JSON to ``FILE``.
+"""
+
+import argparse
+import decimal
+from functools import partial
+import pprint
+import sys
+
+from pygments import highlight
+from pygments.lexers import PythonLexer
+
+from deformdemo.bench import summarize
+from deformdemo.bench import timed
+from deformdemo.bench import write_json
+from deformdemo.captured import CaptureRenderer
+from deformdemo.captured import formatter
+
+
+SIZES = (10, 100, 1000, 5000)
+
+
+def make_submissions(size):
+    """Return made up submissions of ``size`` items, by shape."""
+    return {
+        "mappings": {
+            "people": [
+                {"name": "Person %d" % number, "age": 20 + number % 50}
+                for number in range(size)
+            ]
+        },
+        "csv": {
+            "csv": [
+                (number, "hello", decimal.Decimal("4.5"))
+                for number in range(size)
+            ]
+        },
+    }
+
+
+def render_full(value):
+    """Render the panel as the demos used to."""
+    return highlight(pprint.pformat(value), PythonLexer(), formatter)
+
+
+def run(sizes=SIZES, repeat=20):
+    bounded = CaptureRenderer()
+    renderers = (("full", render_full), ("bounded", bounded.render))
+    results = []
+    for size in sizes:
+        for shape, value in sorted(make_submissions(size).items()):
+            for name, render in renderers:
+                html = render(value)
+                result = summarize(timed(partial(render, value), repeat))
+                result.update(
+                    renderer=name,
+                    shape=shape,
+                    size=size,
+                    html_kib=len(html.encode("utf-8")) / 1024.0,
+                )
+                results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma-separated numbers of items of the submissions",
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run(sizes, args.repeat)
+    print(
+        "%-8s %-8s %6s %10s %9s %9s"
+        % ("renderer", "shape", "size", "KiB", "p50", "p99")
+    )
+    for result in results:
+        print(
+            "%-8s %-8s %6d %10.1f %9.3f %9.3f"
+            % (
+                result["renderer"],
+                result["shape"],
+                result["size"],
+                result["html_kib"],
+                result["p50_ms"],
+                result["p99_ms"],
+            )
+        )
+    if args.output:
+        write_json(results, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
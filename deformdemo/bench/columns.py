@@ -0,0 +1,114 @@
+"""Compare deserializing CSV rows one cell at a time, as colander does, and
+a column at a time, through a :class:`deformdemo.columns.ColumnSequence`.
+
+Usage::
+
+    python -m deformdemo.bench.columns [--sizes N,N,...] [--repeat N]
+        [--output FILE]
+
+The schema is the ``Row`` of the ``widget_adapter`` and
+``textareacsv_streaming`` demos (``Integer``, ``String`` and ``Decimal``
+columns).  Rows of each size
+(by default a thousand to a hundred thousand) are made up as the CSV
+parser gives them, all of them valid (``valid``), or with a malformed
+number in every hundredth row (``errors``).  Both ways give the same
+appstruct and errors, which is checked first; each is then timed
+``repeat`` times.  The p50 and p99 times in milliseconds are printed, and
+optionally written as JSON to ``FILE``.
+"""
+
+import argparse
+from functools import partial
+import sys
+
+import colander
+
+from deformdemo.bench import summarize
+from deformdemo.bench import timed
+from deformdemo.bench import write_json
+from deformdemo.columns import ColumnSequence
+
+
+SIZES = (1000, 10000, 100000)
+
+
+def make_schema(sequence_type):
+    class Row(colander.TupleSchema):
+        first = colander.SchemaNode(colander.Integer())
+        second = colander.SchemaNode(colander.String())
+        third = colander.SchemaNode(colander.Decimal())
+
+    return colander.SchemaNode(sequence_type(), Row())
+
+
+def make_rows(size):
+    """Return made up CSV rows of ``size`` rows, by shape."""
+    valid = [[str(number), "hello", "4.5"] for number in range(size)]
+    errors = [
+        [str(number) if number % 100 else "x%d" % number, "hello", "4.5"]
+        for number in range(size)
+    ]
+    return {"valid": valid, "errors": errors}
+
+
+def deserialize(schema, rows):
+    try:
+        return schema.deserialize(rows), None
+    except colander.Invalid as e:
+        return None, e.asdict()
+
+
+def run(sizes=SIZES, repeat=5):
+    schemas = (
+        ("per-node", make_schema(colander.Sequence)),
+        ("columns", make_schema(ColumnSequence)),
+    )
+    results = []
+    for size in sizes:
+        for shape, rows in sorted(make_rows(size).items()):
+            expected = deserialize(schemas[0][1], rows)
+            for name, schema in schemas:
+                if deserialize(schema, rows) != expected:
+                    raise AssertionError(
+                        "%s deserializes %d %s rows differently"
+                        % (name, size, shape)
+                    )
+                result = summarize(
+                    timed(partial(deserialize, schema, rows), repeat)
+                )
+                result.update(path=name, shape=shape, size=size)
+                results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma-separated numbers of rows",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run(sizes, args.repeat)
+    print("%-8s %-6s %7s %10s %10s" % ("path", "shape", "rows", "p50", "p99"))
+    for result in results:
+        print(
+            "%-8s %-6s %7d %10.3f %10.3f"
+            % (
+                result["path"],
+                result["shape"],
+                result["size"],
+                result["p50_ms"],
+                result["p99_ms"],
+            )
+        )
+    if args.output:
+        write_json(results, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
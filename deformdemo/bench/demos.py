@@ -0,0 +1,207 @@
+"""Benchmark the server-side cost of every demo.
+
+Usage::
+
+    python -m deformdemo.bench.demos [--repeat N] [--dev] [--output FILE]
+                                     [NAME ...]
+
+Every demo (or only the named ones) is requested ``repeat`` times in each
+of three ways: a GET of the page, a POST of the form filled with values
+that are likely to validate, and a POST of the form with its text fields
+emptied, which usually fails validation.  For each of them, the p50, p95
+and p99 latencies and the throughput are reported, along with whether the
+submissions did validate.  The peak memory allocated while serving one
+cycle of the three requests is measured in a separate pass, so that tracing
+allocations doesn't skew the timings.
+
+The results are printed as a table and, with ``--output``, written as JSON.
+"""
+
+import argparse
+import datetime
+import sys
+import tracemalloc
+
+from deformdemo.bench import get_demos
+from deformdemo.bench import make_app
+from deformdemo.bench import production_settings
+from deformdemo.bench import summarize
+from deformdemo.bench import timed
+from deformdemo.bench import write_json
+
+
+#: Marker of a form that failed validation, in ``deform/templates/form.pt``
+ERROR_MARKER = "There was a problem with your submission"
+
+#: Values of empty text inputs, by ``type`` attribute
+TEXT_VALUES = {
+    "date": datetime.date.today().isoformat(),
+    "time": "12:30",
+    "email": "user@example.com",
+    "url": "http://example.com/",
+    "password": "password1",
+    "color": "#336699",
+}
+
+#: Values of other empty text inputs, by a part of their name
+NAME_VALUES = (
+    ("email", "user@example.com"),
+    ("year", str(datetime.date.today().year)),
+    ("month", "5"),
+    ("day", "6"),
+)
+
+
+def _text_value(field):
+    value = TEXT_VALUES.get(field.attrs.get("type"))
+    if value is None:
+        name = field.name or ""
+        value = next((v for key, v in NAME_VALUES if key in name), "1")
+    return value
+
+
+def _fill(form):
+    """Fill the empty fields of a :class:`webtest.forms.Form`."""
+    for fields in form.fields.values():
+        for field in fields:
+            kind = field.__class__.__name__
+            if kind == "Checkbox":
+                field.checked = True
+            elif kind in ("Select", "MultipleSelect", "Radio"):
+                values = [value for value, _, _ in field.options if value]
+                if values and not field.value:
+                    field.value = (
+                        values[:1] if kind == "MultipleSelect" else values[0]
+                    )
+            elif kind == "File":
+                field.value = ("upload.txt", b"deformdemo")
+            elif kind in ("Text", "Textarea", "Field", "Email"):
+                if not field.value:
+                    field.value = _text_value(field)
+
+
+def _empty(form):
+    """Empty the text fields of a :class:`webtest.forms.Form`."""
+    for fields in form.fields.values():
+        for field in fields:
+            if field.__class__.__name__ in ("Text", "Textarea", "Field"):
+                field.value = ""
+
+
+def _submit_button(form):
+    for name, fields in form.fields.items():
+        if any(f.__class__.__name__ == "Submit" for f in fields):
+            return name
+    return None
+
+
+def prepare(app, path):
+    """Return the request functions of the cycle of the demo at ``path``:
+    a GET, and the valid and invalid POSTs when the page has a form."""
+
+    def get():
+        return app.get(path)
+
+    requests = {"get": get}
+    page = get()
+    if not page.forms:
+        return requests
+    button = _submit_button(page.forms[0])
+    if button is None:
+        return requests
+
+    for kind, change in (("valid_post", _fill), ("invalid_post", _empty)):
+        # each submission is built from a page of its own, so that the two
+        # don't share field objects
+        form = get().forms[0]
+        change(form)
+
+        def post(form=form):
+            return form.submit(button, expect_errors=True)
+
+        requests[kind] = post
+    return requests
+
+
+def run(app, names=None, repeat=20):
+    results = []
+    for demo in get_demos(app):
+        if names and demo.name not in names:
+            continue
+        path = "/%s/" % demo.name
+        result = {"name": demo.name, "title": demo.title}
+        try:
+            requests = prepare(app, path)
+            for kind, request in requests.items():
+                response = request()
+                stats = summarize(timed(request, repeat))
+                stats["status"] = response.status_int
+                if kind != "get":
+                    stats["validated"] = ERROR_MARKER not in response.text
+                result[kind] = stats
+
+            tracemalloc.start()
+            for request in requests.values():
+                request()
+            result["peak_memory_kib"] = (
+                tracemalloc.get_traced_memory()[1] / 1024
+            )
+            tracemalloc.stop()
+        except Exception as e:
+            tracemalloc.stop()
+            result["error"] = "%s: %s" % (e.__class__.__name__, e)
+        results.append(result)
+    return results
+
+
+def _max_rss_kib():
+    try:
+        import resource
+    except ImportError:  # pragma: no cover (not on Windows)
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="only run these demos")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--dev", action="store_true", help="configure the app as demo.ini"
+    )
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(make_app(dev=args.dev), args.names, args.repeat)
+
+    print(
+        "%-45s %8s %8s %8s %8s"
+        % ("demo", "GET p50", "valid", "invalid", "KiB")
+    )
+    for result in results:
+        if "error" in result:
+            print("%-45s %s" % (result["name"], result["error"]))
+            continue
+        cells = []
+        for kind in ("get", "valid_post", "invalid_post"):
+            stats = result.get(kind)
+            cells.append("%8.2f" % stats["p50_ms"] if stats else "%8s" % "-")
+        print(
+            "%-45s %s %8.0f"
+            % (result["name"], " ".join(cells), result["peak_memory_kib"])
+        )
+
+    if args.output:
+        write_json(
+            {
+                "settings": {} if args.dev else production_settings,
+                "repeat": args.repeat,
+                "max_rss_kib": _max_rss_kib(),
+                "demos": results,
+            },
+            args.output,
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Compare the cost of each demo page with and without the form cache.
+
+Usage::
+
+    python -m deformdemo.bench.forms [--repeat N] [--output FILE] [NAME ...]
+
+For every demo (or only the named ones), the page is requested ``repeat``
+times with an empty form cache (cold: the schema and form are built for
+every request) and ``repeat`` times with a warm one (cached: each request
+only copies the cached form).  Mean request times are printed in
+milliseconds, and optionally written as JSON to ``FILE``.
+"""
+
+import argparse
+import sys
+
+from deformdemo.bench import get_demos
+from deformdemo.bench import make_app
+from deformdemo.bench import mean
+from deformdemo.bench import timed
+from deformdemo.bench import write_json
+from deformdemo.formcache import FormCache
+
+
+def run(app, names=None, repeat=20):
+    registry = app.app.registry
+    results = []
+    for demo in get_demos(app):
+        if names and demo.name not in names:
+            continue
+        path = "/%s/" % demo.name
+        # the first request compiles templates and highlights the code
+        app.get(path)
+
+        def cold(path=path):
+            registry.deformdemo_forms = FormCache()
+            app.get(path)
+
+        def cached(path=path):
+            app.get(path)
+
+        cold_times = timed(cold, repeat)
+        cached_times = timed(cached, repeat)
+        results.append(
+            {
+                "name": demo.name,
+                "cold_ms": mean(cold_times) * 1000,
+                "cached_ms": mean(cached_times) * 1000,
+            }
+        )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="only run these demos")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(make_app(), args.names, args.repeat)
+    print("%-50s %9s %9s %8s" % ("demo", "cold ms", "cached ms", "saved"))
+    for result in results:
+        saved = 1 - result["cached_ms"] / result["cold_ms"]
+        print(
+            "%-50s %9.2f %9.2f %7.0f%%"
+            % (
+                result["name"],
+                result["cold_ms"],
+                result["cached_ms"],
+                100 * saved,
+            )
+        )
+    if args.output:
+        write_json(results, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
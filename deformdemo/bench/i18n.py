@@ -0,0 +1,217 @@
+"""Compare translating the terms of widget templates through the localizer
+of the current request, looked up for every term, and through a
+:class:`deformdemo.translation.WidgetTranslator`.
+
+Usage::
+
+    python -m deformdemo.bench.i18n [--sizes N,N,...] [--repeat N]
+        [--output FILE]
+
+The form is a sequence of items (by default ten to five hundred of them)
+made of the translated fields of the ``i18n`` and ``sequence_of_i18n``
+demos.  It is rendered in each of the ``available_languages`` of
+``demo.ini``, filled in (``form``) and after a submission whose every item
+is invalid (``errors``), ``repeat`` times for each translator, each time as
+a new request.  The p50 and p99 render times in milliseconds are printed,
+and optionally written as JSON to ``FILE``.
+"""
+
+import argparse
+import datetime
+from functools import partial
+import sys
+
+import colander
+from pyramid.i18n import TranslationStringFactory
+from pyramid.i18n import get_localizer
+from pyramid.request import Request
+from pyramid.threadlocal import get_current_request
+from pyramid.threadlocal import manager
+
+import deform
+
+from deformdemo.bench import make_app
+from deformdemo.bench import summarize
+from deformdemo.bench import timed
+from deformdemo.bench import write_json
+from deformdemo.translation import get_widget_translator
+
+
+_ = TranslationStringFactory("deformdemo")
+
+SIZES = (10, 100, 500)
+LANGUAGES = ("en", "de", "nl", "ru", "es")
+
+
+def translate_per_term(term):
+    """Translate ``term`` as the demos used to."""
+    return get_localizer(get_current_request()).translate(term)
+
+
+def make_form(renderer):
+    minmax = {"min": 1, "max": 10}
+
+    class Item(colander.Schema):
+        number = colander.SchemaNode(
+            colander.Integer(),
+            title=_("A number between ${min} and ${max}", mapping=minmax),
+            description=_(
+                "A number between ${min} and ${max}", mapping=minmax
+            ),
+            validator=colander.Range(1, 10),
+        )
+        date = colander.SchemaNode(
+            colander.Date(),
+            title=_("Event date"),
+            validator=colander.Range(
+                min=datetime.date(2010, 5, 5),
+                min_err=_("${val} is earlier than earliest date ${min}"),
+            ),
+        )
+        text = colander.SchemaNode(
+            colander.String(), description=_("Enter some text")
+        )
+
+    class Items(colander.SequenceSchema):
+        item = Item()
+
+    class Schema(colander.Schema):
+        dates = Items(title=_("Dates"))
+
+    return deform.Form(
+        Schema(),
+        buttons=[deform.Button("submit", _("Submit"))],
+        renderer=renderer,
+    )
+
+
+def make_controls(size):
+    """Return the controls of a submission of ``size`` invalid items."""
+    controls = [("__start__", "dates:sequence")]
+    for number in range(size):
+        controls.extend(
+            [
+                ("__start__", "item:mapping"),
+                ("number", str(number + 20)),
+                ("date", "2001-01-01"),
+                ("text", "Text #%d" % number),
+                ("__end__", "item:mapping"),
+            ]
+        )
+    controls.append(("__end__", "dates:sequence"))
+    return controls
+
+
+def render(registry, translator, language, form, appstruct, controls):
+    # render the form as a new request in ``language`` would
+    request = Request.blank("/", {"_LOCALE_": language})
+    request.registry = registry
+    manager.push({"request": request, "registry": registry})
+    if translator is not None:
+        translator.begin(request)
+    try:
+        if controls is None:
+            return form.render(appstruct)
+        try:
+            form.validate(controls)
+        except deform.ValidationFailure as e:
+            return e.render()
+        raise AssertionError("the submission is valid")
+    finally:
+        if translator is not None:
+            translator.end()
+        manager.pop()
+
+
+def run(sizes=SIZES, repeat=10, languages=LANGUAGES):
+    app = make_app()
+    registry = app.app.registry
+    translator = get_widget_translator(registry)
+    renderer = deform.Form.default_renderer
+    per_term = deform.ZPTRendererFactory(
+        renderer.loader.search_path,
+        auto_reload=False,
+        translator=translate_per_term,
+    )
+    translators = (
+        ("per-term", per_term, None),
+        ("cached", renderer, translator),
+    )
+    results = []
+    for size in sizes:
+        appstruct = {
+            "dates": [
+                {
+                    "number": 5,
+                    "date": datetime.date(2011, 1, 1),
+                    "text": "Text #%d" % number,
+                }
+                for number in range(size)
+            ]
+        }
+        shapes = (("form", None), ("errors", make_controls(size)))
+        for language in languages:
+            for shape, controls in shapes:
+                outputs = set()
+                for name, renderer, begin in translators:
+                    func = partial(
+                        render,
+                        registry,
+                        begin,
+                        language,
+                        make_form(renderer),
+                        appstruct,
+                        controls,
+                    )
+                    outputs.add(func())
+                    result = summarize(timed(func, repeat))
+                    result.update(
+                        translator=name,
+                        language=language,
+                        shape=shape,
+                        size=size,
+                    )
+                    results.append(result)
+                if len(outputs) != 1:
+                    raise AssertionError(
+                        "the %s %s %d renders differently"
+                        % (language, shape, size)
+                    )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma-separated numbers of items of the form",
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run(sizes, args.repeat)
+    print(
+        "%-10s %-4s %-6s %5s %9s %9s"
+        % ("translator", "lang", "shape", "size", "p50", "p99")
+    )
+    for result in results:
+        print(
+            "%-10s %-4s %-6s %5d %9.3f %9.3f"
+            % (
+                result["translator"],
+                result["language"],
+                result["shape"],
+                result["size"],
+                result["p50_ms"],
+                result["p99_ms"],
+            )
+        )
+    if args.output:
+        write_json(results, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Compare rendering a Select2 widget with every option inlined in the page
+and a :class:`deformdemo.options.RemoteSelect2Widget`, which only renders
+the selected options.
+
+Usage::
+
+    python -m deformdemo.bench.options [--sizes N,N,...] [--repeat N]
+        [--output FILE]
+
+For option lists of each size (by default a thousand to fifty thousand),
+a form with one selected option is rendered ``repeat`` times with each
+widget.  The size of the rendered HTML in KiB and the p50 and p99 render
+times in milliseconds are printed, along with the p50 and p99 latencies of
+looking up a page of options as the remote widget does, and optionally
+written as JSON to ``FILE``.
+"""
+
+import argparse
+from functools import partial
+import random
+import sys
+
+import colander
+
+import deform
+
+from deformdemo.bench import make_app
+from deformdemo.bench import summarize
+from deformdemo.bench import timed
+from deformdemo.bench import write_json
+from deformdemo.options import OptionIndex
+from deformdemo.options import RemoteSelect2Widget
+from deformdemo.options import demo_options
+
+
+SIZES = (10**3, 10**4, 5 * 10**4)
+
+
+def make_form(widget):
+    class Schema(colander.Schema):
+        pepper = colander.SchemaNode(colander.String(), widget=widget)
+
+    return deform.Form(Schema(), buttons=("submit",))
+
+
+def _search(options, queries):
+    return options.search(next(queries))
+
+
+def run(sizes=SIZES, repeat=50, seed=0):
+    # configures the renderer of widget templates
+    make_app()
+    rng = random.Random(seed)
+    results = []
+    for size in sizes:
+        choices = list(demo_options(size))
+        options = OptionIndex(choices)
+        appstruct = {"pepper": rng.choice(choices)[0]}
+        widgets = (
+            ("inline", deform.widget.Select2Widget(values=choices)),
+            (
+                "remote",
+                RemoteSelect2Widget(
+                    values_url="/remote_option_values", options=options
+                ),
+            ),
+        )
+        for name, widget in widgets:
+            form = make_form(widget)
+            html = form.render(appstruct)
+            render = partial(form.render, appstruct)
+            result = summarize(timed(render, repeat))
+            result.update(source=name, size=size, page_kib=len(html) / 1024.0)
+            results.append(result)
+
+        prefixes = [
+            rng.choice(choices)[1][: rng.randint(1, 4)] for _ in range(repeat)
+        ]
+        search = partial(_search, options, iter(prefixes))
+        result = summarize(timed(search, repeat))
+        result.update(source="search", size=size, page_kib=0.0)
+        results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma-separated sizes of the option lists",
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run(sizes, args.repeat)
+    print("%-7s %9s %10s %9s %9s" % ("source", "size", "KiB", "p50", "p99"))
+    for result in results:
+        print(
+            "%-7s %9d %10.1f %9.3f %9.3f"
+            % (
+                result["source"],
+                result["size"],
+                result["page_kib"],
+                result["p50_ms"],
+                result["p99_ms"],
+            )
+        )
+    if args.output:
+        write_json(results, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
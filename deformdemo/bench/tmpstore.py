@@ -0,0 +1,100 @@
+"""Compare the upload stores: in-memory against SQLite.
+
+Usage::
+
+    python -m deformdemo.bench.tmpstore [--repeat N] [--output FILE]
+
+For uploads of 1 KiB, 64 KiB and 1 MiB, each store is timed storing an
+upload, reading it back (body included) and checking that it is there,
+``repeat`` times each.  The p50 and p99 latencies of each operation are
+printed in milliseconds, and optionally written as JSON to ``FILE``.
+"""
+
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+from deformdemo.bench import summarize
+from deformdemo.bench import timed
+from deformdemo.bench import write_json
+from deformdemo.tmpstore import BlobStore
+from deformdemo.tmpstore import MemoryTmpStore
+from deformdemo.tmpstore import SQLiteTmpStore
+
+
+SIZES = (1024, 64 * 1024, 1024 * 1024)
+
+
+def _operations(store, size):
+    body = os.urandom(size)
+    uids = iter(range(10**9))
+
+    def store_upload():
+        uid = "upload-%d" % next(uids)
+        store[uid] = {"fp": io.BytesIO(body), "filename": "f", "size": size}
+        return uid
+
+    uid = store_upload()
+
+    def get():
+        store[uid]["fp"].read()
+
+    def contains():
+        return uid in store
+
+    return {"set": store_upload, "get": get, "contains": contains}
+
+
+def run(repeat=200):
+    directory = tempfile.mkdtemp()
+    stores = {
+        "memory": MemoryTmpStore(max_entries=1000, blobs=BlobStore()),
+        "sqlite": SQLiteTmpStore(
+            os.path.join(directory, "uploads.sqlite"), max_entries=1000
+        ),
+    }
+    results = []
+    try:
+        for size in SIZES:
+            for name, store in stores.items():
+                for operation, func in _operations(store, size).items():
+                    result = summarize(timed(func, repeat))
+                    result.update(store=name, size=size, operation=operation)
+                    results.append(result)
+                store.clear()
+    finally:
+        stores["sqlite"].close()
+        shutil.rmtree(directory)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    print(
+        "%-8s %9s %-9s %9s %9s" % ("store", "size", "operation", "p50", "p99")
+    )
+    for result in results:
+        print(
+            "%-8s %9d %-9s %9.3f %9.3f"
+            % (
+                result["store"],
+                result["size"],
+                result["operation"],
+                result["p50_ms"],
+                result["p99_ms"],
+            )
+        )
+    if args.output:
+        write_json(results, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
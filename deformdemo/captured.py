@@ -0,0 +1,153 @@
+"""The "Captured submission" panel of the demo pages.
+
+A validated submission is pretty-printed and highlighted by a
+:class:`CaptureRenderer`.  Submissions can be arbitrarily large (thousands
+of sequence items, CSV rows or long texts), so the renderer bounds what it
+prints, and only highlights what is small enough for it to be cheap:
+
+``deformdemo.captured.max_depth``
+    Containers nested deeper than this are printed as ``...`` (default: 8).
+
+``deformdemo.captured.max_items``
+    How many items of containers are printed in all; the others are
+    summed up as ``<N more>`` (default: 1000).
+
+``deformdemo.captured.max_bytes``
+    Longer output is cut, and strings longer than half of it are cut too
+    (default: 65536).
+
+``deformdemo.captured.highlight_bytes``
+    Longer output is shown as plain text instead of being highlighted
+    (default: 4096).
+"""
+
+import html
+import pprint
+
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+
+
+formatter = HtmlFormatter(nowrap=True)
+
+
+class Omitted(object):
+    """Stands for what was left out of a captured value.
+
+    It is printed as its ``description``, and sorted after anything else
+    in the dictionaries and sets it ends.
+    """
+
+    def __init__(self, description):
+        self.description = description
+
+    def __repr__(self):
+        return self.description
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+class CaptureRenderer(object):
+    """Render captured submissions as HTML, within bounds."""
+
+    def __init__(
+        self,
+        max_depth=8,
+        max_items=1000,
+        max_bytes=65536,
+        highlight_bytes=4096,
+    ):
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.highlight_bytes = highlight_bytes
+
+    def truncate(self, value):
+        """Return a copy of ``value`` with at most ``max_items`` container
+        items in all, and no string longer than half ``max_bytes``."""
+        return self._truncate(value, 1, [self.max_items])
+
+    def _truncate(self, value, level, budget):
+        if isinstance(value, (str, bytes)):
+            stop = self.max_bytes // 2
+            if len(value) <= stop:
+                return value
+            return Omitted(
+                "%r... <%d more>" % (value[:stop], len(value) - stop)
+            )
+        if level > self.max_depth:
+            # printed as ``...`` by pprint
+            return value
+        kind = value.__class__
+        if kind is dict:
+            items = []
+            for key, item in value.items():
+                if budget[0] <= 0:
+                    break
+                budget[0] -= 1
+                items.append((key, self._truncate(item, level + 1, budget)))
+            result = dict(items)
+            if len(items) < len(value):
+                omitted = Omitted("<%d more>" % (len(value) - len(items)))
+                result[omitted] = Omitted("...")
+            return result
+        if kind in (list, tuple, set, frozenset):
+            items = []
+            for item in value:
+                if budget[0] <= 0:
+                    break
+                budget[0] -= 1
+                items.append(self._truncate(item, level + 1, budget))
+            if len(items) < len(value):
+                items.append(Omitted("<%d more>" % (len(value) - len(items))))
+            return kind(items)
+        return value
+
+    def pformat(self, value):
+        """Return ``value`` pretty-printed, within bounds."""
+        printer = pprint.PrettyPrinter(depth=self.max_depth)
+        output = printer.pformat(self.truncate(value))
+        data = output.encode("utf-8")
+        if len(data) > self.max_bytes:
+            stop = self.max_bytes
+            output = "%s\n<%d more bytes>" % (
+                data[:stop].decode("utf-8", "ignore"),
+                len(data) - stop,
+            )
+        return output
+
+    def render(self, value):
+        """Return the HTML of ``value``: highlighted if it is short enough,
+        plain escaped text otherwise."""
+        output = self.pformat(value)
+        if len(output.encode("utf-8")) <= self.highlight_bytes:
+            return highlight(output, PythonLexer(), formatter)
+        return html.escape(output, quote=False) + "\n"
+
+
+def capture_renderer_from_settings(settings):
+    """Return the :class:`CaptureRenderer` configured by application
+    settings."""
+    prefix = "deformdemo.captured."
+    return CaptureRenderer(
+        int(settings.get(prefix + "max_depth", 8)),
+        int(settings.get(prefix + "max_items", 1000)),
+        int(settings.get(prefix + "max_bytes", 65536)),
+        int(settings.get(prefix + "highlight_bytes", 4096)),
+    )
+
+
+def get_capture_renderer(registry):
+    """Return the :class:`CaptureRenderer` of a Pyramid registry."""
+    renderer = getattr(registry, "deformdemo_capture_renderer", None)
+    if renderer is None:
+        settings = registry.settings or {}
+        renderer = registry.deformdemo_capture_renderer = (
+            capture_renderer_from_settings(settings)
+        )
+    return renderer
@@ -0,0 +1,226 @@
+"""Deserializing sequences of rows a column at a time, for CSV pastes.
+
+colander deserializes a sequence of tuples one cell at a time: each cell
+goes through the ``deserialize`` of its node, and each row through the
+``Tuple`` type of its own.  :class:`ColumnSequence` converts whole columns
+instead: a column of ``Integer``, ``Float`` or ``Decimal`` cells by mapping
+the number type over it, a column of non-empty ``String`` cells by keeping
+it as is.  Only the cells which don't convert that way (empty or malformed
+ones, or rows of the wrong length) go through colander, so that the result
+and the errors are the ones colander gives; :func:`cell_errors` lists those
+errors by ``(row, column)``.
+"""
+
+import decimal
+from operator import itemgetter
+
+import colander
+
+
+def _string(cell):
+    # colander.String gives colander.null for empty strings, and errors
+    # for what isn't a string
+    if type(cell) is str and cell:
+        return cell
+    raise ValueError("not a non-empty string")
+
+
+def cell_converter(node, cells):
+    """Return a function converting one of ``cells``, a column of ``node``,
+    to what ``node.deserialize`` gives, but raising for the cells which must
+    go through it instead; or ``None`` if all of them must."""
+    if node.preparer is not None or isinstance(
+        node.validator, colander.deferred
+    ):
+        return None
+    typ = node.typ
+    deserialize = type(typ).deserialize
+    if deserialize is colander.Number.deserialize:
+        if (
+            type(typ).num is colander.Decimal.num
+            and typ.quant is None
+            and not typ.normalize
+            and set(map(type, cells)) <= {str}
+        ):
+            # what colander.Decimal.num does to a string
+            return decimal.Decimal
+        return typ.num
+    if (
+        deserialize is colander.String.deserialize
+        and not typ.encoding
+        and not typ.allow_empty
+    ):
+        return _string
+    return None
+
+
+def _deserialize_cell(node, cell, index, values, errors):
+    try:
+        values.append(node.deserialize(cell))
+    except colander.Invalid as e:
+        values.append(None)
+        errors[index] = e
+
+
+def deserialize_column(node, cells):
+    """Return the values of ``cells``, a list of cells of ``node``, and the
+    :class:`colander.Invalid` error of each cell which has one, by index.
+
+    The cells are converted in one pass, and only those which don't convert
+    go through ``node.deserialize``.
+    """
+    values = []
+    errors = {}
+    convert = cell_converter(node, cells)
+    if convert is None:
+        for index, cell in enumerate(cells):
+            _deserialize_cell(node, cell, index, values, errors)
+        return values, errors
+
+    append = values.append
+    remaining = iter(cells)
+    deserialized = set()
+    while True:
+        try:
+            for value in map(convert, remaining):
+                append(value)
+        except Exception:
+            # the cell after those converted so far doesn't convert
+            index = len(values)
+            deserialized.add(index)
+            _deserialize_cell(node, cells[index], index, values, errors)
+        else:
+            break
+    if node.validator is not None:
+        for index, value in enumerate(values):
+            if index not in deserialized:
+                try:
+                    node.validator(node, value)
+                except colander.Invalid as e:
+                    errors[index] = e
+    return values, errors
+
+
+def is_plain_row(node):
+    """Return whether the rows of ``node``, a tuple node, can be
+    deserialized a column at a time."""
+    return (
+        bool(node.children)
+        and type(node.typ).deserialize is colander.Tuple.deserialize
+        and node.preparer is None
+        and not isinstance(node.validator, colander.deferred)
+    )
+
+
+def _split_rows(rows, width):
+    # the positions of the rows holding exactly a cell per column, and of
+    # the others, which go through colander; None for all of them
+    if set(map(type, rows)) <= {list, tuple}:
+        if set(map(len, rows)) <= {width}:
+            return None, []
+    plain = []
+    others = []
+    for position, row in enumerate(rows):
+        if type(row) in (list, tuple) and len(row) == width:
+            plain.append(position)
+        else:
+            others.append(position)
+    return plain, others
+
+
+def deserialize_rows(node, rows):
+    """Deserialize ``rows``, a list of the cstructs of the plain tuple node
+    of the sequence ``node``, a column at a time.
+
+    Return the list of tuples :class:`colander.Sequence` returns, or raise
+    the :class:`colander.Invalid` error it raises.
+    """
+    row_node = node.children[0]
+    width = len(row_node.children)
+    plain, others = _split_rows(rows, width)
+    if plain is None:
+        plain_rows = rows
+    else:
+        plain_rows = [rows[position] for position in plain]
+
+    values = []
+    errors = {}
+    for column, child in enumerate(row_node.children):
+        cells = list(map(itemgetter(column), plain_rows))
+        column_values, column_errors = deserialize_column(child, cells)
+        values.append(column_values)
+        for index, e in column_errors.items():
+            row_error = errors.get(index)
+            if row_error is None:
+                row_error = errors[index] = colander.Invalid(row_node)
+            row_error.add(e, column)
+    results = list(zip(*values))
+    if row_node.validator is not None:
+        for index, result in enumerate(results):
+            if index not in errors:
+                try:
+                    row_node.validator(row_node, result)
+                except colander.Invalid as e:
+                    errors[index] = e
+    if plain is not None:
+        errors = {plain[index]: e for index, e in errors.items()}
+
+    others_results = {}
+    for position in others:
+        row = rows[position]
+        if row is colander.drop or (
+            row is colander.null and row_node.missing is colander.drop
+        ):
+            continue
+        try:
+            others_results[position] = row_node.deserialize(row)
+        except colander.Invalid as e:
+            errors[position] = e
+    if errors:
+        error = colander.Invalid(node)
+        for position in sorted(errors):
+            error.add(errors[position], position)
+        raise error
+    if not others:
+        return results
+
+    # the rows which went through colander, in their place
+    outcomes = dict(zip(plain, results))
+    outcomes.update(others_results)
+    return [
+        outcomes[position]
+        for position in sorted(outcomes)
+        if outcomes[position] is not colander.drop
+    ]
+
+
+class ColumnSequence(colander.Sequence):
+    """A :class:`colander.Sequence` deserializing its tuples a column at a
+    time, when they are plain tuples (see :func:`is_plain_row`)."""
+
+    def deserialize(self, node, cstruct, accept_scalar=None):
+        if cstruct is colander.null or not is_plain_row(node.children[0]):
+            return colander.Sequence.deserialize(
+                self, node, cstruct, accept_scalar
+            )
+        if accept_scalar is None:
+            accept_scalar = self.accept_scalar
+        rows = self._validate(node, cstruct, accept_scalar)
+        return deserialize_rows(node, rows)
+
+
+def cell_errors(row_errors):
+    """Yield the ``(row, column)`` and the message of each error of
+    ``row_errors``, the errors of the rows of a sequence of tuples;
+    ``column`` is ``None`` for the errors of whole rows."""
+    for row_error in row_errors:
+        if row_error.msg is not None:
+            yield (row_error.pos, None), _message(row_error)
+        for e in row_error.children:
+            yield (row_error.pos, e.pos), _message(e)
+
+
+def _message(error):
+    if error.msg is None:
+        return str(error)
+    return "; ".join(colander.interpolate(error.messages()))
@@ -0,0 +1,205 @@
+"""Editing sequences of rows as CSV text, for large pastes.
+
+Deform's CSV widgets, and the ``SequenceToTextWidgetAdapter`` of the
+``widget_adapter`` demo, used to copy the submitted text into a
+``StringIO`` (four bytes per character), parse all of it into a list, and
+dump the rows again through another ``StringIO`` to render the form.  With
+a paste of a hundred thousand rows, each of those copies weighs megabytes.
+
+The helpers of this module parse the text one line at a time, straight out
+of the submitted string, into the rows handed to colander.  The submitted
+text is kept on the field and rendered again as is when it is what writing
+the rows to render would give (browsers submit textareas with ``\r\n``
+line endings, as :mod:`csv` writes them), and only :data:`MAX_ERRORS` line
+errors are listed under the field.
+"""
+
+import csv
+import itertools
+import re
+
+import colander
+
+import deform
+
+from deformdemo.columns import cell_errors
+
+
+#: How many line errors are listed under a field
+MAX_ERRORS = 20
+
+
+_LINE = re.compile(r"[^\n]*\n|[^\n]+")
+
+
+def iter_lines(text, chunk_size=65536):
+    """Yield the lines of ``text``, with their line endings.
+
+    Lines are split out of about ``chunk_size`` characters of the text at a
+    time, so that only one chunk of them is held at once.
+    """
+    start = 0
+    length = len(text)
+    while start < length:
+        stop = text.find("\n", start + chunk_size) + 1 or length
+        yield from _LINE.findall(text, start, stop)
+        start = stop
+
+
+def iter_rows(field, text, **fmtparams):
+    """Yield the rows of the CSV ``text`` of ``field``, as lists of
+    strings.
+
+    A malformed row raises :class:`colander.Invalid` for the field.
+    """
+    reader = csv.reader(iter_lines(text), **fmtparams)
+    try:
+        for row in reader:
+            yield row
+    except csv.Error as e:
+        raise colander.Invalid(
+            field.schema, "line %d: %s" % (reader.line_num, e)
+        )
+
+
+class _Chunks(list):
+    # a file for csv.writer, keeping what it writes as a list of strings
+    write = list.append
+
+
+def write_rows(rows, **fmtparams):
+    """Return ``rows`` as CSV text."""
+    chunks = _Chunks()
+    csv.writer(chunks, **fmtparams).writerows(rows)
+    return "".join(chunks)
+
+
+def same_rows(text, rows, batch_size=1000, **fmtparams):
+    """Return whether writing ``rows`` as CSV gives ``text`` back, but for
+    the line ending of its last row.
+
+    The rows are written and compared ``batch_size`` at a time, so that
+    they are never written out in full.
+    """
+    chunks = _Chunks()
+    writer = csv.writer(chunks, **fmtparams)
+    rows = iter(rows)
+    position = 0
+    ended = False
+    while True:
+        writer.writerows(itertools.islice(rows, batch_size))
+        if not chunks:
+            break
+        if ended:
+            return False
+        written = "".join(chunks)
+        del chunks[:]
+        if not text.startswith(written, position):
+            # the text may lack the line ending of its last row
+            written = written.rstrip("\r\n")
+            if not text.startswith(written, position):
+                return False
+            ended = True
+        position += len(written)
+    return not text[position:].strip("\r\n")
+
+
+def serialize_rows(field, cstruct, **fmtparams):
+    """Return the CSV text rendering ``cstruct``, a sequence of rows: the
+    text submitted for ``field`` if writing those rows gives it back,
+    otherwise the rows written again."""
+    text = getattr(field, "submitted_text", None)
+    if text is not None:
+        if not isinstance(cstruct, (list, tuple)):
+            # the text couldn't be parsed
+            return text
+        if same_rows(text, cstruct, **fmtparams):
+            return text
+    if cstruct is colander.null:
+        cstruct = []
+    return write_rows(cstruct, **fmtparams)
+
+
+def line_errors(field, error, max_errors=MAX_ERRORS):
+    """Set the error of ``field`` to ``error``, listing the errors of its
+    first ``max_errors`` lines, by line and column, when it has no message
+    of its own."""
+    if error.msg:
+        field.error = error
+        return
+    shown = error.children[:max_errors]
+    msgs = []
+    for (row, column), msg in cell_errors(shown):
+        if column is None:
+            msgs.append("line %d: %s" % (row + 1, msg))
+        else:
+            msgs.append("line %d, column %d: %s" % (row + 1, column + 1, msg))
+    more = len(error.children) - len(shown)
+    if more:
+        msgs.append("(%d more lines with errors)" % more)
+    field.error = colander.Invalid(field.schema, "\n".join(msgs))
+
+
+class StreamingTextAreaCSVWidget(deform.widget.TextAreaCSVWidget):
+    """A :class:`deform.widget.TextAreaCSVWidget` parsing its rows one line
+    at a time, and rendering the submitted text again as is."""
+
+    def _fmtparams(self):
+        return {
+            "delimiter": self.delimiter,
+            "quotechar": self.quotechar,
+            "quoting": self.quoting,
+        }
+
+    def serialize(self, field, cstruct, **kw):
+        textrows = getattr(field, "unparseable", None)
+        if textrows is None:
+            textrows = serialize_rows(field, cstruct, **self._fmtparams())
+        readonly = kw.get("readonly", self.readonly)
+        template = readonly and self.readonly_template or self.template
+        values = self.get_template_values(field, textrows, kw)
+        return field.renderer(template, **values)
+
+    def deserialize(self, field, pstruct):
+        if pstruct is colander.null:
+            return colander.null
+        if not isinstance(pstruct, str):
+            raise colander.Invalid(field.schema, "Pstruct is not a string")
+        if not pstruct.strip():
+            return colander.null
+        field.submitted_text = pstruct
+        return list(iter_rows(field, pstruct, **self._fmtparams()))
+
+    def handle_error(self, field, error):
+        line_errors(field, error)
+
+
+class StreamingTextInputCSVWidget(deform.widget.TextInputCSVWidget):
+    """A :class:`deform.widget.TextInputCSVWidget` parsing only the first
+    line of what was submitted, and rendering it again as is."""
+
+    def serialize(self, field, cstruct, **kw):
+        textrow = getattr(field, "unparseable", None)
+        if textrow is None:
+            if cstruct is colander.null:
+                cstruct = ()
+            textrow = serialize_rows(field, [cstruct]).strip()
+        readonly = kw.get("readonly", self.readonly)
+        template = readonly and self.readonly_template or self.template
+        values = self.get_template_values(field, textrow, kw)
+        return field.renderer(template, **values)
+
+    def deserialize(self, field, pstruct):
+        if pstruct is colander.null:
+            return colander.null
+        if not isinstance(pstruct, str):
+            raise colander.Invalid(field.schema, "Pstruct is not a string")
+        if not pstruct.strip():
+            return colander.null
+        try:
+            row = next(iter_rows(field, pstruct))
+        except colander.Invalid:
+            field.unparseable = pstruct
+            raise
+        field.submitted_text = pstruct
+        return row
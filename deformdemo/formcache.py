@@ -0,0 +1,84 @@
+"""A cache of built forms, so demo views don't rebuild them per request.
+
+Declaring a schema and wrapping it in a :class:`deform.Form` builds a whole
+tree of schema nodes, fields and widgets.  A demo view instead hands a
+``make_form`` function to :meth:`FormCache.get`; the form it returns is
+built once per distinct set of arguments, and each request receives a
+cheap copy of it which it is free to validate and render.
+
+Forms whose shape depends on the request itself (``after_bind`` hooks or
+deferred values bound to the request or session) must not go through the
+cache, or must pass everything they depend on as arguments.
+"""
+
+import itertools
+import threading
+import weakref
+
+
+def clone_form(form, next_order):
+    """Return a request-local copy of a cached ``form``.
+
+    Every field is copied shallowly: schema nodes, widgets and buttons are
+    shared, while per-request state (``cstruct``, ``error``, sequence
+    subfields) lands on the copy.  Field orders and ids are kept, and the
+    copies share a fresh counter starting where the original one stopped,
+    so fields cloned later (sequence items) get the same ids as they would
+    in a freshly built form.
+    """
+    return _clone_field(form, itertools.count(next_order), None)
+
+
+def _clone_field(field, counter, parent):
+    cloned = field.__class__.__new__(field.__class__)
+    cloned.__dict__.update(field.__dict__)
+    cloned.counter = counter
+    if parent is not None:
+        cloned._parent = weakref.ref(parent)
+    cloned.children = [
+        _clone_field(child, counter, cloned) for child in field.children
+    ]
+    return cloned
+
+
+def _prepare(field):
+    # widgets are computed lazily (and reified) on first access; compute them
+    # once on the cached form so that its copies share them
+    field.widget
+    for child in field.children:
+        _prepare(child)
+
+
+class FormCache(object):
+    """Forms keyed by the code of the function building them and by the
+    arguments it was called with."""
+
+    #: How many built forms we keep before starting over
+    max_forms = 512
+
+    def __init__(self):
+        self._forms = {}
+        self._lock = threading.Lock()
+
+    def get(self, make_form, *args):
+        """Return a request-local copy of the form built by
+        ``make_form(*args)``."""
+        key = (make_form.__code__, args)
+        cached = self._forms.get(key)
+        if cached is None:
+            form = make_form(*args)
+            _prepare(form)
+            cached = (form, next(form.counter))
+            with self._lock:
+                if len(self._forms) >= self.max_forms:
+                    self._forms.clear()
+                self._forms[key] = cached
+        return clone_form(*cached)
+
+
+def get_form_cache(registry):
+    """Return the :class:`FormCache` of a Pyramid registry."""
+    forms = getattr(registry, "deformdemo_forms", None)
+    if forms is None:
+        forms = registry.deformdemo_forms = FormCache()
+    return forms
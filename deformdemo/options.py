@@ -0,0 +1,216 @@
+"""Large lists of options for the remote Select2 and Selectize demos.
+
+The ``select2`` and ``selectize`` demos render every choice of their widget
+into the page.  With tens of thousands of choices, pages weigh megabytes
+and take long to render.  The remote demos use
+:class:`RemoteSelect2Widget` and :class:`RemoteSelectizeWidget` instead,
+which only render the selected options; the browser searches the others a
+page at a time through the ``remote_option_values`` view, which looks them
+up by a prefix of their label in the :class:`OptionIndex` of the
+application.  Its JSON responses are kept in a
+:class:`deformdemo.suggestions.SuggestionCache`, sized by the
+``deformdemo.autocomplete.cache_size`` and ``max_age`` settings.
+
+``deformdemo.options.file``
+    A UTF-8 CSV file with a ``value,label`` row per option.
+
+``deformdemo.options.count``
+    How many options are made up when no file is configured (default:
+    50000).
+"""
+
+from bisect import bisect_left
+import csv
+import sys
+import time
+
+import colander
+
+import deform
+
+from deformdemo.suggestions import DEFAULT_LIMIT
+from deformdemo.suggestions import PrefixIndex
+from deformdemo.suggestions import SuggestionCache
+from deformdemo.suggestions import _key
+
+
+#: The labels of the options made up when no file is configured
+DEMO_LABELS = (
+    "Habanero",
+    "Jalapeno",
+    "Chipotle",
+    "Serrano",
+    "Poblano",
+    "Cayenne",
+    "Ancho",
+    "Guajillo",
+)
+
+
+def demo_options(count):
+    """Yield ``count`` made up ``(value, label)`` options."""
+    for number in range(count):
+        label = DEMO_LABELS[number % len(DEMO_LABELS)]
+        yield "sku-%06d" % number, "%s #%d" % (label, number)
+
+
+def load_options(filename):
+    """Yield the ``(value, label)`` options of a CSV file, skipping blank
+    rows."""
+    with open(filename, "r", encoding="utf-8", newline="") as f:
+        for row in csv.reader(f):
+            if len(row) >= 2 and row[0]:
+                yield row[0], row[1]
+
+
+class OptionIndex(PrefixIndex):
+    """``(value, label)`` options, looked up by a prefix of their label.
+
+    The labels are sorted as the terms of a :class:`PrefixIndex`, with the
+    value of each option next to its label, and the label of each value is
+    kept in ``labels``, to render the selected options.
+    """
+
+    def __init__(self, options):
+        start = time.perf_counter()
+        # one option per value, the last one wins
+        options = sorted(
+            dict(options).items(),
+            key=lambda option: (option[1].casefold(), option[1], option[0]),
+        )
+        self.values = [value for value, _label in options]
+        self.terms = [label for _value, label in options]
+        self.keys = list(map(_key, self.terms))
+        self.labels = dict(options)
+        self.build_time = time.perf_counter() - start
+
+    @classmethod
+    def from_file(cls, filename):
+        return cls(load_options(filename))
+
+    def __contains__(self, value):
+        return value in self.labels
+
+    def label(self, value):
+        """Return the label of ``value``, or ``None`` if it isn't an
+        option."""
+        return self.labels.get(value)
+
+    def size(self):
+        return (
+            PrefixIndex.size(self)
+            + sys.getsizeof(self.values)
+            + sys.getsizeof(self.labels)
+            + sum(map(sys.getsizeof, self.values))
+        )
+
+    def search(self, prefix, limit=DEFAULT_LIMIT, offset=0):
+        """Return a page of the options whose label starts with ``prefix``,
+        ignoring case, from the ``offset``-th one and at most ``limit`` of
+        them.
+
+        The page is a dictionary of the ``results``, each with the ``id``
+        and ``text`` Select2 expects, and of whether there are ``more``.
+        """
+        key = prefix.casefold()
+        start = bisect_left(self.keys, key) + offset
+        # one more, to tell whether there are more
+        stop = min(start + limit + 1, len(self.keys))
+        results = []
+        for index in range(start, stop):
+            if not self.keys[index].startswith(key):
+                break
+            results.append(
+                {"id": self.values[index], "text": self.terms[index]}
+            )
+        return {"results": results[:limit], "more": len(results) > limit}
+
+
+class KnownOptions(object):
+    """A validator of a value, or of each value of a set, which must be
+    one of ``options``."""
+
+    def __init__(self, options):
+        self.options = options
+
+    def __call__(self, node, value):
+        values = (value,) if isinstance(value, str) else value
+        unknown = sorted(v for v in set(values) if v not in self.options)
+        if unknown:
+            raise colander.Invalid(
+                node, "Unknown option: %s" % ", ".join(unknown)
+            )
+
+
+class RemoteOptionsMixin(object):
+    """Render only the selected options of a select widget.
+
+    The label of each selected value is looked up in ``options``; values
+    which aren't options (tags) are their own label.  The browser searches
+    the other options at ``values_url``, ``page_size`` at a time.
+    """
+
+    values_url = None
+    options = None
+    page_size = DEFAULT_LIMIT
+
+    def selected_options(self, cstruct):
+        if cstruct in (colander.null, None, self.null_value):
+            return []
+        values = cstruct if self.multiple else (cstruct,)
+        if isinstance(values, (set, frozenset)):
+            # keep pages the same from one render to the next
+            values = sorted(values)
+        return [
+            (value, self.options.label(value) or value) for value in values
+        ]
+
+    def serialize(self, field, cstruct, **kw):
+        kw.setdefault("values", self.selected_options(cstruct))
+        return deform.widget.SelectWidget.serialize(self, field, cstruct, **kw)
+
+
+class RemoteSelect2Widget(RemoteOptionsMixin, deform.widget.Select2Widget):
+    """A :class:`deform.widget.Select2Widget` searching its options through
+    the ``ajax`` option of Select2."""
+
+    template = "select2_remote"
+
+
+class RemoteSelectizeWidget(RemoteOptionsMixin, deform.widget.SelectizeWidget):
+    """A :class:`deform.widget.SelectizeWidget` searching its options
+    through the ``load`` option of Selectize."""
+
+    template = "selectize_remote"
+
+
+def options_from_settings(settings):
+    """Return the :class:`OptionIndex` configured by application
+    settings."""
+    filename = settings.get("deformdemo.options.file")
+    if filename:
+        return OptionIndex.from_file(filename)
+    count = int(settings.get("deformdemo.options.count", 50000))
+    return OptionIndex(demo_options(count))
+
+
+def get_options(registry):
+    """Return the :class:`OptionIndex` of a Pyramid registry."""
+    options = getattr(registry, "deformdemo_options", None)
+    if options is None:
+        settings = registry.settings or {}
+        options = registry.deformdemo_options = options_from_settings(settings)
+    return options
+
+
+def get_option_cache(registry):
+    """Return the cache of the JSON responses of the options of a Pyramid
+    registry."""
+    cache = getattr(registry, "deformdemo_option_cache", None)
+    if cache is None:
+        settings = registry.settings or {}
+        cache = registry.deformdemo_option_cache = SuggestionCache(
+            int(settings.get("deformdemo.autocomplete.cache_size", 1024)),
+            int(settings.get("deformdemo.autocomplete.max_age", 60)),
+        )
+    return cache
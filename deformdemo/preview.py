@@ -0,0 +1,106 @@
+"""Previews of the file uploads of the current session.
+
+The ``preview_url`` of an upload (see
+:class:`deformdemo.tmpstore.SessionTmpStore`) points to
+:func:`preview_upload`, which serves its body with the ``mimetype`` it was
+uploaded with.  Responses carry the digest of the body as their ``ETag``,
+so that ``If-None-Match`` is answered with a ``304``, and a single byte
+range can be requested with ``Range``.
+
+Uploads spooled to disk are served from a file of their own, through the
+``wsgi.file_wrapper`` of the server when the whole body is requested, which
+lets the server send it without copying it through Python.
+"""
+
+import io
+
+from pyramid.httpexceptions import HTTPNotFound
+from pyramid.httpexceptions import HTTPNotModified
+from pyramid.httpexceptions import HTTPRequestRangeNotSatisfiable
+from pyramid.response import Response
+from pyramid.view import view_config
+
+from webob.byterange import ContentRange
+from webob.static import FileIter
+
+from deformdemo.tmpstore import CHUNK_SIZE
+from deformdemo.tmpstore import entry_size
+from deformdemo.tmpstore import get_tmpstore
+
+
+def _read_range(fp, start, stop):
+    fp.seek(start)
+    while start < stop:
+        chunk = fp.read(min(CHUNK_SIZE, stop - start))
+        if not chunk:
+            break
+        start += len(chunk)
+        yield chunk
+
+
+def body_iter(request, fp, start, stop):
+    """Return an iterable over bytes ``start`` to ``stop`` of the body read
+    by ``fp``."""
+    path = getattr(fp, "path", None)
+    if path is not None:
+        # spooled: the reader stored with the upload is shared by requests,
+        # open one of our own
+        f = open(path, "rb")
+        file_wrapper = request.environ.get("wsgi.file_wrapper")
+        if file_wrapper is not None and start == 0 and stop == len(fp):
+            return file_wrapper(f, CHUNK_SIZE)
+        return FileIter(f).app_iter_range(start, stop, CHUNK_SIZE)
+    if isinstance(fp, io.BytesIO):
+        # small enough to be kept in memory; read it without moving the
+        # position of the shared reader
+        with fp.getbuffer() as view:
+            return [view[start:stop].tobytes()]
+    return _read_range(fp, start, stop)
+
+
+@view_config(route_name="upload_preview")
+def preview_upload(request):
+    """Serve the body of an upload of the current session."""
+    value = get_tmpstore(request.registry).get(request.matchdict["uid"])
+    fp = None if value is None else value.get("fp")
+    if fp is None:
+        raise HTTPNotFound()
+
+    size = entry_size(value)
+    headers = {
+        # uploads belong to a session: only the browser may keep them, and
+        # it must revalidate them
+        "Cache-Control": "private, no-cache",
+        # uploads are anything their users sent: never run them as pages
+        # of the demo
+        "Content-Security-Policy": "sandbox",
+        "X-Content-Type-Options": "nosniff",
+    }
+    digest = value.get("digest")
+    if digest is not None:
+        headers["ETag"] = '"%s"' % digest
+        if digest in request.if_none_match:
+            return HTTPNotModified(headers=headers)
+
+    headers["Content-Type"] = (
+        value.get("mimetype") or "application/octet-stream"
+    )
+    headers["Accept-Ranges"] = "bytes"
+    response = Response(headers=headers)
+    start, stop = 0, size
+    if request.range is not None and response in request.if_range:
+        byte_range = request.range.range_for_length(size)
+        if byte_range is None:
+            raise HTTPRequestRangeNotSatisfiable(
+                headers={"Content-Range": "bytes */%d" % size}
+            )
+        start, stop = byte_range
+        response.status_int = 206
+        response.content_range = ContentRange(start, stop, size)
+    try:
+        response.app_iter = body_iter(request, fp, start, stop)
+    except FileNotFoundError:
+        # evicted from the store meanwhile
+        raise HTTPNotFound()
+    response.content_length = stop - start
+    return response
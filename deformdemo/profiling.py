@@ -0,0 +1,145 @@
+"""Profiling of single requests, on demand.
+
+With the ``deformdemo.profile_dir`` setting, a tween runs under
+:mod:`cProfile` every request that carries an ``X-Profile: 1`` header or a
+``_profile=1`` query parameter, from one of the addresses listed in the
+``deformdemo.profile_allow`` setting (``127.0.0.1 ::1`` by default).
+
+Behind a reverse proxy every request comes from the address of the proxy,
+so requests carrying an ``X-Forwarded-For`` or ``Forwarded`` header are
+refused, unless they come from one of the proxies listed in the
+``deformdemo.profile_proxies`` setting: the client address is then the
+last one of ``X-Forwarded-For`` which isn't a listed proxy.
+
+The profile is saved as a :mod:`pstats` file in ``profile_dir``, named in
+the ``X-Profile-File`` response header, and the functions which took the
+most time of their own (not counting their callees) are listed in the
+``X-Profile-Top`` header.  Only the latest ``deformdemo.profile_keep``
+profiles (100 by default) are kept.  Other requests
+only pay for looking at a header and the query string; without the setting
+the tween isn't installed at all.
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import time
+import uuid
+
+from pyramid.settings import aslist
+
+
+log = logging.getLogger(__name__)
+
+#: How many functions are listed in ``X-Profile-Top``
+TOP_FUNCTIONS = 5
+
+
+def _wants_profile(request):
+    if request.headers.get("X-Profile") == "1":
+        return True
+    query = request.environ.get("QUERY_STRING", "")
+    return "_profile=" in query and request.GET.get("_profile") == "1"
+
+
+def client_addr(request, proxies=frozenset()):
+    """Return the address of the client of ``request``, through the
+    trusted ``proxies``, or ``None`` if it can't be told."""
+    addr = request.remote_addr
+    headers = request.headers
+    if addr not in proxies:
+        if "X-Forwarded-For" in headers or "Forwarded" in headers:
+            # forwarded by a proxy we don't know of
+            return None
+        return addr
+    forwarded = headers.get("X-Forwarded-For", "").split(",")
+    for addr in reversed(forwarded):
+        addr = addr.strip()
+        if addr not in proxies:
+            return addr or None
+    return None
+
+
+def remove_old_profiles(profile_dir, keep):
+    """Remove all but the latest ``keep`` profiles of ``profile_dir``."""
+    # their names start with the time they were taken
+    names = sorted(
+        name for name in os.listdir(profile_dir) if name.endswith(".pstats")
+    )
+    for name in names[: max(len(names) - keep, 0)]:
+        try:
+            os.remove(os.path.join(profile_dir, name))
+        except OSError:
+            # removed by another process meanwhile
+            pass
+
+
+def top_functions(stats, count=TOP_FUNCTIONS):
+    """Return ``(label, seconds)`` of the ``count`` functions of a
+    :class:`pstats.Stats` which took the most time of their own."""
+    entries = sorted(
+        stats.stats.items(), key=lambda item: item[1][2], reverse=True
+    )
+    result = []
+    for (filename, line, name), (_, _, tottime, _, _) in entries[:count]:
+        label = "%s (%s:%s)" % (name, os.path.basename(filename), line)
+        result.append((label, tottime))
+    return result
+
+
+def profile_tween_factory(handler, registry):
+    settings = registry.settings
+    profile_dir = settings["deformdemo.profile_dir"]
+    allowed = frozenset(
+        aslist(settings.get("deformdemo.profile_allow", "127.0.0.1 ::1"))
+    )
+    proxies = frozenset(aslist(settings.get("deformdemo.profile_proxies", "")))
+    keep = int(settings.get("deformdemo.profile_keep", 100))
+    if not os.path.isdir(profile_dir):
+        os.makedirs(profile_dir)
+
+    def profile_tween(request):
+        if not _wants_profile(request):
+            return handler(request)
+        addr = client_addr(request, proxies)
+        if addr not in allowed:
+            log.warning(
+                "profiling refused to %s (through %s)",
+                addr,
+                request.remote_addr,
+            )
+            return handler(request)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # another profiler is already running in this process
+            log.warning("profiling refused: another profiler is active")
+            return handler(request)
+        try:
+            response = handler(request)
+        finally:
+            profiler.disable()
+
+        now = time.time()
+        filename = "%s-%06d-%s.pstats" % (
+            time.strftime("%Y%m%d-%H%M%S", time.localtime(now)),
+            now % 1 * 1000000,
+            uuid.uuid4().hex[:8],
+        )
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(os.path.join(profile_dir, filename))
+        remove_old_profiles(profile_dir, keep)
+        response.headers["X-Profile-File"] = filename
+        response.headers["X-Profile-Top"] = ", ".join(
+            "%s;self=%.2fms" % (label, tottime * 1000)
+            for label, tottime in top_functions(stats)
+        )
+        log.info(
+            "profiled %s %s into %s", request.method, request.path, filename
+        )
+        return response
+
+    return profile_tween
@@ -0,0 +1,107 @@
+"""A registry of demonstration views, built once at scan time.
+
+The sidebar of every demo page lists every other demo.  Rather than
+introspecting the view class on each request, the :class:`demonstrate`
+decorator records each demo into a :class:`DemoRegistry` hung off the
+Pyramid application registry when ``config.scan`` runs.
+"""
+
+import threading
+
+import venusian
+
+
+class Demo(object):
+    """A single demonstration view."""
+
+    def __init__(self, title, name, route_name, code=None):
+        self.title = title
+        self.name = name
+        self.route_name = route_name
+        self.code = code
+        # widget resources are only known once a form has been built; they
+        # are filled in by the first render of the demo
+        self.resources = None
+
+
+class DemoRegistry(object):
+    """Demos keyed by route name, then by view name."""
+
+    #: How many distinct application URLs we keep sidebar links for
+    max_link_sets = 16
+
+    def __init__(self):
+        self.demos = {}
+        self._links = {}
+        self._lock = threading.Lock()
+
+    def add(self, demo):
+        self.demos.setdefault(demo.route_name, {})[demo.name] = demo
+        self._links.clear()
+
+    def get(self, route_name, name):
+        return self.demos.get(route_name, {}).get(name)
+
+    def by_title(self, route_name):
+        demos = self.demos.get(route_name, {}).values()
+        return sorted(demos, key=lambda demo: (demo.title, demo.name))
+
+    def links(self, request, route_name, context=None):
+        """Return the sorted ``(title, url)`` pairs for the sidebar.
+
+        URLs depend on the host the request came in on, so the list is
+        computed once per application URL and reused afterwards.
+        """
+        key = (route_name, request.application_url)
+        links = self._links.get(key)
+        if links is None:
+            if context is None:
+                context = request.root
+            links = [
+                (
+                    demo.title,
+                    request.resource_url(
+                        context, demo.name, route_name=route_name
+                    ),
+                )
+                for demo in self.by_title(route_name)
+            ]
+            with self._lock:
+                if len(self._links) >= self.max_link_sets:
+                    self._links.clear()
+                self._links[key] = links
+        return links
+
+
+def get_demo_registry(registry):
+    """Return the :class:`DemoRegistry` of a Pyramid registry."""
+    demos = getattr(registry, "deformdemo_demos", None)
+    if demos is None:
+        demos = registry.deformdemo_demos = DemoRegistry()
+    return demos
+
+
+class demonstrate(object):
+    """Mark a view method as a demo with the given title.
+
+    The demo is added to the :class:`DemoRegistry` when the module
+    containing its class is scanned.
+    """
+
+    venusian = venusian  # for testing injection
+
+    def __init__(self, title):
+        self.title = title
+
+    def __call__(self, method):
+        method.demo = self.title
+
+        def callback(context, name, ob):
+            route_name = getattr(ob, "__view_defaults__", {}).get("route_name")
+            demo = Demo(
+                self.title, method.__name__, route_name, code=method.__code__
+            )
+            get_demo_registry(context.config.registry).add(demo)
+
+        self.venusian.attach(method, callback, category="pyramid")
+        return method
@@ -0,0 +1,172 @@
+"""Syntax-highlighted source code of the demo views and modules.
+
+Source code never changes while the process is running, so its highlighted
+HTML is computed once and reused by every later render: per code object for
+the code panel of each demo, and per module for the ``allcode`` view.  The
+``allcode`` page is revalidated through an ETag of the module, the
+templates rendering it and the versions of Deform and Pygments.
+"""
+
+import hashlib
+import inspect
+from io import StringIO
+import re
+
+from pkg_resources import get_distribution
+from pkg_resources import resource_filename
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+
+
+formatter = HtmlFormatter(nowrap=True)
+
+_highlighted = {}
+
+
+def highlight_code(code):
+    """Return ``(html, start, end)`` for a code object.
+
+    ``start`` and ``end`` are the line span of the source, as used by the
+    ``allcode`` view to show the code in context.
+    """
+    result = _highlighted.get(code)
+    if result is None:
+        lines, start = inspect.getsourcelines(code)
+        end = start + len(lines)
+        html = highlight("".join(lines), PythonLexer(), formatter)
+        result = _highlighted[code] = (html, start, end)
+    return result
+
+
+def warm_code_cache(demos):
+    """Highlight the source of every demo in a
+    :class:`deformdemo.registry.DemoRegistry` ahead of the first request."""
+    for route_demos in demos.demos.values():
+        for demo in route_demos.values():
+            if demo.code is not None:
+                highlight_code(demo.code)
+
+
+class HighlightedModule(object):
+    """The highlighted source of a whole module, with line numbers.
+
+    The source is read, lexed and formatted once.  Pages highlighting a
+    range of lines are put together from the lines of that page, wrapping
+    the lines of the range as Pygments' ``hl_lines`` option would.
+    """
+
+    options = {
+        "linenos": "table",
+        "lineanchors": "line",
+        "cssclass": "hightlight ",
+    }
+
+    def __init__(self, filename):
+        with open(filename, "r") as f:
+            source = f.read()
+        self.etag = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        tokens = PythonLexer().get_tokens(source)
+        self._html = self._format(tokens)
+        self._head, self._anchors, self._lines, self._tail = _split_lines(
+            self._html
+        )
+        self._plain = [a + line for a, line in zip(self._anchors, self._lines)]
+
+    def etag_for(self, application_url, start=None, end=None, version=""):
+        """Return a strong ETag for a page showing this module, rendered by
+        templates of the given ``version`` (see :func:`page_version`)."""
+        start, end = self.line_range(start, end)
+        key = "%s|%s|%s|%s|%s" % (
+            self.etag,
+            version,
+            application_url,
+            start,
+            end,
+        )
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _format(self, tokens):
+        formatter = HtmlFormatter(**self.options)
+        outfile = StringIO()
+        formatter.format(tokens, outfile)
+        return outfile.getvalue()
+
+    def line_range(self, start=None, end=None):
+        """Return ``(start, end)`` clamped to the lines of the module, or
+        ``(None, None)`` if no line of the module is in the range."""
+        if not (start and end):
+            return None, None
+        start = max(start, 1)
+        end = min(end, len(self._lines) + 1)
+        if start >= end:
+            return None, None
+        return start, end
+
+    def render(self, start=None, end=None):
+        """Return the HTML of the module, with lines ``start`` up to (but
+        not including) ``end`` highlighted."""
+        start, end = self.line_range(start, end)
+        if start is None:
+            return self._html
+        first, last = start - 1, end - 1
+        highlighted = [
+            '%s<span class="hll">%s</span>' % (anchor, line)
+            for anchor, line in zip(
+                self._anchors[first:last], self._lines[first:last]
+            )
+        ]
+        return "".join(
+            [self._head]
+            + self._plain[:first]
+            + highlighted
+            + self._plain[last:]
+            + [self._tail]
+        )
+
+
+_anchor = re.compile(r'(<a id="line-\d+" name="line-\d+"></a>)')
+
+
+def _split_lines(html):
+    # Pygments escapes "<" in the source, so every anchor starts a line; the
+    # HTML of each line ends with its newline, and the last one is followed
+    # by the end of the table
+    head, *parts = _anchor.split(html)
+    anchors, lines = parts[0::2], parts[1::2]
+    last, newline, tail = lines[-1].partition("\n")
+    lines[-1] = last + newline
+    return head, anchors, lines, tail
+
+
+_modules = {}
+
+
+def get_highlighted_module(filename):
+    """Return the :class:`HighlightedModule` for a source file."""
+    module = _modules.get(filename)
+    if module is None:
+        module = _modules[filename] = HighlightedModule(filename)
+    return module
+
+
+_versions = {}
+
+
+def page_version(templates, reload=False):
+    """Return a digest of what a page of highlighted source depends on
+    besides the source itself: the versions of Deform and Pygments, and
+    the page ``templates`` of this package it is rendered with.
+
+    The digest is computed once per process, unless ``reload`` is true.
+    """
+    version = None if reload else _versions.get(templates)
+    if version is None:
+        digest = hashlib.sha1()
+        for name in ("deform", "pygments"):
+            digest.update(get_distribution(name).version.encode("utf-8"))
+        for template in templates:
+            with open(resource_filename("deformdemo", template), "rb") as f:
+                digest.update(f.read())
+        version = _versions[templates] = digest.hexdigest()
+    return version
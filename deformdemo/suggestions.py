@@ -0,0 +1,442 @@
+"""Sources of suggestions for the remote autocomplete demos.
+
+The ``autocomplete_input_values`` view looks up the ``term`` typed so far in
+the suggestion source of the application, a page of ``limit`` suggestions
+at a time, starting at ``offset``.  Any object with a ``search(term, limit,
+offset)`` method returning a list of strings can be hung on the registry as
+``deformdemo_suggestions``; by default it is a :class:`PrefixIndex` of the
+few words of the demo, or of the terms of a file:
+
+``deformdemo.autocomplete.terms``
+    A UTF-8 text file with one term per line.  The terms are loaded again
+    when it changes (see :class:`ReloadingIndex`).
+
+``deformdemo.autocomplete.fuzzy``
+    If true, use a :class:`TrigramIndex`, which also suggests the terms
+    containing what was typed, or something close to it (default: false).
+    The time taken to build it and its size are logged at startup.
+
+The JSON responses of the view are kept in a :class:`SuggestionCache`, with
+an ``ETag`` to revalidate them and a ``Cache-Control`` header letting
+browsers and proxies keep them:
+
+``deformdemo.autocomplete.cache_size``
+    How many responses are kept (default: 1024).
+
+``deformdemo.autocomplete.max_age``
+    How long browsers and proxies may keep a response, in seconds (default:
+    60).
+"""
+
+from array import array
+from bisect import bisect_left
+import collections
+from concurrent.futures import Future
+import hashlib
+import heapq
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+
+from pyramid.settings import asbool
+
+
+log = logging.getLogger(__name__)
+
+
+#: The terms suggested by the demos when no file of terms is configured
+DEMO_TERMS = ("bar", "baz", "two", "three", "foo & bar", "one < two")
+
+#: How many suggestions are returned when the request doesn't say
+DEFAULT_LIMIT = 10
+
+#: The largest number of suggestions a request may ask for
+MAX_LIMIT = 100
+
+
+def load_terms(filename):
+    """Yield the terms of a file, one per non-blank line."""
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            term = line.strip()
+            if term:
+                yield term
+
+
+class PrefixIndex(object):
+    """Terms sorted by their case-folded form, so that the terms starting
+    with a prefix, whatever its case, are next to each other.
+
+    Looking up a page of ``limit`` terms is a binary search for the first
+    one, O(log n), and a slice of the following ``limit`` keys, O(limit):
+    the terms skipped by ``offset`` are never visited.
+    """
+
+    def __init__(self, terms):
+        start = time.perf_counter()
+        # sorted by term first, so that terms folding to the same key come
+        # in a stable order
+        self.terms = sorted(sorted(set(terms)), key=str.casefold)
+        self.keys = list(map(_key, self.terms))
+        self.build_time = time.perf_counter() - start
+
+    @classmethod
+    def from_file(cls, filename):
+        return cls(load_terms(filename))
+
+    def __len__(self):
+        return len(self.terms)
+
+    def size(self):
+        """Return an estimate of the memory used by the index, in
+        bytes."""
+        size = sys.getsizeof(self.keys) + sys.getsizeof(self.terms)
+        for key, term in zip(self.keys, self.terms):
+            size += sys.getsizeof(term)
+            if key is not term:
+                size += sys.getsizeof(key)
+        return size
+
+    def search(self, prefix, limit=DEFAULT_LIMIT, offset=0):
+        """Return the terms starting with ``prefix``, ignoring case, from
+        the ``offset``-th one and at most ``limit`` of them."""
+        key = prefix.casefold()
+        start = bisect_left(self.keys, key) + offset
+        page = []
+        for index in range(start, min(start + limit, len(self.keys))):
+            if not self.keys[index].startswith(key):
+                break
+            page.append(self.terms[index])
+        return page
+
+
+def trigrams(key, pad_end=True):
+    """Return the set of trigrams of a case-folded ``key``, padded so that
+    its first letters (and last ones, with ``pad_end``) make trigrams of
+    their own."""
+    padded = "  " + key + (" " if pad_end else "")
+    return {a + b + c for a, b, c in zip(padded, padded[1:], padded[2:])}
+
+
+class TrigramIndex(PrefixIndex):
+    """A :class:`PrefixIndex` which also finds terms by their trigrams.
+
+    Terms are scored by the share of the trigrams of what was typed that
+    they contain, so that they match despite typos, or in the middle of a
+    word.  Those scoring less than ``min_score`` are left out, and the
+    others ranked by score, then terms starting with what was typed
+    first, then shorter terms first.  What is shorter than five letters
+    is looked up as a prefix: its trigrams are too common to bound the
+    work of a lookup, and it is seldom a typo yet.
+
+    Each trigram maps to the sorted positions of the terms containing it.
+    A term scoring at least ``min_score`` for ``n`` trigrams contains ``m =
+    ceil(min_score * n)`` of them, hence one of the ``n - m + 1`` trigrams
+    with the fewest terms.  The terms of the trigrams with the fewest terms
+    are counted, as long as they add up to at most ``max_postings``
+    positions; if the ``n - m + 1`` rarest trigrams don't fit, ``m`` is
+    raised so that they do, and the terms suggested share more trigrams of
+    what was typed.  The other trigrams of at most ``max_candidates`` of the
+    terms counted, those sharing the most first, are checked by binary
+    search, until they can no longer reach ``m``.  Lookups whose rarest
+    trigram is in more than ``max_postings`` terms are done as prefixes.
+    """
+
+    #: The shortest lookups done with trigrams
+    min_length = 5
+
+    #: How many positions of terms are counted per lookup at most
+    max_postings = 20000
+
+    #: How many of the terms counted are checked further at most
+    max_candidates = 1000
+
+    def __init__(self, terms, min_score=0.5):
+        start = time.perf_counter()
+        PrefixIndex.__init__(self, terms)
+        self.min_score = min_score
+        postings = {}
+        for position, key in enumerate(self.keys):
+            for gram in trigrams(key):
+                ids = postings.get(gram)
+                if ids is None:
+                    ids = postings[gram] = array("I")
+                ids.append(position)
+        self.postings = postings
+        self.build_time = time.perf_counter() - start
+
+    def size(self):
+        size = PrefixIndex.size(self) + sys.getsizeof(self.postings)
+        for gram, ids in self.postings.items():
+            size += sys.getsizeof(gram) + sys.getsizeof(ids)
+        return size
+
+    def search(self, term, limit=DEFAULT_LIMIT, offset=0):
+        """Return the best ``limit`` terms matching ``term``, from the
+        ``offset``-th one."""
+        key = term.casefold()
+        if len(key) < self.min_length:
+            return PrefixIndex.search(self, term, limit, offset)
+        grams = trigrams(key, pad_end=False)
+        lists = sorted(
+            (self.postings.get(gram, ()) for gram in grams), key=len
+        )
+        counted = total = 0
+        for ids in lists:
+            total += len(ids)
+            if total > self.max_postings:
+                break
+            counted += 1
+        if not counted:
+            return PrefixIndex.search(self, term, limit, offset)
+        needed = max(
+            math.ceil(self.min_score * len(lists)), len(lists) - counted + 1
+        )
+        counts = collections.Counter()
+        for ids in lists[:counted]:
+            counts.update(ids)
+
+        common = lists[counted:]
+        least = needed - len(common)
+        candidates = [item for item in counts.items() if item[1] >= least]
+        max_candidates = self.max_candidates
+        while len(candidates) > max_candidates and least < counted:
+            least += 1
+            candidates = [item for item in candidates if item[1] >= least]
+        del candidates[max_candidates:]
+        ranked = []
+        for position, shared in candidates:
+            left = len(common)
+            for ids in common:
+                if shared + left < needed:
+                    break
+                shared += _contains(ids, position)
+                left -= 1
+            if shared < needed:
+                continue
+            candidate = self.keys[position]
+            ranked.append(
+                (
+                    -shared,
+                    not candidate.startswith(key),
+                    len(candidate),
+                    position,
+                )
+            )
+        best = heapq.nsmallest(offset + limit, ranked)
+        return [self.terms[entry[-1]] for entry in best[offset:]]
+
+
+def _contains(ids, position):
+    index = bisect_left(ids, position)
+    return index < len(ids) and ids[index] == position
+
+
+def _key(term):
+    key = term.casefold()
+    # share the string when folding doesn't change it
+    return term if key == term else key
+
+
+def page_params(params):
+    """Return the ``(limit, offset)`` asked for by request ``params``,
+    clamped to sensible values."""
+    try:
+        limit = int(params.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        limit = DEFAULT_LIMIT
+    try:
+        offset = int(params.get("offset", 0))
+    except ValueError:
+        offset = 0
+    return min(max(limit, 1), MAX_LIMIT), max(offset, 0)
+
+
+class ReloadingIndex(object):
+    """An index of the terms of a file, built again by ``make_index`` when
+    the file changes.
+
+    The file is looked at on lookups, at most every ``check_interval``
+    seconds.  While the new index is built, lookups keep using the former
+    one.  ``generation`` counts the indexes built.
+    """
+
+    def __init__(
+        self, filename, make_index, check_interval=2.0, clock=time.monotonic
+    ):
+        self.filename = filename
+        self.make_index = make_index
+        self.check_interval = check_interval
+        self.clock = clock
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._stamp = self._stat()
+        self.index = make_index(load_terms(filename))
+        self._checked = self.clock()
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def __len__(self):
+        return len(self.index)
+
+    def check(self):
+        """Build the index again if the file changed since it was last
+        built."""
+        now = self.clock()
+        if now - self._checked < self.check_interval:
+            return
+        if not self._lock.acquire(blocking=False):
+            # another thread is on it
+            return
+        try:
+            self._checked = now
+            stamp = self._stat()
+            if stamp is not None and stamp != self._stamp:
+                self.reload(stamp)
+        finally:
+            self._lock.release()
+
+    def reload(self, stamp=None):
+        """Build the index again."""
+        self.index = self.make_index(load_terms(self.filename))
+        self._stamp = stamp or self._stat()
+        self.generation += 1
+        log.info("Loaded %d terms from %s", len(self.index), self.filename)
+
+    def search(self, prefix, limit=DEFAULT_LIMIT, offset=0):
+        self.check()
+        return self.index.search(prefix, limit, offset)
+
+
+class SuggestionCache(object):
+    """The JSON responses of a suggestion source, least recently used out.
+
+    Each lookup is done once for concurrent requests: the first one looks
+    the suggestions up while the others wait for its response.  Responses
+    of a source with a ``generation`` attribute are dropped when it
+    changes.  The ``hits``, ``misses`` and ``coalesced`` counters tell how
+    lookups were answered.
+    """
+
+    def __init__(self, max_entries=1024, max_age=60):
+        self.max_entries = max_entries
+        # how long clients may keep a response, in seconds
+        self.max_age = max_age
+        self.hits = self.misses = self.coalesced = 0
+        self.generation = None
+        # key -> (body, etag), least recently used first
+        self._entries = collections.OrderedDict()
+        # key -> Future of the lookup in progress
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, source, term, limit=DEFAULT_LIMIT, offset=0):
+        """Return the JSON body and the ``ETag`` of the suggestions of
+        ``source`` for a lookup."""
+        if hasattr(source, "check"):
+            source.check()
+        generation = getattr(source, "generation", None)
+        key = (generation, term, limit, offset)
+        owner = False
+        with self._lock:
+            if generation != self.generation:
+                self._entries.clear()
+                self.generation = generation
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = Future()
+                owner = True
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not owner:
+            return pending.result()
+
+        try:
+            body = json.dumps(source.search(term, limit, offset))
+            body = body.encode("utf-8")
+            entry = (body, hashlib.sha1(body).hexdigest())
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(e)
+            raise
+        with self._lock:
+            del self._pending[key]
+            if generation == self.generation:
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        pending.set_result(entry)
+        return entry
+
+    def stats(self):
+        """Return the counters and the number of responses kept."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+def suggestions_from_settings(settings):
+    """Return the suggestion source configured by application settings: a
+    :class:`PrefixIndex` or a :class:`TrigramIndex`, in a
+    :class:`ReloadingIndex` for the terms of a file."""
+    fuzzy = asbool(settings.get("deformdemo.autocomplete.fuzzy", False))
+
+    def make_index(terms):
+        if not fuzzy:
+            return PrefixIndex(terms)
+        index = TrigramIndex(terms)
+        log.info(
+            "Indexed %d terms by %d trigrams in %.1f ms, about %.1f MiB",
+            len(index),
+            len(index.postings),
+            index.build_time * 1000,
+            index.size() / (1024.0 * 1024.0),
+        )
+        return index
+
+    filename = settings.get("deformdemo.autocomplete.terms")
+    if filename:
+        return ReloadingIndex(filename, make_index)
+    return make_index(DEMO_TERMS)
+
+
+def get_suggestions(registry):
+    """Return the suggestion source of a Pyramid registry."""
+    suggestions = getattr(registry, "deformdemo_suggestions", None)
+    if suggestions is None:
+        settings = registry.settings or {}
+        suggestions = registry.deformdemo_suggestions = (
+            suggestions_from_settings(settings)
+        )
+    return suggestions
+
+
+def get_suggestion_cache(registry):
+    """Return the :class:`SuggestionCache` of a Pyramid registry."""
+    cache = getattr(registry, "deformdemo_suggestion_cache", None)
+    if cache is None:
+        settings = registry.settings or {}
+        cache = registry.deformdemo_suggestion_cache = SuggestionCache(
+            int(settings.get("deformdemo.autocomplete.cache_size", 1024)),
+            int(settings.get("deformdemo.autocomplete.max_age", 60)),
+        )
+    return cache
@@ -0,0 +1,119 @@
+"""Chameleon templates shared by the demo views.
+
+Every demo page fills the ``master`` macro of ``templates/main.pt``.  The
+macros are looked up once per process and reused by every view, unless the
+application runs in development mode (``pyramid.reload_templates`` or
+``pyramid.reload_assets``), where they are looked up again for each request
+so that edits to ``main.pt`` are picked up.
+
+In production, templates can also be compiled once at startup (the
+``deformdemo.precompile_templates`` setting), into Chameleon's persistent
+cache directory when the ``CHAMELEON_CACHE`` environment variable names one,
+so that later processes load the compiled modules instead of compiling the
+templates again.
+"""
+
+import logging
+import os
+
+from pyramid.path import caller_package
+from pyramid.renderers import get_renderer
+
+import deform
+import chameleon.config
+from pkg_resources import resource_filename
+
+
+log = logging.getLogger(__name__)
+
+#: Packages whose ``templates`` directory holds page templates
+page_template_packages = ("deformdemo", "unofficial-deformdemo")
+
+
+def reloading(settings):
+    """Return whether templates are reloaded when they change on disk."""
+    settings = settings or {}
+    return bool(
+        settings.get("pyramid.reload_templates")
+        or settings.get("pyramid.reload_assets")
+    )
+
+
+def get_macros(request, renderer_name="templates/main.pt", package=None):
+    """Return the macros of the template ``renderer_name``, resolved
+    relative to ``package`` (by default the package of the caller)."""
+    if package is None:
+        package = caller_package()
+    registry = request.registry
+    if reloading(registry.settings):
+        renderer = get_renderer(renderer_name, package, registry)
+        return renderer.implementation().macros
+    macros = getattr(registry, "deformdemo_macros", None)
+    if macros is None:
+        macros = registry.deformdemo_macros = {}
+    key = (package.__name__, renderer_name)
+    result = macros.get(key)
+    if result is None:
+        renderer = get_renderer(renderer_name, package, registry)
+        result = macros[key] = renderer.implementation().macros
+    return result
+
+
+def configure_widget_renderer(search_path, translator, settings):
+    """Set up the renderer of Deform widget templates.
+
+    This is :func:`deform.renderer.configure_zpt_renderer`, except that
+    widget templates are only checked for changes on disk in development
+    mode.
+    """
+    paths = []
+    for path in search_path:
+        pkg, resource_name = path.split(":")
+        paths.append(resource_filename(pkg, resource_name))
+    deform.Form.default_renderer = deform.ZPTRendererFactory(
+        tuple(paths) + (deform.template.default_dir,),
+        auto_reload=reloading(settings),
+        translator=translator,
+    )
+
+
+def _template_names(directory):
+    for dirpath, _dirnames, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            if filename.endswith(".pt"):
+                path = os.path.join(dirpath, filename)
+                yield os.path.relpath(path, directory).replace(os.sep, "/")
+
+
+def precompile_templates(registry):
+    """Compile every page and widget template.
+
+    Templates are compiled by the loader Chameleon configures itself: into
+    the directory named by the ``CHAMELEON_CACHE`` environment variable if
+    it is set (the directory must exist), where they are kept across
+    restarts, keyed by a digest of their source, so only new or changed
+    templates are compiled again.
+    Otherwise they are compiled in memory, which still spares the first
+    requests.  Templates rendered with ``debug_templates`` on are compiled
+    into a temporary directory instead, and don't benefit from the cache.
+    """
+    count = 0
+    for package in page_template_packages:
+        directory = resource_filename(package, "templates")
+        for name in _template_names(directory):
+            spec = "%s:templates/%s" % (package, name)
+            get_renderer(spec, registry=registry).implementation().cook_check()
+            count += 1
+
+    # load widget templates by the names widgets use, so that the
+    # templates compiled here are the very ones rendered later on
+    renderer = deform.Form.default_renderer
+    names = set()
+    for directory in renderer.loader.search_path:
+        names.update(_template_names(directory))
+    for name in sorted(names):
+        renderer.load(name[: -len(".pt")]).cook_check()
+        count += 1
+
+    cache_dir = chameleon.config.CACHE_DIRECTORY or "memory"
+    log.info("Compiled %d templates into %s", count, cache_dir)
@@ -3103,6 +3103,79 @@ class SelectizeWidgetTagsMultipleTests(Base, unittest.TestCase):
         self.assertSimilarRepr(captured, expected)
 
 
+class Select2RemoteWidgetTests(Base, unittest.TestCase):
+    url = test_url("/select2_remote/")
+
+    def test_render_default(self):
+        self.assertTrue("Pepper" in browser.page_source)
+        select = findid("deformField1", clickable=False)
+        self.assertEqual(select.get_attribute("name"), "pepper")
+        # only the empty option is rendered, the others are searched
+        options = select.find_elements(By.TAG_NAME, "option")
+        self.assertEqual([o.get_attribute("value") for o in options], [""])
+        self.assertEqual(findid("captured").text, "None")
+
+    def test_submit_default(self):
+        disable_html5_validation()
+        findid("deformsubmit").click()
+        self.assertEqual(findid("error-deformField1").text, "Required")
+        self.assertEqual(findid("captured").text, "None")
+
+    def test_submit_searched(self):
+        findcss(".select2-selection").click()
+        findcss(".select2-search__field").send_keys("jalapeno #1")
+        time.sleep(1)
+        findxpath('//li[text()="Jalapeno #1"]').click()
+        findid("deformsubmit").click()
+        self.assertEqual(findid("captured").text, "{'pepper': 'sku-000001'}")
+
+
+class Select2RemoteWidgetMultipleTests(Base, unittest.TestCase):
+    url = test_url("/select2_remote_with_multiple/")
+
+    def test_render_default(self):
+        select = findid("deformField1", clickable=False)
+        self.assertTrue(select.get_attribute("multiple"))
+        # only the selected options are rendered
+        options = select.find_elements(By.TAG_NAME, "option")
+        self.assertEqual(len(options), 2)
+        self.assertTrue(all(o.is_selected() for o in options))
+
+    def test_submit_default(self):
+        findid("deformsubmit").click()
+        self.assertEqual(
+            findid("captured").text,
+            "{'pepper': {'sku-010006', 'sku-010014'}}",
+        )
+
+
+class SelectizeRemoteWidgetTests(Base, unittest.TestCase):
+    url = test_url("/selectize_remote/")
+
+    def test_submit_searched(self):
+        action_chains_on_id("deformField1-selectized").click().send_keys(
+            "habanero #0"
+        ).perform()
+        time.sleep(1)
+        action_chains_on_id("deformField1-selectized").send_keys(
+            Keys.ENTER
+        ).perform()
+        findid("deformsubmit").click()
+        self.assertEqual(findid("captured").text, "{'pepper': 'sku-000000'}")
+
+
+class SelectizeRemoteWidgetTagsTests(Base, unittest.TestCase):
+    url = test_url("/selectize_remote_with_tags/")
+
+    def test_submit_default(self):
+        findid("deformsubmit").click()
+        self.assertEqual(
+            findid("error-deformField1").text,
+            "You must enter at least one tag.",
+        )
+        self.assertEqual(findid("captured").text, "None")
+
+
 class TextInputWidgetTests(Base, unittest.TestCase):
     url = test_url("/textinput/")
 
@@ -3678,6 +3751,10 @@ class TextAreaCSVWidgetTests(Base, unittest.TestCase):
         )
 
 
+class TextAreaCSVWidgetStreamingTests(TextAreaCSVWidgetTests):
+    url = test_url("/textareacsv_streaming/")
+
+
 class WidgetAdapterTests(TextAreaCSVWidgetTests):
     url = test_url("/widget_adapter/")
 
@@ -3716,6 +3793,10 @@ class TextInputCSVWidgetTests(Base, unittest.TestCase):
         )
 
 
+class TextInputCSVWidgetStreamingTests(TextInputCSVWidgetTests):
+    url = test_url("/textinputcsv_streaming/")
+
+
 class MultipleFormsTests(Base, unittest.TestCase):
     url = test_url("/multiple_forms/")
 
@@ -0,0 +1,126 @@
+"""Tests of the registry of widget adapters, run in-process."""
+
+import unittest
+
+import colander
+
+import deform
+
+from deformdemo.adapters import WidgetAdapterRegistry
+from deformdemo.adapters import adapts
+from deformdemo.columns import ColumnSequence
+
+
+class DummyAdapter(object):
+    def __init__(self, widget):
+        self.widget = widget
+
+
+def make_form():
+    class Rows(colander.SequenceSchema):
+        schema_type = ColumnSequence
+        row = colander.SchemaNode(colander.String())
+
+    class Schema(colander.Schema):
+        text = Rows()
+        csv = Rows()
+        plain = colander.SchemaNode(colander.String())
+
+    form = deform.Form(Schema())
+    form["text"].widget = deform.widget.TextAreaWidget()
+    form["csv"].widget = deform.widget.TextAreaCSVWidget()
+    form["plain"].widget = deform.widget.TextAreaWidget()
+    return form
+
+
+class WidgetAdapterRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.adapters = WidgetAdapterRegistry()
+        self.adapters.register(
+            colander.Sequence, deform.widget.TextAreaWidget, DummyAdapter
+        )
+
+    def test_lookup(self):
+        lookup = self.adapters.lookup
+        # through the base classes of the schema type
+        self.assertIs(
+            lookup(ColumnSequence, deform.widget.TextAreaWidget), DummyAdapter
+        )
+        # but not of the widget
+        self.assertIsNone(
+            lookup(colander.Sequence, deform.widget.TextAreaCSVWidget)
+        )
+        self.assertIsNone(
+            lookup(colander.String, deform.widget.TextAreaWidget)
+        )
+
+    def test_memoized(self):
+        key = (ColumnSequence, deform.widget.TextAreaWidget)
+        self.adapters.lookup(*key)
+        self.assertIs(self.adapters._lookups[key], DummyAdapter)
+        self.adapters.register(
+            ColumnSequence, deform.widget.TextAreaWidget, object
+        )
+        self.assertIs(self.adapters.lookup(*key), object)
+
+    def test_adapt_form(self):
+        form = make_form()
+        self.adapters.adapt_form(form)
+        widget = form["text"].widget
+        self.assertIsInstance(widget, DummyAdapter)
+        self.assertIsInstance(widget.widget, deform.widget.TextAreaWidget)
+        self.assertIsInstance(
+            form["csv"].widget, deform.widget.TextAreaCSVWidget
+        )
+        self.assertIsInstance(
+            form["plain"].widget, deform.widget.TextAreaWidget
+        )
+
+    def test_adapts(self):
+        attached = []
+
+        class DummyVenusian(object):
+            def attach(self, ob, callback, category):
+                attached.append((ob, callback, category))
+
+        class DummyConfig(object):
+            registry = type("Registry", (object,), {})()
+
+        class DummyContext(object):
+            config = DummyConfig()
+
+        decorator = adapts(colander.Sequence, deform.widget.TextInputWidget)
+        decorator.venusian = DummyVenusian()
+        self.assertIs(decorator(DummyAdapter), DummyAdapter)
+        ob, callback, category = attached[0]
+        self.assertEqual(category, "pyramid")
+        callback(DummyContext(), "DummyAdapter", ob)
+        adapters = DummyContext.config.registry.deformdemo_widget_adapters
+        self.assertIs(
+            adapters.lookup(colander.Sequence, deform.widget.TextInputWidget),
+            DummyAdapter,
+        )
+
+
+class WidgetAdapterViewTests(unittest.TestCase):
+    def test_widget_adapter(self):
+        import webtest
+
+        from deformdemo import SequenceToTextWidgetAdapter
+        from deformdemo import main
+
+        browser = webtest.TestApp(main({}))
+        response = browser.get("/widget_adapter/")
+        self.assertIn("2,goodbye,5.5", response.html.find("textarea").text)
+        forms = browser.app.registry.deformdemo_forms
+        ((form, _order),) = forms._forms.values()
+        self.assertIsInstance(form["csv"].widget, SequenceToTextWidgetAdapter)
+        # registered when the package is scanned, and looked up by the demo
+        adapters = browser.app.registry.deformdemo_widget_adapters
+        self.assertIs(
+            adapters.lookup(colander.Sequence, deform.widget.TextAreaWidget),
+            SequenceToTextWidgetAdapter,
+        )
+        self.assertIn(
+            (ColumnSequence, deform.widget.TextAreaWidget), adapters._lookups
+        )
@@ -0,0 +1,72 @@
+"""Tests of the "Captured submission" panel, run in-process."""
+
+import pprint
+import unittest
+
+from pygments import highlight
+from pygments.lexers import PythonLexer
+
+from deformdemo.captured import CaptureRenderer
+from deformdemo.captured import formatter
+
+
+class CaptureRendererTests(unittest.TestCase):
+    def setUp(self):
+        self.renderer = CaptureRenderer(
+            max_depth=3, max_items=5, max_bytes=60, highlight_bytes=40
+        )
+
+    def test_small_values_unchanged(self):
+        value = {"b": {"x", "y"}, "a": [1, (2, "three")]}
+        output = pprint.pformat(value)
+        renderer = CaptureRenderer()
+        self.assertEqual(renderer.pformat(value), output)
+        self.assertEqual(
+            renderer.render(value),
+            highlight(output, PythonLexer(), formatter),
+        )
+
+    def test_items(self):
+        self.assertEqual(
+            self.renderer.pformat(list(range(10))), "[0, 1, 2, 3, 4, <5 more>]"
+        )
+        self.assertEqual(
+            self.renderer.pformat({"a": list(range(10)), "b": 1, "c": 2}),
+            "{'a': [0, 1, 2, 3, <6 more>], <2 more>: ...}",
+        )
+        self.assertEqual(
+            self.renderer.pformat(set(range(10))).count("more"), 1
+        )
+
+    def test_depth(self):
+        self.assertEqual(self.renderer.pformat([[[[1]]]]), "[[[[...]]]]")
+
+    def test_bytes(self):
+        output = self.renderer.pformat("x" * 100)
+        self.assertEqual(output, "'%s'... <70 more>" % ("x" * 30))
+        renderer = CaptureRenderer(max_bytes=20)
+        output = renderer.pformat([12345] * 10)
+        self.assertEqual(output, "[12345, 12345, 12345\n<50 more bytes>")
+
+    def test_plain_text_above_threshold(self):
+        value = ["<%d>" % i for i in range(10)]
+        html = self.renderer.render(value)
+        self.assertNotIn("<span", html)
+        self.assertIn("&lt;0&gt;", html)
+
+
+class CapturedPanelTests(unittest.TestCase):
+    def test_large_submission(self):
+        import webtest
+
+        from deformdemo import main
+
+        browser = webtest.TestApp(
+            main({}, **{"deformdemo.captured.max_items": "10"})
+        )
+        rows = "\n".join("%d,hello,4.5" % i for i in range(5000))
+        response = browser.post(
+            "/textareacsv/", {"csv": rows, "submit": "submit"}
+        )
+        captured = response.html.find(id="captured").text.strip()
+        self.assertTrue(captured.endswith("<4997 more>]}"), captured)
@@ -0,0 +1,125 @@
+"""Tests of deserializing sequences of rows a column at a time, run
+in-process."""
+
+import decimal
+import unittest
+
+import colander
+
+from deformdemo.columns import ColumnSequence
+from deformdemo.columns import cell_errors
+from deformdemo.columns import deserialize_column
+
+
+def make_schema(sequence_type, **kw):
+    class Row(colander.TupleSchema):
+        first = colander.SchemaNode(colander.Integer())
+        second = colander.SchemaNode(colander.String())
+        third = colander.SchemaNode(colander.Decimal())
+
+    return colander.SchemaNode(sequence_type(), Row(**kw))
+
+
+def deserialize(schema, cstruct):
+    try:
+        return schema.deserialize(cstruct), None
+    except colander.Invalid as e:
+        return None, e.asdict()
+
+
+class ColumnSequenceTests(unittest.TestCase):
+    def assertSame(self, cstruct, **kw):
+        # the same result and errors as colander.Sequence
+        expected = deserialize(make_schema(colander.Sequence, **kw), cstruct)
+        result = deserialize(make_schema(ColumnSequence, **kw), cstruct)
+        self.assertEqual(result, expected)
+        return result
+
+    def test_valid(self):
+        result, _errors = self.assertSame(
+            [["1", "hello", "4.5"], ("2", "x", " 5 ")]
+        )
+        self.assertEqual(
+            result,
+            [
+                (1, "hello", decimal.Decimal("4.5")),
+                (2, "x", decimal.Decimal("5")),
+            ],
+        )
+        self.assertEqual(self.assertSame([]), ([], None))
+        self.assertSame(colander.null)
+
+    def test_invalid_cells(self):
+        _result, errors = self.assertSame(
+            [["1", "a", "4.5"], ["x", "", "4.5"], ["3", "c", "y"]]
+        )
+        self.assertEqual(sorted(errors), ["1.0", "1.1", "2.2"])
+
+    def test_odd_rows(self):
+        self.assertSame(
+            [["1", "a", "4.5"], ["2", "b"], "abc", colander.null, 7]
+        )
+        self.assertSame(["123", ["1", "a", "4.5"]])
+        self.assertSame("not a sequence")
+
+    def test_missing_and_validators(self):
+        def positive(node, value):
+            if value <= 0:
+                raise colander.Invalid(node, "Not positive")
+
+        def distinct(node, value):
+            if value[0] == value[2]:
+                raise colander.Invalid(node, "Same")
+
+        class Row(colander.TupleSchema):
+            first = colander.SchemaNode(
+                colander.Integer(strict=True), validator=positive
+            )
+            second = colander.SchemaNode(colander.String(), missing="-")
+            third = colander.SchemaNode(
+                colander.Decimal("0.1"), missing=colander.drop
+            )
+
+        cstruct = [
+            ["1", "", "2"],
+            ["0", "a", "2.04"],
+            ["1.5", "a", ""],
+            ["3", "a", "3"],
+            colander.null,
+        ]
+        results = []
+        for sequence_type in (colander.Sequence, ColumnSequence):
+            schema = colander.SchemaNode(
+                sequence_type(), Row(validator=distinct, missing=colander.drop)
+            )
+            results.append(deserialize(schema, cstruct))
+            results.append(deserialize(schema, cstruct[:1] + cstruct[4:]))
+        self.assertEqual(results[0], results[2])
+        self.assertEqual(results[1], results[3])
+        self.assertEqual(
+            results[1], ([(1, "-", decimal.Decimal("2.0"))], None)
+        )
+
+    def test_deserialize_column(self):
+        node = colander.SchemaNode(colander.Integer())
+        values, errors = deserialize_column(node, ("1", "b", "3"))
+        self.assertEqual(values, [1, None, 3])
+        self.assertEqual(list(errors), [1])
+
+    def test_cell_errors(self):
+        schema = make_schema(ColumnSequence)
+        with self.assertRaises(colander.Invalid) as cm:
+            schema.deserialize([["x", "a", "1"], ["1", "a"], ["2", "", "z"]])
+        self.assertEqual(
+            list(cell_errors(cm.exception.children)),
+            [
+                ((0, 0), '"x" is not a number'),
+                (
+                    (1, None),
+                    "\"['1', 'a']\" has an incorrect number of elements "
+                    "(expected 3, was 2)",
+                ),
+                ((2, 1), "Required"),
+                ((2, 2), '"z" is not a number'),
+            ],
+        )
@@ -0,0 +1,122 @@
+"""Tests of the CSV text widgets, run in-process."""
+
+import unittest
+
+import colander
+
+from deformdemo.csvtext import iter_lines
+from deformdemo.csvtext import iter_rows
+from deformdemo.csvtext import line_errors
+from deformdemo.csvtext import same_rows
+from deformdemo.csvtext import write_rows
+
+
+class DummyField(object):
+    error = None
+
+    def __init__(self):
+        self.schema = colander.SchemaNode(colander.String(), name="csv")
+
+
+class CSVTextTests(unittest.TestCase):
+    def test_iter_lines(self):
+        self.assertEqual(
+            list(iter_lines("a\r\nb\n\nc")), ["a\r\n", "b\n", "\n", "c"]
+        )
+        self.assertEqual(list(iter_lines("")), [])
+
+    def test_iter_rows(self):
+        field = DummyField()
+        rows = iter_rows(field, '1,"two\nlines",3\r\n4,5,6\r\n')
+        self.assertEqual(
+            list(rows), [["1", "two\nlines", "3"], ["4", "5", "6"]]
+        )
+
+    def test_malformed(self):
+        field = DummyField()
+        rows = iter_rows(field, '1,2\n3,"4"5\n', strict=True)
+        with self.assertRaises(colander.Invalid) as cm:
+            list(rows)
+        self.assertTrue(cm.exception.msg.startswith("line 2: "))
+
+    def test_same_rows(self):
+        text = write_rows([("1", "hello, world", "4.5"), ("2", "x", "")])
+        self.assertEqual(text, '1,"hello, world",4.5\r\n2,x,\r\n')
+        self.assertTrue(
+            same_rows(text, [("1", "hello, world", "4.5"), ("2", "x", "")])
+        )
+        self.assertFalse(same_rows(text, [("1", "hello, world", "4.5")]))
+        self.assertFalse(same_rows(" 1,a\n", [("1", "a")]))
+        # stripped of its last line ending, compared a batch at a time
+        rows = [(str(n), "x") for n in range(10)]
+        text = write_rows(rows).rstrip()
+        self.assertTrue(same_rows(text, rows, batch_size=3))
+        self.assertFalse(same_rows(text, rows[:9], batch_size=3))
+        self.assertFalse(same_rows(text, rows + [("a",)], batch_size=3))
+        self.assertFalse(same_rows(text[:-1], rows, batch_size=3))
+
+    def test_line_errors(self):
+        field = DummyField()
+        error = colander.Invalid(field.schema)
+        error.add(colander.Invalid(field.schema, "Short"), 0)
+        for pos in range(1, 25):
+            row_error = colander.Invalid(field.schema)
+            row_error.add(colander.Invalid(field.schema, "Bad"), 2)
+            error.add(row_error, pos)
+        line_errors(field, error, max_errors=2)
+        self.assertEqual(
+            field.error.msg,
+            "line 1: Short\nline 2, column 3: Bad\n"
+            "(23 more lines with errors)",
+        )
+
+
+class CSVViewTests(unittest.TestCase):
+    def setUp(self):
+        import webtest
+
+        from deformdemo import main
+
+        self.browser = webtest.TestApp(main({}))
+
+    def test_large_paste_rendered_again_as_is(self):
+        text = "".join("%d, hello,4.5\r\n" % i for i in range(20000))
+        for name in ("widget_adapter", "textareacsv_streaming"):
+            response = self.browser.post(
+                "/%s/" % name, {"csv": text, "submit": "submit"}
+            )
+            textarea = response.html.find("textarea")
+            self.assertEqual(textarea.text.strip(), text.strip())
+            self.assertIn("Decimal", response.html.find(id="captured").text)
+
+    def test_errors(self):
+        text = "".join("x%d,hello,4.5\r\n" % i for i in range(100))
+        for name in ("widget_adapter", "textareacsv_streaming"):
+            response = self.browser.post(
+                "/%s/" % name, {"csv": text, "submit": "submit"}
+            )
+            error = response.html.find(id="error-deformField1").text
+            self.assertIn('line 20, column 1: "x19" is not a number', error)
+            self.assertNotIn("line 21", error)
+            self.assertIn("(80 more lines with errors)", error)
+            self.assertEqual(
+                response.html.find("textarea").text.strip(), text.strip()
+            )
+        # deform's own widget lists every line
+        response = self.browser.post(
+            "/textareacsv/", {"csv": text, "submit": "submit"}
+        )
+        error = response.html.find(id="error-deformField1").text
+        self.assertIn("line 100", error)
+        self.assertNotIn("more lines with errors", error)
+
+    def test_text_input(self):
+        for name in ("textinputcsv", "textinputcsv_streaming"):
+            response = self.browser.post(
+                "/%s/" % name,
+                {"csv": "1,hello,4.5\n2,b,3", "submit": "submit"},
+            )
+            self.assertIn(
+                "(1, 'hello', Decimal('4.5'))",
+                response.html.find(id="captured").text,
+            )
@@ -0,0 +1,158 @@
+"""Tests of the cache of built demo forms, run in-process."""
+
+import threading
+import unittest
+
+import colander
+
+import deform
+
+from deformdemo.formcache import FormCache
+
+
+def make_form(label="Title"):
+    class Item(colander.Schema):
+        name = colander.SchemaNode(colander.String())
+        number = colander.SchemaNode(
+            colander.Integer(), validator=colander.Range(1, 10)
+        )
+
+    class Items(colander.SequenceSchema):
+        item = Item()
+
+    class Schema(colander.Schema):
+        title = colander.SchemaNode(colander.String(), title=label)
+        items = Items()
+
+    return deform.Form(Schema(), buttons=("submit",))
+
+
+def controls(title, numbers):
+    controls = [("title", title), ("__start__", "items:sequence")]
+    for number in numbers:
+        controls.extend(
+            [
+                ("__start__", "item:mapping"),
+                ("name", "name %s" % number),
+                ("number", str(number)),
+                ("__end__", "item:mapping"),
+            ]
+        )
+    controls.append(("__end__", "items:sequence"))
+    return controls
+
+
+def oids(field):
+    yield field.oid
+    for child in field.children:
+        yield from oids(child)
+
+
+class FormCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.forms = FormCache()
+        # deform's own renderer, rather than the one a demo app left behind
+        self.addCleanup(
+            deform.Form.set_default_renderer, deform.Form.default_renderer
+        )
+        deform.Form.set_default_renderer(deform.template.default_renderer)
+
+    def test_built_once(self):
+        form = self.forms.get(make_form)
+        other = self.forms.get(make_form)
+        self.assertIsNot(form, other)
+        self.assertIs(form.schema, other.schema)
+        self.assertIs(form["title"].widget, other["title"].widget)
+        self.assertEqual(len(self.forms._forms), 1)
+        # distinct arguments build distinct forms
+        self.assertEqual(
+            self.forms.get(make_form, "Nom")["title"].title, "Nom"
+        )
+        self.assertEqual(len(self.forms._forms), 2)
+
+    def test_ids_stable(self):
+        # rendering takes ids from the counter of the form (for the
+        # prototype of sequence items), so every copy starts afresh
+        for _copy in range(2):
+            form = self.forms.get(make_form)
+            fresh = make_form()
+            self.assertEqual(list(oids(form)), list(oids(fresh)))
+            self.assertEqual(form.render(), fresh.render())
+
+    def test_sequence_items(self):
+        form = self.forms.get(make_form)
+        fresh = make_form()
+        submitted = controls("Items", [1, 2, 3])
+        self.assertEqual(form.validate(submitted), fresh.validate(submitted))
+        self.assertEqual(
+            [list(oids(item)) for item in form["items"].sequence_fields],
+            [list(oids(item)) for item in fresh["items"].sequence_fields],
+        )
+        self.assertEqual(len(form["items"].sequence_fields), 3)
+        self.assertEqual(form.render(), fresh.render())
+        # the items of one copy don't leak into the next
+        other = self.forms.get(make_form)
+        self.assertFalse(hasattr(other["items"], "sequence_fields"))
+
+    def test_copies_separate(self):
+        barrier = threading.Barrier(8)
+        results = {}
+
+        def submit(index):
+            form = self.forms.get(make_form)
+            barrier.wait()
+            numbers = [index * 2] * (index + 1)
+            try:
+                form.validate(controls("Title %d" % index, numbers))
+            except deform.ValidationFailure as e:
+                results[index] = (e.field.cstruct, e.field.error, e.render())
+            else:
+                results[index] = (form.cstruct, None, form.render())
+
+        threads = [
+            threading.Thread(target=submit, args=(index,))
+            for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index, (cstruct, error, html) in results.items():
+            self.assertEqual(cstruct["title"], "Title %d" % index)
+            self.assertEqual(len(cstruct["items"]), index + 1)
+            self.assertIn("Title %d" % index, html)
+            if 1 <= index * 2 <= 10:
+                self.assertIsNone(error)
+            else:
+                self.assertIsNotNone(error)
+        # the cached form itself was left alone
+        ((cached, _order),) = self.forms._forms.values()
+        self.assertIsNone(cached.error)
+        self.assertFalse(hasattr(cached["items"], "sequence_fields"))
+        self.assertEqual(cached.cstruct, make_form().cstruct)
+
+    def test_errors_separate(self):
+        invalid = self.forms.get(make_form)
+        with self.assertRaises(deform.ValidationFailure):
+            invalid.validate(controls("Title", [99]))
+        valid = self.forms.get(make_form)
+        valid.validate(controls("Title", [1]))
+        (item,) = invalid["items"].sequence_fields
+        self.assertIsNotNone(item["number"].error)
+        self.assertIsNone(valid.error)
+        self.assertNotIn("error", valid.render())
+
+    def test_full(self):
+        self.forms.max_forms = 2
+        form = self.forms.get(make_form, "a")
+        self.forms.get(make_form, "b")
+        self.forms.get(make_form, "c")
+        self.assertEqual(
+            list(self.forms._forms), [(make_form.__code__, ("c",))]
+        )
+        # copies handed out before starting over still work
+        self.assertEqual(
+            form.validate(controls("Title", [1]))["title"], "Title"
+        )
+        self.assertEqual(self.forms.get(make_form, "a")["title"].title, "a")
@@ -0,0 +1,123 @@
+"""Tests of the options of the remote select demos, run in-process."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import colander
+
+from deformdemo.options import KnownOptions
+from deformdemo.options import OptionIndex
+from deformdemo.options import demo_options
+
+
+class OptionIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = OptionIndex(
+            [("b", "Banana"), ("a", "apple"), ("c", "Apricot"), ("d", "ba")]
+        )
+
+    def test_search(self):
+        self.assertEqual(
+            self.index.search("AP"),
+            {
+                "results": [
+                    {"id": "a", "text": "apple"},
+                    {"id": "c", "text": "Apricot"},
+                ],
+                "more": False,
+            },
+        )
+        self.assertEqual(self.index.search("x")["results"], [])
+
+    def test_pages(self):
+        page = self.index.search("", limit=3)
+        self.assertEqual([r["id"] for r in page["results"]], ["a", "c", "d"])
+        self.assertTrue(page["more"])
+        page = self.index.search("", limit=3, offset=3)
+        self.assertEqual([r["id"] for r in page["results"]], ["b"])
+        self.assertFalse(page["more"])
+
+    def test_labels(self):
+        self.assertEqual(self.index.label("c"), "Apricot")
+        self.assertIsNone(self.index.label("x"))
+        self.assertIn("a", self.index)
+        self.assertEqual(len(self.index), 4)
+
+    def test_known_options(self):
+        validator = KnownOptions(self.index)
+        validator(None, "a")
+        validator(None, {"a", "b"})
+        with self.assertRaises(colander.Invalid) as cm:
+            validator(None, {"a", "y", "x"})
+        self.assertEqual(cm.exception.msg, "Unknown option: x, y")
+
+    def test_demo_options(self):
+        options = list(demo_options(10))
+        self.assertEqual(options[1], ("sku-000001", "Jalapeno #1"))
+        self.assertEqual(len(OptionIndex(options)), 10)
+
+
+class RemoteSelectViewTests(unittest.TestCase):
+    def setUp(self):
+        import webtest
+
+        from deformdemo import main
+
+        self.directory = tempfile.mkdtemp()
+        filename = os.path.join(self.directory, "options.csv")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write("hab,Habanero\njal,Jalapeno\n\njal2,Jalapeno rojo\n")
+        self.browser = webtest.TestApp(
+            main({}, **{"deformdemo.options.file": filename})
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_search(self):
+        response = self.browser.get(
+            "/remote_option_values", params={"term": "ja", "limit": "1"}
+        )
+        self.assertEqual(
+            response.json,
+            {"results": [{"id": "jal", "text": "Jalapeno"}], "more": True},
+        )
+        self.assertIn("ETag", response.headers)
+
+    def test_only_selected_options_are_rendered(self):
+        for name in ("select2_remote", "selectize_remote"):
+            response = self.browser.get("/" + name)
+            self.assertNotIn("Habanero", response.text)
+            response = self.browser.post(
+                "/" + name, {"pepper": "jal", "submit": "submit"}
+            )
+            self.assertIn('value="jal">Jalapeno</option>', response.text)
+            self.assertNotIn("Jalapeno rojo", response.text)
+
+    def test_unknown_option(self):
+        response = self.browser.post(
+            "/select2_remote_with_multiple",
+            {
+                "__start__": "pepper:sequence",
+                "pepper": ["hab", "nope"],
+                "__end__": "pepper:sequence",
+                "submit": "submit",
+            },
+        )
+        self.assertIn("Unknown option: nope", response.text)
+        self.assertIn('value="hab">Habanero</option>', response.text)
+
+    def test_tags_are_their_own_label(self):
+        response = self.browser.post(
+            "/selectize_remote_with_tags",
+            {
+                "__start__": "pepper:sequence",
+                "pepper": ["jal", "smoky"],
+                "__end__": "pepper:sequence",
+                "submit": "submit",
+            },
+        )
+        self.assertIn('value="smoky">smoky</option>', response.text)
+        self.assertIn('value="jal">Jalapeno</option>', response.text)
@@ -0,0 +1,106 @@
+"""Tests of the profiling of single requests, run in-process."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyramid.request import Request
+from pyramid.response import Response
+
+from deformdemo.profiling import client_addr
+from deformdemo.profiling import profile_tween_factory
+from deformdemo.profiling import remove_old_profiles
+
+
+class DummyRegistry(object):
+    def __init__(self, settings):
+        self.settings = settings
+
+
+def handler(request):
+    return Response("".join(str(number) for number in range(100)))
+
+
+def make_request(remote_addr="127.0.0.1", **headers):
+    request = Request.blank("/textinput/?_profile=1", headers=headers)
+    request.remote_addr = remote_addr
+    return request
+
+
+class ClientAddrTests(unittest.TestCase):
+    def test_direct(self):
+        self.assertEqual(client_addr(make_request("10.0.0.1")), "10.0.0.1")
+
+    def test_untrusted_proxy(self):
+        for header in ("X-Forwarded-For", "Forwarded"):
+            request = make_request(**{header: "10.0.0.1"})
+            self.assertIsNone(client_addr(request))
+
+    def test_trusted_proxies(self):
+        proxies = frozenset(["127.0.0.1", "10.0.0.2"])
+        request = make_request(
+            **{"X-Forwarded-For": "127.0.0.1, 10.0.0.1, 10.0.0.2"}
+        )
+        # the client can't forge the addresses before the last proxy's
+        self.assertEqual(client_addr(request, proxies), "10.0.0.1")
+        self.assertIsNone(client_addr(make_request(), proxies))
+        request = make_request(**{"X-Forwarded-For": "10.0.0.2"})
+        self.assertIsNone(client_addr(request, proxies))
+
+
+class ProfileTweenTests(unittest.TestCase):
+    def setUp(self):
+        self.profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.profile_dir)
+
+    def make_tween(self, **settings):
+        settings["profile_dir"] = self.profile_dir
+        settings = {"deformdemo." + k: v for k, v in settings.items()}
+        return profile_tween_factory(handler, DummyRegistry(settings))
+
+    def profiles(self):
+        return sorted(os.listdir(self.profile_dir))
+
+    def test_profiled(self):
+        with self.assertLogs("deformdemo.profiling"):
+            response = self.make_tween()(make_request())
+        self.assertEqual(self.profiles(), [response.headers["X-Profile-File"]])
+        self.assertIn(";self=", response.headers["X-Profile-Top"])
+
+    def test_not_asked(self):
+        response = self.make_tween()(Request.blank("/textinput/"))
+        self.assertNotIn("X-Profile-File", response.headers)
+        self.assertEqual(self.profiles(), [])
+
+    def test_refused(self):
+        tween = self.make_tween()
+        with self.assertLogs("deformdemo.profiling", "WARNING"):
+            tween(make_request("10.0.0.1"))
+            # a proxy on this host makes every client look local
+            tween(make_request(**{"X-Forwarded-For": "10.0.0.1"}))
+        self.assertEqual(self.profiles(), [])
+
+    def test_trusted_proxy(self):
+        tween = self.make_tween(profile_proxies="127.0.0.1")
+        with self.assertLogs("deformdemo.profiling", "WARNING"):
+            tween(make_request(**{"X-Forwarded-For": "10.0.0.1"}))
+        self.assertEqual(self.profiles(), [])
+        with self.assertLogs("deformdemo.profiling", "INFO"):
+            tween(make_request(**{"X-Forwarded-For": "::1"}))
+        self.assertEqual(len(self.profiles()), 1)
+
+    def test_kept(self):
+        tween = self.make_tween(profile_keep="2")
+        files = []
+        with self.assertLogs("deformdemo.profiling"):
+            for _request in range(4):
+                files.append(tween(make_request()).headers["X-Profile-File"])
+        self.assertEqual(len(self.profiles()), 2)
+        self.assertIn(files[-1], self.profiles())
+
+    def test_remove_old_profiles(self):
+        for name in ("1.pstats", "2.pstats", "3.pstats", "notes.txt"):
+            open(os.path.join(self.profile_dir, name), "w").close()
+        remove_old_profiles(self.profile_dir, 1)
+        self.assertEqual(self.profiles(), ["3.pstats", "notes.txt"])
@@ -0,0 +1,132 @@
+"""Tests of the highlighted source code of the demos, run in-process."""
+
+import inspect
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+
+import deformdemo
+from deformdemo import sourcecode
+from deformdemo.sourcecode import HighlightedModule
+from deformdemo.sourcecode import page_version
+
+
+class HighlightedModuleTests(unittest.TestCase):
+    def setUp(self):
+        self.module = HighlightedModule(inspect.getsourcefile(deformdemo))
+
+    def test_render(self):
+        html = self.module.render()
+        self.assertIs(self.module.render(), html)
+        self.assertNotIn('class="hll"', html)
+        ranged = self.module.render(10, 12)
+        self.assertEqual(ranged.count('<span class="hll">'), 2)
+
+    def test_same_as_pygments(self):
+        with open(inspect.getsourcefile(deformdemo)) as f:
+            source = f.read()
+        count = len(source.splitlines())
+        for start, end in ((1, 2), (10, 40), (count, count + 1)):
+            formatter = HtmlFormatter(
+                hl_lines=list(range(start, end)), **self.module.options
+            )
+            self.assertEqual(
+                self.module.render(start, end),
+                highlight(source, PythonLexer(), formatter),
+            )
+
+    def test_out_of_range(self):
+        count = len(self.module._lines)
+        self.assertEqual(
+            self.module.render(1, 100000000), self.module.render(1, count + 1)
+        )
+        self.assertEqual(self.module.render(-5, 2), self.module.render(1, 2))
+        for start, end in ((count + 1, count + 9), (12, 10), (-5, 0)):
+            self.assertEqual(self.module.line_range(start, end), (None, None))
+            self.assertIs(self.module.render(start, end), self.module.render())
+        self.assertEqual(
+            self.module.etag_for("http://localhost", 1, 100000000),
+            self.module.etag_for("http://localhost", 1, count + 1),
+        )
+
+    def test_etag(self):
+        etag = self.module.etag_for("http://localhost", version="1")
+        self.assertEqual(
+            self.module.etag_for("http://localhost", version="1"), etag
+        )
+        for other in (
+            self.module.etag_for("http://localhost", version="2"),
+            self.module.etag_for("http://example.com", version="1"),
+            self.module.etag_for("http://localhost", 1, 2, version="1"),
+        ):
+            self.assertNotEqual(other, etag)
+
+
+class AllCodeViewTests(unittest.TestCase):
+    def setUp(self):
+        import webtest
+
+        from deformdemo import main
+
+        self.browser = webtest.TestApp(main({}))
+
+    def test_not_modified(self):
+        response = self.browser.get("/allcode")
+        etag = response.headers["ETag"]
+        self.browser.get(
+            "/allcode", headers={"If-None-Match": etag}, status=304
+        )
+        ranged = self.browser.get("/allcode?start=10&end=12")
+        self.assertNotEqual(ranged.headers["ETag"], etag)
+        self.assertIn('<span class="hll">', ranged.text)
+
+    def test_bad_range(self):
+        self.browser.get("/allcode?start=1&end=abc", status=400)
+        response = self.browser.get("/allcode?start=1&end=100000000")
+        self.assertIn('<span class="hll">', response.text)
+        response = self.browser.get("/allcode?start=100000&end=100010")
+        self.assertNotIn('<span class="hll">', response.text)
+
+    def test_deform_upgraded(self):
+        etag = self.browser.get("/allcode").headers["ETag"]
+        with mock.patch.dict(sourcecode._versions, clear=True):
+            with mock.patch.object(
+                sourcecode, "get_distribution"
+            ) as get_distribution:
+                get_distribution.return_value.version = "99"
+                self.browser.get(
+                    "/allcode", headers={"If-None-Match": etag}, status=200
+                )
+
+
+class PageVersionTests(unittest.TestCase):
+    def test_templates_changed(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        template = os.path.join(directory, "main.pt")
+
+        def write(text):
+            with open(template, "w") as f:
+                f.write(text)
+
+        def resource_filename(package, name):
+            return os.path.join(directory, name)
+
+        write("<html/>")
+        with mock.patch.dict(sourcecode._versions, clear=True):
+            with mock.patch.object(
+                sourcecode, "resource_filename", resource_filename
+            ):
+                version = page_version(("main.pt",))
+                write("<html></html>")
+                # computed once per process, unless reloading
+                self.assertEqual(page_version(("main.pt",)), version)
+                self.assertNotEqual(
+                    page_version(("main.pt",), reload=True), version
+                )
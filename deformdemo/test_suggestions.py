@@ -0,0 +1,245 @@
+"""Tests of the sources of autocomplete suggestions, run in-process."""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from deformdemo.suggestions import MAX_LIMIT
+from deformdemo.suggestions import PrefixIndex
+from deformdemo.suggestions import ReloadingIndex
+from deformdemo.suggestions import SuggestionCache
+from deformdemo.suggestions import TrigramIndex
+from deformdemo.suggestions import page_params
+
+
+class PrefixIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = PrefixIndex(
+            ["bar", "Baz", "two", "three", "bar", "b", "c"]
+        )
+
+    def test_search(self):
+        self.assertEqual(self.index.search("ba"), ["bar", "Baz"])
+        self.assertEqual(self.index.search("BA"), ["bar", "Baz"])
+        self.assertEqual(self.index.search("x"), [])
+        self.assertEqual(len(self.index), 6)
+
+    def test_pages(self):
+        self.assertEqual(self.index.search("b", limit=2), ["b", "bar"])
+        self.assertEqual(self.index.search("b", limit=2, offset=2), ["Baz"])
+        self.assertEqual(self.index.search("b", limit=2, offset=4), [])
+        self.assertEqual(self.index.search("", limit=1, offset=6), [])
+
+    def test_page_params(self):
+        self.assertEqual(page_params({}), (10, 0))
+        self.assertEqual(page_params({"limit": "5", "offset": "3"}), (5, 3))
+        self.assertEqual(
+            page_params({"limit": "1000", "offset": "-1"}), (MAX_LIMIT, 0)
+        )
+        self.assertEqual(page_params({"limit": "x", "offset": "y"}), (10, 0))
+
+
+class TrigramIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = TrigramIndex(
+            ["banana", "bandana", "cabana", "Banner", "apple", "ban"]
+        )
+
+    def test_typo(self):
+        self.assertEqual(self.index.search("bananq")[0], "banana")
+        self.assertEqual(self.index.search("appel"), ["apple"])
+
+    def test_inside_words(self):
+        self.assertEqual(self.index.search("abana"), ["cabana"])
+
+    def test_ranking(self):
+        # "banana" shares the five trigrams of "banan", "bandana" four, and
+        # the others three, shorter ones first; "cabana" only shares two
+        self.assertEqual(
+            self.index.search("banan"), ["banana", "bandana", "ban", "Banner"]
+        )
+        self.assertEqual(
+            self.index.search("banan", limit=2, offset=1), ["bandana", "ban"]
+        )
+        # a typo: prefix matches first
+        self.assertEqual(self.index.search("banni")[:2], ["Banner", "ban"])
+
+    def test_short_lookups_are_prefixes(self):
+        self.assertEqual(self.index.search("ap"), ["apple"])
+        self.assertEqual(self.index.search("pp"), [])
+        self.assertEqual(
+            self.index.search("ban"), ["ban", "banana", "bandana", "Banner"]
+        )
+        self.assertEqual(self.index.search("bana"), ["banana"])
+
+    def test_common_trigrams(self):
+        index = TrigramIndex(
+            ["banana", "cabana"] + ["band%04d" % i for i in range(50)]
+        )
+        self.assertEqual(len(index.search("banana")), 10)
+        self.assertEqual(index.search("band0012")[0], "band0012")
+        index.max_postings = 20
+        # "  b", " ba" and "ban" are too common to be counted, so the terms
+        # must share four of the five trigrams instead of three
+        self.assertEqual(index.search("banana"), ["banana"])
+        # none of the trigrams can be counted
+        self.assertEqual(
+            index.search("band0"), ["band%04d" % i for i in range(10)]
+        )
+        index.max_postings = 1000
+        index.max_candidates = 5
+        # the 50 terms sharing six trigrams are too many to check
+        self.assertEqual(index.search("band0012"), ["band0012"])
+
+    def test_size(self):
+        self.assertGreater(self.index.size(), 0)
+        self.assertGreaterEqual(self.index.build_time, 0)
+
+
+class ReloadingIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "terms.txt")
+        self._write("apple\n")
+        self.index = ReloadingIndex(
+            self.filename, PrefixIndex, clock=lambda: self.now
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, text):
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_reloads_when_the_file_changes(self):
+        self._write("apple\napricot\n")
+        # not checked again yet
+        self.assertEqual(self.index.search("ap"), ["apple"])
+        self.now = 5
+        self.assertEqual(self.index.search("ap"), ["apple", "apricot"])
+        self.assertEqual(self.index.generation, 1)
+        self.now = 10
+        self.index.search("ap")
+        self.assertEqual(self.index.generation, 1)
+
+
+class SuggestionCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.source = PrefixIndex(["bar", "baz", "two"])
+        self.cache = SuggestionCache(max_entries=2)
+
+    def test_cached(self):
+        body, etag = self.cache.lookup(self.source, "b")
+        self.assertEqual(body, b'["bar", "baz"]')
+        self.assertEqual(self.cache.lookup(self.source, "b"), (body, etag))
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_least_recently_used_out(self):
+        self.cache.lookup(self.source, "b")
+        self.cache.lookup(self.source, "t")
+        self.cache.lookup(self.source, "b")
+        self.cache.lookup(self.source, "ba")
+        self.assertEqual(self.cache.stats()["entries"], 2)
+        self.cache.lookup(self.source, "b")
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_dropped_when_the_source_changes(self):
+        self.source.generation = 0
+        self.cache.lookup(self.source, "b")
+        self.source.generation = 1
+        self.cache.lookup(self.source, "b")
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_concurrent_lookups_are_coalesced(self):
+        started = threading.Event()
+        release = threading.Event()
+        searches = []
+        source = self.source
+
+        class SlowSource(object):
+            def search(self, term, limit, offset):
+                searches.append(term)
+                started.set()
+                release.wait(5)
+                return source.search(term, limit, offset)
+
+        slow = SlowSource()
+        results = []
+
+        def lookup():
+            results.append(self.cache.lookup(slow, "b"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(4)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while self.cache.coalesced < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(searches, ["b"])
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(len(results), 4)
+
+
+class SuggestionViewTests(unittest.TestCase):
+    def setUp(self):
+        import webtest
+
+        from deformdemo import main
+
+        self.directory = tempfile.mkdtemp()
+        filename = os.path.join(self.directory, "terms.txt")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write("apple\n\napricot\nbanana\n")
+        settings = {"deformdemo.autocomplete.terms": filename}
+        settings.update(self.settings())
+        self.browser = webtest.TestApp(main({}, **settings))
+
+    def settings(self):
+        return {}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_terms_file(self):
+        response = self.browser.get(
+            "/autocomplete_input_values", params={"term": "ap"}
+        )
+        self.assertEqual(response.json, ["apple", "apricot"])
+        response = self.browser.get(
+            "/autocomplete_input_values",
+            params={"term": "ap", "limit": "1", "offset": "1"},
+        )
+        self.assertEqual(response.json, ["apricot"])
+
+    def test_http_caching(self):
+        url = "/autocomplete_input_values"
+        response = self.browser.get(url, params={"term": "ap"})
+        self.assertEqual(
+            response.headers["Cache-Control"], "public, max-age=60"
+        )
+        self.browser.get(
+            url,
+            params={"term": "ap"},
+            headers={"If-None-Match": response.headers["ETag"]},
+            status=304,
+        )
+
+
+class FuzzySuggestionViewTests(SuggestionViewTests):
+    def settings(self):
+        return {"deformdemo.autocomplete.fuzzy": "true"}
+
+    def test_typo(self):
+        response = self.browser.get(
+            "/autocomplete_input_values", params={"term": "apricto"}
+        )
+        self.assertEqual(response.json, ["apricot"])
@@ -0,0 +1,89 @@
+"""Tests of the templates shared by the demo views, run in-process."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from pyramid import testing
+
+import deformdemo
+from deformdemo.templating import get_macros
+
+
+class GetMacrosTests(unittest.TestCase):
+    def setUp(self):
+        self.config = testing.setUp(
+            settings={"pyramid.reload_templates": False}
+        )
+        self.config.include("pyramid_chameleon")
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_once_per_process(self):
+        request = testing.DummyRequest()
+        macros = get_macros(request, package=deformdemo)
+        self.assertIn("master", macros.names)
+        self.assertIs(get_macros(request, package=deformdemo), macros)
+        # by package, then by name
+        self.assertEqual(
+            list(self.config.registry.deformdemo_macros),
+            [("deformdemo", "templates/main.pt")],
+        )
+
+    def test_caller_package(self):
+        macros = get_macros(testing.DummyRequest())
+        self.assertIs(
+            get_macros(testing.DummyRequest(), package=deformdemo), macros
+        )
+
+    def test_reloading(self):
+        self.config.registry.settings["pyramid.reload_templates"] = True
+        request = testing.DummyRequest()
+        macros = get_macros(request, package=deformdemo)
+        self.assertIn("master", macros.names)
+        self.assertFalse(hasattr(self.config.registry, "deformdemo_macros"))
+
+
+PRECOMPILE = """
+from deformdemo import main
+main(
+    {},
+    debug_templates="false",
+    reload_templates="false",
+    **{"deformdemo.precompile_templates": "true"}
+)
+"""
+
+
+class PrecompileTemplatesTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def precompile(self):
+        # Chameleon reads CHAMELEON_CACHE once, when it is imported
+        env = dict(os.environ, CHAMELEON_CACHE=self.cache_dir)
+        subprocess.run(
+            [sys.executable, "-c", PRECOMPILE],
+            cwd=os.path.dirname(os.path.dirname(deformdemo.__file__)),
+            env=env,
+            check=True,
+        )
+        return {
+            name: os.path.getmtime(os.path.join(self.cache_dir, name))
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".py")
+        }
+
+    def test_compiled_once(self):
+        compiled = self.precompile()
+        names = [name.rsplit("_", 1)[0] for name in compiled]
+        self.assertIn("main", names)
+        self.assertIn("textinput", names)
+        self.assertIn("select2_remote", names)
+        # a later process loads them instead of compiling them again
+        self.assertEqual(self.precompile(), compiled)
@@ -0,0 +1,83 @@
+"""Tests of the server-side timing of demo requests, run in-process."""
+
+import re
+import unittest
+
+from pyramid.request import Request
+from pyramid.response import Response
+
+from deformdemo.timing import NULL_TIMINGS
+from deformdemo.timing import Timings
+from deformdemo.timing import get_timings
+from deformdemo.timing import timing_tween_factory
+
+
+class TimingsTests(unittest.TestCase):
+    def test_phases(self):
+        timings = Timings()
+        with timings.phase("validate"):
+            pass
+        timings.start("template")
+        timings.stop()
+        timings.stop()
+        self.assertEqual(
+            [name for name, _duration in timings.phases],
+            ["validate", "template"],
+        )
+        self.assertRegex(
+            timings.header(0.5),
+            r"^validate;dur=\d+\.\d\d, template;dur=\d+\.\d\d, "
+            r"total;dur=500\.00$",
+        )
+
+    def test_phase_failing(self):
+        timings = Timings()
+        with self.assertRaises(ValueError):
+            with timings.phase("validate"):
+                raise ValueError
+        self.assertEqual(len(timings.phases), 1)
+
+    def test_null(self):
+        request = Request.blank("/")
+        self.assertIs(get_timings(request), NULL_TIMINGS)
+        with get_timings(request).phase("render"):
+            pass
+        get_timings(request).start("template")
+        get_timings(request).stop()
+
+
+class TimingTweenTests(unittest.TestCase):
+    def test_header(self):
+        def handler(request):
+            timings = get_timings(request)
+            with timings.phase("render"):
+                pass
+            timings.start("template")
+            return Response("ok")
+
+        tween = timing_tween_factory(handler, None)
+        with self.assertLogs("deformdemo.timing") as logs:
+            response = tween(Request.blank("/textinput/"))
+        header = response.headers["Server-Timing"]
+        self.assertEqual(
+            re.findall(r"(\w+);dur=", header), ["render", "template", "total"]
+        )
+        self.assertIn("path=/textinput/ status=200", logs.output[0])
+
+    def test_demo(self):
+        import webtest
+
+        from deformdemo import main
+
+        browser = webtest.TestApp(
+            main({}, **{"deformdemo.server_timing": "true"})
+        )
+        response = browser.get("/textinput/")
+        names = re.findall(r"(\w+);dur=", response.headers["Server-Timing"])
+        self.assertEqual(names[-2:], ["template", "total"])
+        self.assertIn("render", names)
+        response = browser.get("/pygments.css")
+        self.assertEqual(
+            re.findall(r"(\w+);dur=", response.headers["Server-Timing"]),
+            ["total"],
+        )
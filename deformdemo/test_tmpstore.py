@@ -0,0 +1,550 @@
+"""Tests of the stores of file uploads and of their previews, run in-process
+through WebTest."""
+
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import tracemalloc
+import unittest
+
+from webob.static import FileIter
+
+from deformdemo.tmpstore import BlobStore
+from deformdemo.tmpstore import CHUNK_SIZE
+from deformdemo.tmpstore import MemoryTmpStore
+from deformdemo.tmpstore import SQLiteTmpStore
+from deformdemo.tmpstore import SessionTmpStore
+from deformdemo.tmpstore import UploadTooLarge
+from deformdemo.tmpstore import tmpstore_from_settings
+
+
+def _peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _large_file(size):
+    fp = tempfile.TemporaryFile()
+    for _ in range(size // CHUNK_SIZE):
+        fp.write(os.urandom(CHUNK_SIZE))
+    return fp
+
+
+class MemoryTmpStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.store = MemoryTmpStore(
+            max_entries=2, max_bytes=25, ttl=10, clock=lambda: self.now
+        )
+
+    def test_evicts_least_recently_used(self):
+        self.store["a"] = {"size": 1}
+        self.store["b"] = {"size": 1}
+        self.store.get("a")
+        self.store["c"] = {"size": 1}
+        self.assertIn("a", self.store)
+        self.assertNotIn("b", self.store)
+        self.assertEqual(self.store.evictions, 1)
+
+    def test_evicts_beyond_max_bytes(self):
+        self.store["a"] = {"size": 20}
+        self.store["b"] = {"size": 10}
+        self.assertNotIn("a", self.store)
+        self.assertEqual(self.store.size, 10)
+
+    def test_keeps_the_upload_just_stored(self):
+        self.store["a"] = {"size": 10}
+        self.store["b"] = {"size": 25}
+        self.assertNotIn("a", self.store)
+        self.assertEqual(self.store["b"], {"size": 25})
+
+    def test_refuses_uploads_beyond_max_bytes(self):
+        self.store["a"] = {"size": 10}
+        with self.assertRaises(UploadTooLarge):
+            self.store["b"] = {"size": 26}
+        self.assertNotIn("b", self.store)
+        self.assertIn("a", self.store)
+
+    def test_expires(self):
+        self.store["a"] = {"size": 1}
+        self.now = 10
+        self.assertIsNone(self.store.get("a"))
+        self.assertEqual(self.store.stats()["entries"], 0)
+
+    def test_measures_file_size(self):
+        self.store["a"] = {"fp": io.BytesIO(b"12345"), "size": -1}
+        self.assertEqual(self.store.size, 5)
+
+
+class BlobStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.blobs = BlobStore(spool_threshold=4)
+        self.store = MemoryTmpStore(blobs=self.blobs)
+
+    def tearDown(self):
+        self.store.close()
+        self.blobs.close()
+
+    def test_same_content_is_stored_once(self):
+        self.store["a"] = {"fp": io.BytesIO(b"abc")}
+        self.store["b"] = {"fp": io.BytesIO(b"abc")}
+        self.assertEqual(self.store["b"]["fp"].read(), b"abc")
+        self.assertEqual(
+            self.blobs.stats(),
+            {"blobs": 1, "blob_bytes": 3, "dedup_saved_bytes": 3},
+        )
+        del self.store["a"]
+        self.assertEqual(self.blobs.stats()["blobs"], 1)
+        del self.store["b"]
+        self.assertEqual(self.blobs.stats()["blobs"], 0)
+
+    def test_large_bodies_are_spooled_once(self):
+        self.store["a"] = {"fp": io.BytesIO(b"x" * 10)}
+        self.store["b"] = {"fp": io.BytesIO(b"x" * 10)}
+        path = self.store["a"]["fp"].path
+        self.assertEqual(
+            os.listdir(self.blobs.spool_dir), [os.path.basename(path)]
+        )
+        self.assertEqual(self.store["b"]["fp"].read(), b"x" * 10)
+        self.store.clear()
+        self.assertFalse(os.path.exists(path))
+
+    def test_refuses_large_uploads(self):
+        self.store.max_upload_size = 8
+        with self.assertRaises(UploadTooLarge):
+            self.store["a"] = {"fp": io.BytesIO(b"x" * 9)}
+        self.assertNotIn("a", self.store)
+        self.assertEqual(os.listdir(self.blobs.spool_dir), [])
+
+    def test_spooled_uploads_are_copied_in_chunks(self):
+        with _large_file(64 * CHUNK_SIZE) as fp:
+            peak = _peak_memory(
+                lambda: self.store.__setitem__("a", {"fp": fp})
+            )
+        self.assertLess(peak, 4 * CHUNK_SIZE)
+
+
+class SQLiteTmpStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "uploads.sqlite")
+        self.store = self._open()
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def _open(self):
+        return SQLiteTmpStore(
+            self.path,
+            max_entries=2,
+            max_bytes=25,
+            ttl=10,
+            clock=lambda: self.now,
+        )
+
+    def test_roundtrip(self):
+        self.store[("session", "a")] = {
+            "fp": io.BytesIO(b"body"),
+            "filename": "a.txt",
+            "size": -1,
+        }
+        value = self.store[("session", "a")]
+        self.assertEqual(value["filename"], "a.txt")
+        self.assertEqual(value["fp"].read(), b"body")
+
+    def test_shared_by_stores_on_the_same_file(self):
+        self.store["a"] = {"fp": io.BytesIO(b"body")}
+        other = self._open()
+        try:
+            self.assertEqual(other["a"]["fp"].read(), b"body")
+            del other["a"]
+        finally:
+            other.close()
+        self.assertNotIn("a", self.store)
+
+    def test_evicts_least_recently_used(self):
+        self.store["a"] = {}
+        self.now = 1
+        self.store["b"] = {}
+        self.now = 2
+        self.store.get("a")
+        self.now = 3
+        self.store["c"] = {}
+        self.assertIn("a", self.store)
+        self.assertNotIn("b", self.store)
+
+    def test_evicts_beyond_max_bytes(self):
+        self.store["a"] = {"fp": io.BytesIO(b"x" * 20)}
+        self.now = 1
+        self.store["b"] = {"fp": io.BytesIO(b"x" * 10)}
+        self.assertNotIn("a", self.store)
+        self.assertEqual(self.store.stats()["bytes"], 10)
+
+    def test_expires(self):
+        self.store["a"] = {}
+        self.now = 10
+        self.assertIsNone(self.store.get("a"))
+        self.assertNotIn("a", self.store)
+        # dropped by the next upload stored
+        self.store["b"] = {}
+        self.assertEqual(len(self.store), 1)
+
+    def test_lookups_dont_lock(self):
+        self.store["a"] = {"fp": io.BytesIO(b"body")}
+        other = sqlite3.connect(self.path, isolation_level=None)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            self.store._connection().execute("PRAGMA busy_timeout = 0")
+            self.assertEqual(self.store["a"]["fp"].read(), b"body")
+            self.assertIsNone(self.store.get("b"))
+            other.execute("ROLLBACK")
+        finally:
+            other.close()
+
+    def test_times_of_use_are_batched(self):
+        self.store.used_batch = 2
+        self.store["a"] = {}
+        self.store["b"] = {}
+
+        def used():
+            return dict(
+                self.store._connection().execute(
+                    "SELECT uid, used FROM uploads"
+                )
+            )
+
+        self.now = 1
+        self.store.get("a")
+        self.assertEqual(set(used().values()), {0})
+        self.store.get("b")
+        self.assertEqual(set(used().values()), {1})
+
+    def test_keeps_the_upload_just_stored(self):
+        self.store["a"] = {"fp": io.BytesIO(b"x" * 10)}
+        self.now = 1
+        self.store["b"] = {"fp": io.BytesIO(b"x" * 25)}
+        self.assertNotIn("a", self.store)
+        self.assertEqual(self.store["b"]["fp"].read(), b"x" * 25)
+        with self.assertRaises(UploadTooLarge):
+            self.store["c"] = {"fp": io.BytesIO(b"x" * 26)}
+        self.assertIn("b", self.store)
+
+    def test_same_content_is_stored_once(self):
+        self.store["a"] = {"fp": io.BytesIO(b"abc")}
+        self.now = 1
+        self.store["b"] = {"fp": io.BytesIO(b"abc")}
+        stats = self.store.stats()
+        self.assertEqual(stats["blobs"], 1)
+        self.assertEqual(stats["dedup_saved_bytes"], 3)
+        del self.store["a"]
+        self.assertEqual(self.store["b"]["fp"].read(), b"abc")
+        self.store["b"] = {"fp": io.BytesIO(b"abc")}
+        self.assertEqual(self.store["b"]["fp"].read(), b"abc")
+        del self.store["b"]
+        self.assertEqual(self.store.stats()["blobs"], 0)
+
+    def test_reads_bodies_in_chunks(self):
+        self.store.max_bytes = 0
+        body = os.urandom(2 * CHUNK_SIZE + 10)
+        self.store["a"] = {"fp": io.BytesIO(body)}
+        fp = self.store["a"]["fp"]
+        start, stop = CHUNK_SIZE - 5, CHUNK_SIZE + 5
+        fp.seek(start)
+        self.assertEqual(fp.read(10), body[start:stop])
+        self.assertEqual(fp.read(), body[stop:])
+        fp.seek(0)
+        self.assertEqual(fp.read(), body)
+
+    def test_refuses_large_uploads(self):
+        self.store.max_upload_size = 8
+        with self.assertRaises(UploadTooLarge):
+            self.store["a"] = {"fp": io.BytesIO(b"x" * 9)}
+        self.assertNotIn("a", self.store)
+
+    def test_uploads_are_copied_in_chunks(self):
+        self.store.max_bytes = 0
+        with _large_file(64 * CHUNK_SIZE) as fp:
+            peak = _peak_memory(
+                lambda: self.store.__setitem__("a", {"fp": fp})
+            )
+        self.assertLess(peak, 4 * CHUNK_SIZE)
+
+    def test_remove_if(self):
+        self.store[("s1", "a")] = {}
+        self.store[("s2", "a")] = {}
+        self.store.remove_if(lambda uid: uid[0] == "s1")
+        self.assertNotIn(("s1", "a"), self.store)
+        self.assertIn(("s2", "a"), self.store)
+
+
+class SessionTmpStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.session = "a"
+        self.store = SessionTmpStore(
+            MemoryTmpStore, stripes=4, session_key=lambda: self.session
+        )
+
+    def test_sessions_are_isolated(self):
+        self.store["uid"] = {"filename": "a.txt"}
+        self.session = "b"
+        self.assertNotIn("uid", self.store)
+        self.store["uid"] = {"filename": "b.txt"}
+        self.session = "a"
+        self.assertEqual(self.store["uid"]["filename"], "a.txt")
+
+    def test_clear_releases_only_the_current_session(self):
+        self.store["uid"] = {}
+        self.session = "b"
+        self.store["uid"] = {}
+        self.store.clear()
+        self.assertNotIn("uid", self.store)
+        self.session = "a"
+        self.assertIn("uid", self.store)
+
+
+class UploadLimitTests(unittest.TestCase):
+    def setUp(self):
+        import webtest
+
+        from deformdemo import main
+
+        app = main({}, **{"deformdemo.tmpstore.max_upload_size": "16"})
+        self.store = app.registry.deformdemo_tmpstore
+        self.browser = webtest.TestApp(app)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_large_upload_is_a_field_error(self):
+        form = self.browser.get("/file/").forms[0]
+        form["upload"] = ("large.txt", b"x" * 17)
+        response = form.submit("submit")
+        self.assertIn("The file is larger than 16 bytes", response)
+        self.assertEqual(len(self.store), 0)
+
+    def test_small_upload_is_stored(self):
+        form = self.browser.get("/file/").forms[0]
+        form["upload"] = ("small.txt", b"x" * 16)
+        response = form.submit("submit")
+        self.assertIn("small.txt", response)
+        self.assertNotIn("The file is larger", response)
+
+
+class StripeShareTests(unittest.TestCase):
+    #: the limits of the store in demo.ini
+    settings = {
+        "deformdemo.tmpstore.max_bytes": "104857600",
+        "deformdemo.tmpstore.max_upload_size": "10485760",
+        "deformdemo.tmpstore.stripes": "16",
+    }
+
+    def make_browser(self, **settings):
+        import webtest
+
+        from deformdemo import main
+
+        settings = dict(self.settings, **settings)
+        app = main({}, **settings)
+        self.addCleanup(app.registry.deformdemo_tmpstore.close)
+        return webtest.TestApp(app)
+
+    def upload(self, browser, size):
+        form = browser.get("/file/").forms[0]
+        form["upload"] = ("upload.bin", b"x" * size)
+        return form.submit("submit")
+
+    def test_stripes_hold_the_largest_upload(self):
+        store = tmpstore_from_settings(self.settings)
+        self.addCleanup(store.close)
+        self.assertEqual(len(store._stripes), 10)
+        for stripe in store._stripes:
+            self.assertGreaterEqual(stripe.max_bytes, 10485760)
+
+    def test_upload_larger_than_max_bytes(self):
+        settings = dict(self.settings)
+        settings["deformdemo.tmpstore.max_bytes"] = "1048576"
+        with self.assertRaises(ValueError):
+            tmpstore_from_settings(settings)
+
+    def test_upload_larger_than_the_share_of_a_stripe(self):
+        browser = self.make_browser(
+            **{
+                "deformdemo.tmpstore.max_bytes": "1600",
+                "deformdemo.tmpstore.max_upload_size": "0",
+            }
+        )
+        response = self.upload(browser, 101)
+        self.assertIn("The file is larger than 100 bytes", response)
+        response = self.upload(browser, 100)
+        self.assertIn("upload.bin", response)
+        self.assertNotIn("The file is larger", response)
+
+    def test_upload_of_8_mib(self):
+        response = self.upload(self.make_browser(), 8 * 1024 * 1024)
+        self.assertIn("upload.bin", response)
+        self.assertNotIn("The file is larger", response)
+
+
+class PreviewTests(unittest.TestCase):
+    # whether uploads of 100 bytes are spooled to disk
+    spooled = True
+
+    def settings(self):
+        return {"deformdemo.tmpstore.spool_threshold": "64"}
+
+    def setUp(self):
+        import webtest
+
+        from deformdemo import main
+
+        app = main({}, **self.settings())
+        self.store = app.registry.deformdemo_tmpstore
+        self.browser = webtest.TestApp(app)
+
+    def tearDown(self):
+        self.store.close()
+
+    def _upload(self, body):
+        form = self.browser.get("/file/").forms[0]
+        form["upload"] = ("a.txt", body)
+        response = form.submit("submit")
+        # the successful submission re-renders the form with the upload
+        uid = response.html.find("input", attrs={"name": "uid"})["value"]
+        self.assertIn("http://localhost/uploads/%s" % uid, response)
+        return "/uploads/%s" % uid
+
+    def test_preview(self):
+        url = self._upload(b"hello world")
+        response = self.browser.get(url)
+        self.assertEqual(response.body, b"hello world")
+        self.assertEqual(response.content_type, "text/plain")
+        self.assertEqual(response.headers["Accept-Ranges"], "bytes")
+        self.browser.get(
+            url, headers={"If-None-Match": response.etag}, status=304
+        )
+
+    def test_range(self):
+        url = self._upload(b"x" * 100 + b"0123456789")
+        response = self.browser.get(
+            url, headers={"Range": "bytes=100-104"}, status=206
+        )
+        self.assertEqual(response.body, b"01234")
+        self.assertEqual(
+            response.headers["Content-Range"], "bytes 100-104/110"
+        )
+        response = self.browser.get(
+            url, headers={"Range": "bytes=200-"}, status=416
+        )
+        self.assertEqual(response.headers["Content-Range"], "bytes */110")
+        response = self.browser.get(
+            url, headers={"Range": "bytes=0-1", "If-Range": '"other"'}
+        )
+        self.assertEqual(len(response.body), 110)
+
+    def test_file_wrapper(self):
+        wrapped = []
+
+        def file_wrapper(f, block_size):
+            wrapped.append(f)
+            return FileIter(f).app_iter_range(block_size=block_size)
+
+        url = self._upload(b"x" * 100)
+        response = self.browser.get(
+            url, extra_environ={"wsgi.file_wrapper": file_wrapper}
+        )
+        self.assertEqual(response.body, b"x" * 100)
+        self.assertEqual(len(wrapped), int(self.spooled))
+
+    def test_only_the_uploads_of_the_session(self):
+        import webtest
+
+        url = self._upload(b"hello world")
+        webtest.TestApp(self.browser.app).get(url, status=404)
+        self.browser.get("/uploads/unknown", status=404)
+
+
+class SQLitePreviewTests(PreviewTests):
+    spooled = False
+
+    def settings(self):
+        self.directory = tempfile.mkdtemp()
+        return {
+            "deformdemo.tmpstore.backend": "sqlite",
+            "deformdemo.tmpstore.sqlite_path": os.path.join(
+                self.directory, "uploads.sqlite"
+            ),
+        }
+
+    def tearDown(self):
+        PreviewTests.tearDown(self)
+        shutil.rmtree(self.directory)
+
+
+class ConcurrentUploadTests(unittest.TestCase):
+    sessions = 24
+    cycles = 8
+
+    def settings(self):
+        # uploads are spooled to disk above 64 bytes: mix both kinds
+        return {"deformdemo.tmpstore.spool_threshold": "64"}
+
+    def setUp(self):
+        from deformdemo import main
+
+        self.app = main({}, **self.settings())
+
+    def tearDown(self):
+        self.app.registry.deformdemo_tmpstore.close()
+
+    def _session(self, number):
+        import webtest
+
+        # each TestApp keeps the cookies, hence the session, of one browser
+        browser = webtest.TestApp(self.app)
+        for cycle in range(self.cycles):
+            filename = "s%d-c%d.txt" % (number, cycle)
+            url = "/sequence_of_fileuploads_with_initial_item/"
+            form = browser.get(url).forms[0]
+            form["upload"] = (filename, b"x" * (1 + number * cycle % 128))
+            response = form.submit("submit")
+            if filename not in response:
+                return "%s missing" % filename
+        return None
+
+    def test_parallel_upload_cycles(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            errors = list(executor.map(self._session, range(self.sessions)))
+        self.assertEqual([e for e in errors if e], [])
+        store = self.app.registry.deformdemo_tmpstore
+        # every successful submission released the uploads of its own
+        # session only, and each session kept the one upload re-rendered
+        # after its last submission
+        self.assertEqual(len(store), self.sessions)
+
+
+class SQLiteConcurrentUploadTests(ConcurrentUploadTests):
+    def settings(self):
+        self.directory = tempfile.mkdtemp()
+        return {
+            "deformdemo.tmpstore.backend": "sqlite",
+            "deformdemo.tmpstore.sqlite_path": os.path.join(
+                self.directory, "uploads.sqlite"
+            ),
+        }
+
+    def test_uses_sqlite(self):
+        store = self.app.registry.deformdemo_tmpstore
+        self.assertIsInstance(store._stripes[0], SQLiteTmpStore)
+
+    def tearDown(self):
+        ConcurrentUploadTests.tearDown(self)
+        shutil.rmtree(self.directory)
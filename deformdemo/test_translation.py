@@ -0,0 +1,127 @@
+"""Tests of the translator of widget templates, run in-process."""
+
+import unittest
+
+from pyramid import testing
+from pyramid.i18n import TranslationString
+from pyramid.i18n import TranslationStringFactory
+
+from deformdemo.translation import TranslationCache
+from deformdemo.translation import WidgetTranslator
+from deformdemo.translation import translation_key
+from deformdemo.translation import widget_translator_from_settings
+
+
+_ = TranslationStringFactory("deformdemo")
+
+
+class DummyLocalizer(object):
+    def __init__(self, locale_name="de"):
+        self.locale_name = locale_name
+        self.translated = []
+
+    def translate(self, term):
+        self.translated.append(term)
+        return "%s:%s" % (self.locale_name, term.interpolate())
+
+
+class TranslationKeyTests(unittest.TestCase):
+    def test_keys(self):
+        term = _("Hello ${name}", default="Hi ${name}", mapping={"name": 1})
+        self.assertEqual(
+            translation_key(term),
+            (
+                "Hello ${name}",
+                "deformdemo",
+                "Hi ${name}",
+                None,
+                (("name", 1),),
+            ),
+        )
+        # equal terms share a key, terms of other domains don't
+        self.assertEqual(
+            translation_key(_("Submit")), translation_key(_("Submit"))
+        )
+        self.assertNotEqual(
+            translation_key(_("Submit")),
+            translation_key(TranslationString("Submit", domain="deform")),
+        )
+
+    def test_uncached(self):
+        self.assertIsNone(translation_key("Submit"))
+        for value in (1.0, True, _("Submit"), None):
+            term = _("${value}", mapping={"value": value})
+            self.assertIsNone(translation_key(term))
+
+        class Marker(str):
+            pass
+
+        self.assertIsNone(translation_key(_("Submit", default=Marker("x"))))
+
+
+class TranslationCacheTests(unittest.TestCase):
+    def test_translate(self):
+        cache = TranslationCache()
+        de, nl = DummyLocalizer("de"), DummyLocalizer("nl")
+        self.assertEqual(cache.translate(de, _("Submit")), "de:Submit")
+        self.assertEqual(cache.translate(de, _("Submit")), "de:Submit")
+        self.assertEqual(cache.translate(nl, _("Submit")), "nl:Submit")
+        self.assertEqual(len(de.translated), 1)
+        self.assertEqual(cache.stats(), {"entries": 2, "hits": 1, "misses": 2})
+        # not kept
+        term = _("${value}", mapping={"value": 1.5})
+        self.assertEqual(cache.translate(de, term), "de:1.5")
+        self.assertEqual(cache.translate(de, term), "de:1.5")
+        self.assertEqual(len(de.translated), 3)
+
+    def test_start_over(self):
+        cache = TranslationCache(max_entries=2)
+        localizer = DummyLocalizer()
+        for term in ("One", "Two", "Three"):
+            cache.translate(localizer, _(term))
+        self.assertEqual(cache.stats()["entries"], 1)
+
+
+class WidgetTranslatorTests(unittest.TestCase):
+    def setUp(self):
+        self.config = testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_request(self):
+        translator = WidgetTranslator(TranslationCache())
+        request = testing.DummyRequest()
+        request.localizer = DummyLocalizer("nl")
+        translator.begin(request)
+        try:
+            self.assertEqual(translator(_("Submit")), "nl:Submit")
+            self.assertIs(translator.localizer(), request.localizer)
+        finally:
+            translator.end()
+        self.assertIsNone(translator._current.request)
+
+    def test_current_request(self):
+        translator = widget_translator_from_settings(
+            {"deformdemo.translations.cache_size": "10"}
+        )
+        self.assertEqual(translator.cache.max_entries, 10)
+        request = testing.DummyRequest()
+        request.localizer = DummyLocalizer("ru")
+        self.config.begin(request)
+        self.assertEqual(translator(_("Submit")), "ru:Submit")
+
+
+class TranslationViewTests(unittest.TestCase):
+    def test_i18n(self):
+        import webtest
+
+        from deformdemo import main
+
+        browser = webtest.TestApp(main({}))
+        response = browser.get("/i18n/?_LOCALE_=de")
+        self.assertIn("Eine Nummer zwischen 1 und 10", response.text)
+        response = browser.get("/i18n/?_LOCALE_=en")
+        self.assertIn("A number between 1 and 10", response.text)
+        translator = browser.app.registry.deformdemo_widget_translator
+        self.assertGreater(translator.cache.stats()["entries"], 0)
@@ -0,0 +1,97 @@
+"""Server-side timing of the phases of a demo request.
+
+With the ``deformdemo.server_timing`` setting on, a tween hands every
+request a :class:`Timings` object.  Views time their phases with it
+(``with get_timings(request).phase("validate"): ...``) and the tween
+reports them, along with the total time of the request, in a
+``Server-Timing`` response header and in a log line.
+
+With the setting off the tween isn't installed at all, and
+:func:`get_timings` returns a :class:`NullTimings` whose phases do nothing.
+"""
+
+import contextlib
+import logging
+import time
+
+
+log = logging.getLogger(__name__)
+
+
+class Timings(object):
+    """The phases of a request, in the order they were timed."""
+
+    def __init__(self):
+        self.phases = []
+        self._open = None
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time the body of a ``with`` statement as the phase ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def start(self, name):
+        """Start the phase ``name``, which lasts until :meth:`stop` is
+        called, for phases that outlive the view (template rendering)."""
+        self._open = (name, time.perf_counter())
+
+    def stop(self):
+        if self._open is not None:
+            name, start = self._open
+            self.phases.append((name, time.perf_counter() - start))
+            self._open = None
+
+    def header(self, total):
+        """Return the value of a ``Server-Timing`` header."""
+        metrics = ["%s;dur=%.2f" % (name, d * 1000) for name, d in self.phases]
+        metrics.append("total;dur=%.2f" % (total * 1000))
+        return ", ".join(metrics)
+
+
+class NullTimings(object):
+    """Timings of a request that isn't timed."""
+
+    _phase = contextlib.nullcontext()
+
+    def phase(self, name):
+        return self._phase
+
+    def start(self, name):
+        pass
+
+    def stop(self):
+        pass
+
+
+NULL_TIMINGS = NullTimings()
+
+
+def get_timings(request):
+    """Return the :class:`Timings` of ``request``, or :data:`NULL_TIMINGS`
+    when timing is off."""
+    return request.environ.get("deformdemo.timings", NULL_TIMINGS)
+
+
+def timing_tween_factory(handler, registry):
+    def timing_tween(request):
+        timings = request.environ["deformdemo.timings"] = Timings()
+        start = time.perf_counter()
+        response = handler(request)
+        timings.stop()
+        total = time.perf_counter() - start
+        response.headers["Server-Timing"] = timings.header(total)
+        log.info(
+            "timing method=%s path=%s status=%s total=%.2f %s",
+            request.method,
+            request.path,
+            response.status_int,
+            total * 1000,
+            " ".join("%s=%.2f" % (n, d * 1000) for n, d in timings.phases),
+        )
+        return response
+
+    return timing_tween
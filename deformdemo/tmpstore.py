@@ -0,0 +1,1055 @@
+"""Temporary stores of file uploads, for :class:`deform.FileUploadWidget`.
+
+Deform never removes an upload from its ``tmpstore``: that's left to the
+store itself.  :class:`MemoryTmpStore` keeps uploads in memory, bounded by
+a number of entries, a total size and a time to live, evicting the least
+recently used uploads first.  Its limits are read from these settings:
+
+``deformdemo.tmpstore.max_entries``
+    How many uploads are kept (default: 1000).
+
+``deformdemo.tmpstore.max_bytes``
+    The total size of the uploads kept, in bytes (default: 100 MiB).
+
+``deformdemo.tmpstore.ttl``
+    How long an upload is kept after it was stored, in seconds (default:
+    one hour).
+
+``deformdemo.tmpstore.max_upload_size``
+    The size of the largest upload accepted, in bytes (default: no limit).
+    Uploads are copied into the store in chunks, and the copy stops as soon
+    as it goes beyond this size: the upload is then refused with a
+    validation error of its field.
+
+A limit of ``0`` disables it.
+
+The bodies of uploads are kept apart, in a :class:`BlobStore`, once per
+distinct content: uploading the same file again costs no extra memory.
+Small bodies are kept in memory, larger ones are copied to a spool
+directory and read back through :mod:`mmap`, so that they don't live in the
+memory of the process:
+
+``deformdemo.tmpstore.spool_threshold``
+    Uploads larger than this many bytes are spooled to disk (default:
+    1 MiB); ``0`` keeps every upload in memory.
+
+``deformdemo.tmpstore.spool_dir``
+    The directory in which spooled uploads are written (default: the
+    system's temporary directory).
+
+Spooled files are removed as soon as no upload refers to them, and all of
+them when the process exits.
+
+The store of the application is a :class:`SessionTmpStore`: uploads are
+partitioned by browser session, so that a successful submission only
+releases the uploads of its own session, and spread over a number of
+independent stores, each with its own lock and its share of the limits:
+
+``deformdemo.tmpstore.stripes``
+    How many stores uploads are spread over (default: 16).  Fewer are used
+    if their share of ``max_bytes`` would be smaller than
+    ``max_upload_size``, so that each of them can hold the largest upload
+    accepted.  Uploads larger than the share of their store are refused.
+
+Several processes serving the demo on one host can share their uploads by
+keeping them in a :class:`SQLiteTmpStore`, with the same limits:
+
+``deformdemo.tmpstore.backend``
+    ``memory`` (the default) or ``sqlite``.
+
+``deformdemo.tmpstore.sqlite_path``
+    The database file of the ``sqlite`` backend.
+"""
+
+import atexit
+import collections
+import hashlib
+import io
+import json
+import mmap
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+import colander
+from pyramid.threadlocal import get_current_request
+
+
+#: Defaults of the ``deformdemo.tmpstore.*`` settings
+DEFAULTS = {
+    "max_entries": 1000,
+    "max_bytes": 100 * 1024 * 1024,
+    "ttl": 3600,
+    "spool_threshold": 1024 * 1024,
+    "stripes": 16,
+    "max_upload_size": 0,
+}
+
+#: Size of the chunks in which uploads are copied to the spool directory
+CHUNK_SIZE = 64 * 1024
+
+_marker = object()
+
+
+class UploadTooLarge(ValueError):
+    """Raised when storing an upload larger than the largest size
+    accepted."""
+
+
+def check_size(size, max_size):
+    """Raise :class:`UploadTooLarge` if ``size`` goes beyond ``max_size``
+    (unless it is ``0``)."""
+    if max_size and size > max_size:
+        raise UploadTooLarge("The file is larger than %d bytes" % max_size)
+
+
+def entry_size(value):
+    """Return the size in bytes of a file upload stored by deform."""
+    size = value.get("size")
+    if size is not None and size >= 0:
+        return size
+    fp = value.get("fp")
+    if fp is None:
+        return 0
+    try:
+        position = fp.tell()
+        fp.seek(0, 2)
+        size = fp.tell()
+        fp.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return 0
+    return size
+
+
+class MemoryTmpStore(object):
+    """Instances of this class implement the
+    :class:`deform.interfaces.FileUploadTempStore` interface.
+
+    Uploads are kept in memory, least recently used first out, within
+    ``max_entries`` uploads and ``max_bytes`` bytes, and for at most
+    ``ttl`` seconds.  The ``hits`` and ``misses`` counters keep track of
+    lookups, and ``evictions`` of the uploads dropped because of the
+    limits or the time to live.
+
+    With a :class:`BlobStore` as ``blobs``, the bodies of uploads are
+    copied there, and the ``fp`` of an upload is a reader of its body, whose
+    SHA-256 ``digest`` is added to the upload.
+    Sizes count against ``max_bytes`` once per upload, even when their
+    bodies are shared.  Storing an upload larger than ``max_upload_size``
+    bytes, or than ``max_bytes``, raises :class:`UploadTooLarge`: the
+    upload just stored is never the one evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries=0,
+        max_bytes=0,
+        ttl=0,
+        clock=time.monotonic,
+        blobs=None,
+        max_upload_size=0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_upload_size = max_upload_size
+        self.clock = clock
+        self.blobs = blobs
+        self.hits = self.misses = self.evictions = 0
+        self.size = 0
+        # uid -> (value, size, expires, blob), least recently used first
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __setitem__(self, uid, value):
+        blob = None
+        fp = value.get("fp")
+        max_size = min(
+            filter(None, (self.max_upload_size, self.max_bytes)), default=0
+        )
+        if (
+            self.blobs is not None
+            and fp is not None
+            and not getattr(fp, "closed", False)
+        ):
+            blob = self.blobs.add(fp, max_size)
+            value = dict(
+                value,
+                fp=self.blobs.reader(blob),
+                size=blob.size,
+                digest=blob.digest,
+            )
+            size = blob.size
+        else:
+            size = entry_size(value)
+            check_size(size, max_size)
+        expires = self.clock() + self.ttl if self.ttl else None
+        with self._lock:
+            if uid in self._entries:
+                self._remove(uid)
+            self._entries[uid] = (value, size, expires, blob)
+            self.size += size
+            self._evict()
+
+    def __getitem__(self, uid):
+        value = self.get(uid, _marker)
+        if value is _marker:
+            raise KeyError(uid)
+        return value
+
+    def get(self, uid, default=None):
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is not None and self._expired(entry):
+                self._remove(uid)
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(uid)
+            self.hits += 1
+            return entry[0]
+
+    def __contains__(self, uid):
+        return self.get(uid, _marker) is not _marker
+
+    def __delitem__(self, uid):
+        with self._lock:
+            if uid not in self._entries:
+                raise KeyError(uid)
+            self._remove(uid)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            for uid in list(self._entries):
+                self._remove(uid)
+
+    def remove_if(self, predicate):
+        """Drop the uploads whose uid satisfies ``predicate``."""
+        with self._lock:
+            for uid in [uid for uid in self._entries if predicate(uid)]:
+                self._remove(uid)
+
+    def preview_url(self, uid):
+        return None
+
+    def close(self):
+        """Drop every upload."""
+        self.clear()
+
+    def stats(self):
+        """Return the counters and the current usage of the store."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _expired(self, entry):
+        expires = entry[2]
+        return expires is not None and expires <= self.clock()
+
+    def _remove(self, uid):
+        value, size, expires, blob = self._entries.pop(uid)
+        self.size -= size
+        if blob is not None:
+            fp = value["fp"]
+            if isinstance(fp, SpooledFile):
+                fp.close()
+            self.blobs.release(blob)
+        return value
+
+    def _evict(self):
+        # expired uploads are mostly the least recently used ones: drop
+        # them from the front, then drop more until we are within limits,
+        # but never the upload just stored, at the back
+        while len(self._entries) > 1:
+            uid, entry = next(iter(self._entries.items()))
+            if not self._expired(entry):
+                break
+            self._remove(uid)
+            self.evictions += 1
+        while len(self._entries) > 1 and (
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_bytes and self.size > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+
+class SpooledFile(object):
+    """A read-only file object over an upload spooled to ``path``.
+
+    Reads are served from a memory map of the file, which the operating
+    system pages in and out as needed; :meth:`view` returns a part of the
+    file without copying it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.name = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def __len__(self):
+        return len(self._map)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return self._map.read()
+        return self._map.read(size)
+
+    def readline(self):
+        return self._map.readline()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        self._map.seek(offset, whence)
+        return self._map.tell()
+
+    def tell(self):
+        return self._map.tell()
+
+    def view(self, start=0, end=None):
+        """Return a :class:`memoryview` of bytes ``start`` to ``end``."""
+        return memoryview(self._map)[start:end]
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def close(self):
+        if not self._file.closed:
+            try:
+                self._map.close()
+            except BufferError:
+                # a view of the map is still in use; the map is closed when
+                # the last view goes away
+                pass
+            self._file.close()
+
+
+class Blob(object):
+    """The body shared by the uploads with the same content."""
+
+    def __init__(self, digest, size, body=None, path=None):
+        self.digest = digest
+        self.size = size
+        # the body is either kept in memory or spooled to ``path``
+        self.body = body
+        self.path = path
+        self.refs = 0
+
+
+def read_chunks(fp):
+    """Yield the content of a file object in chunks of
+    :data:`CHUNK_SIZE` bytes, from its start."""
+    fp.seek(0)
+    while True:
+        chunk = fp.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+class BlobStore(object):
+    """The bodies of uploads, kept once per SHA-256 digest of their content.
+
+    Bodies are hashed while they are read, in chunks.  Those larger than
+    ``spool_threshold`` bytes (if not ``0``) are written to files in
+    ``spool_dir`` as they are read, the others are kept in memory.  A body
+    is kept as long as an upload refers to it, and ``saved`` counts the
+    bytes of the uploads whose body was already there.
+    """
+
+    def __init__(self, spool_threshold=0, spool_dir=None):
+        self.spool_threshold = spool_threshold
+        self.spool_dir = None
+        if spool_threshold:
+            self.spool_dir = tempfile.mkdtemp(
+                prefix="deformdemo-", dir=spool_dir
+            )
+            atexit.register(self.close)
+        self.saved = 0
+        self._blobs = {}
+        self._lock = threading.Lock()
+
+    def add(self, fp, max_size=0):
+        """Store the body of file object ``fp`` and return its
+        :class:`Blob`, with one more reference to it."""
+        return self.add_chunks(read_chunks(fp), max_size)
+
+    def add_chunks(self, chunks, max_size=0):
+        """Store the body made of an iterable of ``chunks`` and return its
+        :class:`Blob`, with one more reference to it.
+
+        Only one chunk at a time is held in memory once the body is being
+        spooled.  :class:`UploadTooLarge` is raised as soon as the body
+        goes beyond ``max_size`` bytes (unless it is ``0``), and nothing is
+        stored.
+        """
+        sha = hashlib.sha256()
+        size = 0
+        kept = []
+        spool = path = None
+        try:
+            for chunk in chunks:
+                size += len(chunk)
+                check_size(size, max_size)
+                sha.update(chunk)
+                if spool is not None:
+                    spool.write(chunk)
+                    continue
+                kept.append(chunk)
+                if self.spool_threshold and size > self.spool_threshold:
+                    fd, path = tempfile.mkstemp(dir=self.spool_dir)
+                    spool = os.fdopen(fd, "wb")
+                    spool.writelines(kept)
+                    kept = []
+        except BaseException:
+            if path is not None:
+                spool.close()
+                os.unlink(path)
+            raise
+        finally:
+            if spool is not None:
+                spool.close()
+
+        digest = sha.hexdigest()
+        with self._lock:
+            blob = self._blobs.get(digest)
+            if blob is None:
+                body = None if path else b"".join(kept)
+                blob = self._blobs[digest] = Blob(digest, size, body, path)
+                path = None
+            else:
+                self.saved += size
+            blob.refs += 1
+        if path is not None:
+            # the body was already there
+            os.unlink(path)
+        return blob
+
+    def reader(self, blob):
+        """Return a new file object reading the body of ``blob``."""
+        if blob.path is not None:
+            return SpooledFile(blob.path)
+        return io.BytesIO(blob.body)
+
+    def release(self, blob):
+        """Drop a reference to ``blob``, and the blob with the last one."""
+        with self._lock:
+            blob.refs -= 1
+            if blob.refs > 0:
+                return
+            del self._blobs[blob.digest]
+        if blob.path is not None:
+            try:
+                os.unlink(blob.path)
+            except OSError:
+                pass
+
+    def stats(self):
+        """Return the number and size of the bodies kept, and the bytes
+        saved by keeping them once."""
+        with self._lock:
+            blobs = list(self._blobs.values())
+        return {
+            "blobs": len(blobs),
+            "blob_bytes": sum(blob.size for blob in blobs),
+            "dedup_saved_bytes": self.saved,
+        }
+
+    def close(self):
+        """Drop every body and remove the spool directory."""
+        with self._lock:
+            self._blobs.clear()
+        if self.spool_dir is not None:
+            shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+
+class SQLiteTmpStore(object):
+    """Instances of this class implement the
+    :class:`deform.interfaces.FileUploadTempStore` interface.
+
+    Uploads are kept in the SQLite database at ``path``, in write-ahead
+    logging mode, so that every process of a host using the same file sees
+    the same uploads.  The limits are those of :class:`MemoryTmpStore`,
+    applied to the whole database; the ``hits``, ``misses`` and
+    ``evictions`` counters only count the operations of this process.
+
+    Bodies are kept once per SHA-256 digest of their content, in the
+    ``blobs`` table, with a count of the uploads referring to them that
+    triggers keep up to date.  ``saved`` counts the bytes of the uploads
+    stored by this process whose body was already there.
+
+    Bodies are written to and read from the ``chunks`` table in chunks of
+    :data:`CHUNK_SIZE` bytes, so that they are never held in memory as a
+    whole: the ``fp`` of an upload read back from the database is a
+    :class:`ChunkedFile`.  An upload is read twice when stored, first to
+    compute its digest and size (which can't go beyond ``max_upload_size``
+    nor ``max_bytes``), then to copy its body if it wasn't already there.
+
+    Lookups only read the database, so they never wait for the write lock
+    of the database nor hold it.  The times uploads were last used, which
+    eviction goes by, are written along with the next upload stored, or
+    once ``used_batch`` lookups are pending.  Expired uploads are missed by
+    lookups and dropped by the next upload stored.
+    """
+
+    #: Version of the schema; databases with another one are recreated
+    schema_version = 2
+
+    #: How many lookups are pending at most before their times of use are
+    #: written
+    used_batch = 64
+
+    def __init__(
+        self,
+        path,
+        max_entries=0,
+        max_bytes=0,
+        ttl=0,
+        clock=time.time,
+        max_upload_size=0,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_upload_size = max_upload_size
+        # the clock is shared by processes, so it can't be a monotonic one
+        self.clock = clock
+        self.hits = self.misses = self.evictions = 0
+        self.saved = 0
+        self._local = threading.local()
+        # key -> the time the upload was last looked up by this process
+        self._used = {}
+        self._lock = threading.Lock()
+        with self._transaction() as db:
+            (version,) = db.execute("PRAGMA user_version").fetchone()
+            if version != self.schema_version:
+                # uploads are temporary: drop those of an older schema
+                db.execute("DROP TABLE IF EXISTS uploads")
+                db.execute("DROP TABLE IF EXISTS blobs")
+                db.execute("DROP TABLE IF EXISTS chunks")
+                db.execute("PRAGMA user_version = %d" % self.schema_version)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                " digest TEXT PRIMARY KEY,"
+                " size INTEGER NOT NULL,"
+                " refs INTEGER NOT NULL DEFAULT 0)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                " digest TEXT NOT NULL,"
+                " offset INTEGER NOT NULL,"
+                " data BLOB NOT NULL,"
+                " PRIMARY KEY (digest, offset))"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                " uid TEXT PRIMARY KEY,"
+                " meta TEXT NOT NULL,"
+                " digest TEXT,"
+                " size INTEGER NOT NULL,"
+                " expires REAL,"
+                " used REAL NOT NULL)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS uploads_used ON uploads (used)"
+            )
+            db.execute(
+                "CREATE TRIGGER IF NOT EXISTS uploads_ref"
+                " AFTER INSERT ON uploads WHEN NEW.digest IS NOT NULL BEGIN"
+                " UPDATE blobs SET refs = refs + 1 WHERE digest = NEW.digest;"
+                " END"
+            )
+            db.execute(
+                "CREATE TRIGGER IF NOT EXISTS uploads_unref"
+                " AFTER DELETE ON uploads WHEN OLD.digest IS NOT NULL BEGIN"
+                " UPDATE blobs SET refs = refs - 1 WHERE digest = OLD.digest;"
+                " DELETE FROM blobs WHERE digest = OLD.digest AND refs <= 0;"
+                " END"
+            )
+            db.execute(
+                "CREATE TRIGGER IF NOT EXISTS blobs_drop"
+                " AFTER DELETE ON blobs BEGIN"
+                " DELETE FROM chunks WHERE digest = OLD.digest;"
+                " END"
+            )
+
+    def _connection(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _transaction(self):
+        return _Transaction(self._connection())
+
+    @staticmethod
+    def _key(uid):
+        # uids of a SessionTmpStore are (session, uid) tuples
+        return json.dumps(list(uid) if isinstance(uid, tuple) else uid)
+
+    @staticmethod
+    def _uid(key):
+        uid = json.loads(key)
+        return tuple(uid) if isinstance(uid, list) else uid
+
+    def __setitem__(self, uid, value):
+        meta = {k: v for k, v in value.items() if k != "fp"}
+        fp = value.get("fp")
+        digest = None
+        size = 0
+        if fp is not None:
+            max_size = min(
+                filter(None, (self.max_upload_size, self.max_bytes)),
+                default=0,
+            )
+            sha = hashlib.sha256()
+            for chunk in read_chunks(fp):
+                size += len(chunk)
+                check_size(size, max_size)
+                sha.update(chunk)
+            digest = sha.hexdigest()
+        key = self._key(uid)
+        now = self.clock()
+        expires = now + self.ttl if self.ttl else None
+        with self._transaction() as db:
+            # replacing the upload first releases its former body, which
+            # may well be this one
+            db.execute("DELETE FROM uploads WHERE uid = ?", (key,))
+            if digest is not None:
+                cursor = db.execute(
+                    "INSERT OR IGNORE INTO blobs (digest, size) VALUES (?, ?)",
+                    (digest, size),
+                )
+                if cursor.rowcount:
+                    db.executemany(
+                        "INSERT INTO chunks VALUES (?, ?, ?)",
+                        (
+                            (digest, offset, chunk)
+                            for offset, chunk in _offsets(read_chunks(fp))
+                        ),
+                    )
+                else:
+                    self.saved += size
+            db.execute(
+                "INSERT INTO uploads VALUES (?, ?, ?, ?, ?, ?)",
+                (key, json.dumps(meta), digest, size, expires, now),
+            )
+            self._write_used(db)
+            self._evict(db, now, key)
+
+    def __getitem__(self, uid):
+        value = self.get(uid, _marker)
+        if value is _marker:
+            raise KeyError(uid)
+        return value
+
+    def get(self, uid, default=None):
+        key = self._key(uid)
+        now = self.clock()
+        row = (
+            self._connection()
+            .execute(
+                "SELECT meta, digest, size, expires FROM uploads"
+                " WHERE uid = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None or (row[3] is not None and row[3] <= now):
+            self.misses += 1
+            return default
+        self.hits += 1
+        with self._lock:
+            self._used[key] = now
+            flush = len(self._used) >= self.used_batch
+        if flush:
+            with self._transaction() as db:
+                self._write_used(db)
+        meta, digest, size, expires = row
+        value = json.loads(meta)
+        if digest is not None:
+            value["fp"] = ChunkedFile(self, digest, size)
+            value["digest"] = digest
+        value.setdefault("preview_url", self.preview_url(uid))
+        return value
+
+    def __contains__(self, uid):
+        row = (
+            self._connection()
+            .execute(
+                "SELECT expires FROM uploads WHERE uid = ?", (self._key(uid),)
+            )
+            .fetchone()
+        )
+        return row is not None and (row[0] is None or row[0] > self.clock())
+
+    def __delitem__(self, uid):
+        with self._transaction() as db:
+            cursor = db.execute(
+                "DELETE FROM uploads WHERE uid = ?", (self._key(uid),)
+            )
+        if not cursor.rowcount:
+            raise KeyError(uid)
+
+    def __len__(self):
+        return (
+            self._connection()
+            .execute("SELECT COUNT(*) FROM uploads")
+            .fetchone()[0]
+        )
+
+    def clear(self):
+        with self._transaction() as db:
+            db.execute("DELETE FROM uploads")
+
+    def remove_if(self, predicate):
+        """Drop the uploads whose uid satisfies ``predicate``."""
+        with self._transaction() as db:
+            keys = [
+                (key,)
+                for (key,) in db.execute("SELECT uid FROM uploads")
+                if predicate(self._uid(key))
+            ]
+            db.executemany("DELETE FROM uploads WHERE uid = ?", keys)
+
+    def preview_url(self, uid):
+        return None
+
+    def read_chunk(self, digest, position):
+        """Return the chunk of the body with ``digest`` holding byte
+        ``position``, and the offset of its first byte."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT offset, data FROM chunks"
+                " WHERE digest = ? AND offset <= ?"
+                " ORDER BY offset DESC LIMIT 1",
+                (digest, position),
+            )
+            .fetchone()
+        )
+        return (0, b"") if row is None else row
+
+    def stats(self):
+        """Return the counters of this process and the current usage of
+        the database."""
+        db = self._connection()
+        entries, size = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM uploads"
+        ).fetchone()
+        blobs, blob_bytes = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+        ).fetchone()
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "blobs": blobs,
+            "blob_bytes": blob_bytes,
+            "dedup_saved_bytes": self.saved,
+        }
+
+    def close(self):
+        """Write the pending times of use, and close the connection of the
+        current thread."""
+        if self._used:
+            with self._transaction() as db:
+                self._write_used(db)
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    def _write_used(self, db):
+        with self._lock:
+            used, self._used = self._used, {}
+        db.executemany(
+            "UPDATE uploads SET used = MAX(used, ?) WHERE uid = ?",
+            ((now, key) for key, now in used.items()),
+        )
+
+    def _evict(self, db, now, keep):
+        cursor = db.execute(
+            "DELETE FROM uploads WHERE expires IS NOT NULL AND expires <= ?",
+            (now,),
+        )
+        self.evictions += max(cursor.rowcount, 0)
+        if not (self.max_entries or self.max_bytes):
+            return
+        entries, size = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM uploads"
+        ).fetchone()
+        victims = []
+        for key, entry_size in db.execute(
+            "SELECT uid, size FROM uploads ORDER BY used"
+        ):
+            if (not self.max_entries or entries <= self.max_entries) and (
+                not self.max_bytes or size <= self.max_bytes
+            ):
+                break
+            if key == keep:
+                # never the upload just stored
+                continue
+            victims.append((key,))
+            entries -= 1
+            size -= entry_size
+        db.executemany("DELETE FROM uploads WHERE uid = ?", victims)
+        self.evictions += len(victims)
+
+
+def _offsets(chunks):
+    offset = 0
+    for chunk in chunks:
+        yield offset, chunk
+        offset += len(chunk)
+
+
+class ChunkedFile(object):
+    """A read-only file object over a body kept in chunks by a
+    :class:`SQLiteTmpStore`, which are fetched as they are read."""
+
+    def __init__(self, store, digest, size):
+        self.store = store
+        self.digest = digest
+        self.size = size
+        self.closed = False
+        self._position = 0
+
+    def __len__(self):
+        return self.size
+
+    def read(self, size=-1):
+        end = self.size
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+        parts = []
+        while self._position < end:
+            offset, data = self.store.read_chunk(self.digest, self._position)
+            start, stop = self._position - offset, end - offset
+            part = data[start:stop]
+            if not part:
+                # the body was removed meanwhile
+                break
+            parts.append(part)
+            self._position += len(part)
+        return b"".join(parts)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        self._position = max(offset, 0)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        self.closed = True
+
+
+class _Transaction(object):
+    """An immediate transaction on a SQLite connection, as a context
+    manager returning the connection."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def request_session_key():
+    """Return the key of the uploads of the session of the current request,
+    or ``None`` outside of a request."""
+    request = get_current_request()
+    if request is None:
+        return None
+    session = request.session
+    key = session.get("deformdemo.uploads")
+    if key is None:
+        key = session["deformdemo.uploads"] = uuid.uuid4().hex
+    return key
+
+
+class SessionTmpStore(object):
+    """Instances of this class implement the
+    :class:`deform.interfaces.FileUploadTempStore` interface.
+
+    Uploads are stored under the key of their session, as returned by
+    ``session_key``, in one of ``stripes`` stores returned by
+    ``make_store``.  The store of a session is picked by hashing its key,
+    so requests of different sessions seldom wait on the same lock.
+    :meth:`clear` only drops the uploads of the current session.
+
+    The ``preview_url`` of an upload is the URL of the ``upload_preview``
+    route (see :mod:`deformdemo.preview`); it is set on uploads as they are
+    stored, since the stores keep a copy of them which deform doesn't see.
+    An upload too large to be stored raises :exc:`colander.Invalid`, which
+    :class:`deform.widget.FileUploadWidget` lets through, so that it is
+    shown as the error of its field.
+    """
+
+    def __init__(
+        self,
+        make_store,
+        stripes=16,
+        session_key=request_session_key,
+        blobs=None,
+    ):
+        self.session_key = session_key
+        # the BlobStore shared by the stripes, if any
+        self.blobs = blobs
+        self._stripes = [make_store() for _ in range(stripes)]
+
+    def _locate(self, uid):
+        key = self.session_key()
+        return self._stripes[hash(key) % len(self._stripes)], (key, uid)
+
+    def __setitem__(self, uid, value):
+        value["preview_url"] = self.preview_url(uid)
+        stripe, uid = self._locate(uid)
+        try:
+            stripe[uid] = value
+        except UploadTooLarge as e:
+            raise colander.Invalid(None, str(e))
+
+    def __getitem__(self, uid):
+        stripe, uid = self._locate(uid)
+        return stripe[uid]
+
+    def get(self, uid, default=None):
+        stripe, uid = self._locate(uid)
+        return stripe.get(uid, default)
+
+    def __contains__(self, uid):
+        stripe, uid = self._locate(uid)
+        return uid in stripe
+
+    def __delitem__(self, uid):
+        stripe, uid = self._locate(uid)
+        del stripe[uid]
+
+    def __len__(self):
+        return sum(len(stripe) for stripe in self._stripes)
+
+    def clear(self):
+        """Drop the uploads of the current session."""
+        key = self.session_key()
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        stripe.remove_if(lambda uid: uid[0] == key)
+
+    def preview_url(self, uid):
+        request = get_current_request()
+        if request is None:
+            return None
+        return request.route_url("upload_preview", uid=uid)
+
+    def stats(self):
+        """Return the counters and usage of all the stores, summed."""
+        total = collections.Counter()
+        for stripe in self._stripes:
+            total.update(stripe.stats())
+        if self.blobs is not None:
+            total.update(self.blobs.stats())
+        return dict(total)
+
+    def close(self):
+        for stripe in self._stripes:
+            close = getattr(stripe, "close", None)
+            if close is not None:
+                close()
+        if self.blobs is not None:
+            self.blobs.close()
+
+
+def tmpstore_from_settings(settings):
+    """Return a :class:`SessionTmpStore` configured from application
+    settings.
+
+    Each of its stripes is a :class:`MemoryTmpStore` with its share of the
+    limits, of no less than ``max_upload_size`` bytes, and they all keep the
+    bodies of uploads in one :class:`BlobStore`.  With the ``sqlite``
+    backend, its only stripe is a :class:`SQLiteTmpStore`.
+    """
+    options = {}
+    for name, default in DEFAULTS.items():
+        options[name] = int(
+            settings.get("deformdemo.tmpstore." + name, default)
+        )
+    stripes = max(options.pop("stripes"), 1)
+    spool_threshold = options.pop("spool_threshold")
+    max_bytes = options["max_bytes"]
+    max_upload_size = options["max_upload_size"]
+    if max_bytes and max_upload_size:
+        if max_upload_size > max_bytes:
+            raise ValueError(
+                "deformdemo.tmpstore.max_upload_size (%d) is larger than "
+                "deformdemo.tmpstore.max_bytes (%d)"
+                % (max_upload_size, max_bytes)
+            )
+        # every stripe must have room for the largest upload accepted
+        stripes = min(stripes, max_bytes // max_upload_size)
+
+    backend = settings.get("deformdemo.tmpstore.backend", "memory")
+    if backend == "sqlite":
+        path = settings["deformdemo.tmpstore.sqlite_path"]
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        store = SQLiteTmpStore(path, **options)
+        return SessionTmpStore(lambda: store, 1)
+    elif backend != "memory":
+        raise ValueError("Unknown upload store backend: %s" % backend)
+
+    spool_dir = settings.get("deformdemo.tmpstore.spool_dir") or None
+    if spool_threshold and spool_dir and not os.path.isdir(spool_dir):
+        os.makedirs(spool_dir)
+    blobs = BlobStore(spool_threshold, spool_dir)
+    for name in ("max_entries", "max_bytes"):
+        if options[name]:
+            options[name] = max(options[name] // stripes, 1)
+
+    def make_store():
+        return MemoryTmpStore(blobs=blobs, **options)
+
+    return SessionTmpStore(make_store, stripes, blobs=blobs)
+
+
+def get_tmpstore(registry):
+    """Return the upload store of a Pyramid registry."""
+    tmpstore = getattr(registry, "deformdemo_tmpstore", None)
+    if tmpstore is None:
+        settings = registry.settings or {}
+        tmpstore = registry.deformdemo_tmpstore = tmpstore_from_settings(
+            settings
+        )
+    return tmpstore
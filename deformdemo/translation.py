@@ -0,0 +1,149 @@
+"""Translating the terms of widget templates, once per locale.
+
+Chameleon hands the translator of the widget renderer every translation
+string it meets: titles, descriptions, buttons, error messages.  The
+translator used to look the current request up in Pyramid's thread-local
+stack and resolve its localizer for each of them, and to run gettext and
+the interpolation of the term again every time.
+
+A :class:`WidgetTranslator` resolves the localizer once per request, in a
+slot of its own which a tween fills in, and keeps the translations in a
+:class:`TranslationCache` shared by every thread, keyed by locale, message
+id, domain, default, context and mapping:
+
+``deformdemo.translations.cache_size``
+    How many translations are kept before starting over (default: 4096).
+"""
+
+import threading
+
+from pyramid.i18n import get_localizer
+from pyramid.threadlocal import get_current_request
+
+
+def translation_key(term):
+    """Return the key of the translation of ``term`` in a locale, or
+    ``None`` if its translation can't be kept."""
+    if not hasattr(term, "interpolate"):
+        return None
+    default = term.default
+    if default is not None and type(default) is not str:
+        # Chameleon tells its own markers by identity
+        return None
+    mapping = term.mapping
+    if mapping:
+        for value in mapping.values():
+            # values which are equal but printed differently (1, 1.0 and
+            # True) or translated themselves would share a key
+            if type(value) not in (str, int):
+                return None
+        mapping = tuple(sorted(mapping.items()))
+    return (str(term), term.domain, default, term.context, mapping)
+
+
+class TranslationCache(object):
+    """Translations of terms, by locale.
+
+    Lookups don't lock: the translations are kept in a dictionary which is
+    emptied when it holds ``max_entries`` of them, as forms of the
+    :class:`deformdemo.formcache.FormCache` are.
+    """
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self.hits = self.misses = 0
+        self._translations = {}
+        self._lock = threading.Lock()
+
+    def translate(self, localizer, term):
+        """Return the translation of ``term`` by ``localizer``."""
+        key = translation_key(term)
+        if key is None:
+            return localizer.translate(term)
+        key = (localizer.locale_name, key)
+        translated = self._translations.get(key)
+        if translated is not None:
+            self.hits += 1
+            return translated
+        self.misses += 1
+        translated = localizer.translate(term)
+        with self._lock:
+            if len(self._translations) >= self.max_entries:
+                self._translations.clear()
+            self._translations[key] = translated
+        return translated
+
+    def stats(self):
+        """Return the counters and the number of translations kept."""
+        return {
+            "entries": len(self._translations),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class WidgetTranslator(object):
+    """The translator of widget templates, translating terms to the locale
+    of the current request through a :class:`TranslationCache`.
+
+    :meth:`begin` and :meth:`end` bracket each request of the thread (see
+    :func:`translation_tween_factory`); the localizer of the request is
+    resolved on its first term.  Terms met outside of a request bracketed
+    so are translated to the locale of the current Pyramid request.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._current = threading.local()
+
+    def begin(self, request):
+        self._current.request = request
+        self._current.localizer = None
+
+    def end(self):
+        self._current.request = self._current.localizer = None
+
+    def localizer(self):
+        """Return the localizer of the current request."""
+        current = self._current
+        localizer = getattr(current, "localizer", None)
+        if localizer is None:
+            request = getattr(current, "request", None)
+            if request is None:
+                return get_localizer(get_current_request())
+            localizer = current.localizer = get_localizer(request)
+        return localizer
+
+    def __call__(self, term):
+        return self.cache.translate(self.localizer(), term)
+
+
+def widget_translator_from_settings(settings):
+    """Return the :class:`WidgetTranslator` configured by application
+    settings."""
+    cache_size = settings.get("deformdemo.translations.cache_size", 4096)
+    return WidgetTranslator(TranslationCache(int(cache_size)))
+
+
+def get_widget_translator(registry):
+    """Return the :class:`WidgetTranslator` of a Pyramid registry."""
+    translator = getattr(registry, "deformdemo_widget_translator", None)
+    if translator is None:
+        settings = registry.settings or {}
+        translator = registry.deformdemo_widget_translator = (
+            widget_translator_from_settings(settings)
+        )
+    return translator
+
+
+def translation_tween_factory(handler, registry):
+    translator = get_widget_translator(registry)
+
+    def translation_tween(request):
+        translator.begin(request)
+        try:
+            return handler(request)
+        finally:
+            translator.end()
+
+    return translation_tween
@@ -43,10 +43,12 @@ lint_extras = [
     "readme_renderer",
 ]
 
-testing_extras = ["flaky", "pytest"]
+testing_extras = ["flaky", "pytest", "webtest"]
 
 testing_extras.extend(["selenium >= 4.0.0.b4, < 4.9.0"])
 
+benchmark_extras = ["webtest"]
+
 setup(
     name="deformdemo",
     version=VERSION,
@@ -76,7 +78,11 @@ setup(
     include_package_data=True,
     zip_safe=False,
     install_requires=requires,
-    extras_require={"lint": lint_extras, "testing": testing_extras},
+    extras_require={
+        "lint": lint_extras,
+        "testing": testing_extras,
+        "benchmark": benchmark_extras,
+    },
     entry_points="""\
     [paste.app_factory]
     demo = deformdemo:main
@@ -8,9 +8,10 @@ import logging
 import sys
 
 import colander
+from pyramid.httpexceptions import HTTPBadRequest
+from pyramid.httpexceptions import HTTPNotModified
 from pyramid.i18n import TranslationStringFactory
 from pyramid.i18n import get_locale_name
-from pyramid.renderers import get_renderer
 from pyramid.response import Response
 from pyramid.view import view_config
 from pyramid.view import view_defaults
@@ -20,6 +21,12 @@ from pygments import highlight
 from pygments.formatters import HtmlFormatter
 from pygments.lexers import PythonLexer
 
+from deformdemo.registry import demonstrate
+from deformdemo.registry import get_demo_registry
+from deformdemo.sourcecode import get_highlighted_module
+from deformdemo.sourcecode import highlight_code
+from deformdemo.templating import get_macros
+
 
 log = logging.getLogger(__name__)
 _ = TranslationStringFactory("unofficial-deformdemo")
@@ -30,20 +37,11 @@ css = formatter.get_style_defs()
 # the zpt_renderer above is referred to within the demo.ini file by dotted name
 
 
-class demonstrate(object):
-    def __init__(self, title):
-        self.title = title
-
-    def __call__(self, method):
-        method.demo = self.title
-        return method
-
-
 @view_defaults(route_name="unofficial-deformdemo")
 class UnofficialDeformDemo(object):
     def __init__(self, request):
         self.request = request
-        self.macros = get_renderer("templates/main.pt").implementation().macros
+        self.macros = get_macros(request)
 
     def render_form(
         self,
@@ -86,7 +84,10 @@ class UnofficialDeformDemo(object):
         code, start, end = self.get_code(2)
         locale_name = get_locale_name(self.request)
 
-        reqts = form.get_widget_resources()
+        demo = self.get_demo()
+        if demo.resources is None:
+            demo.resources = form.get_widget_resources()
+        reqts = demo.resources
 
         # values passed to template for rendering
         return {
@@ -104,11 +105,7 @@ class UnofficialDeformDemo(object):
         }
 
     def get_code(self, level):
-        frame = sys._getframe(level)
-        lines, start = inspect.getsourcelines(frame.f_code)
-        end = start + len(lines)
-        code = "".join(lines)
-        return highlight(code, PythonLexer(), formatter), start, end
+        return highlight_code(sys._getframe(level).f_code)
 
     @view_config(name="allcode",
                  renderer="templates/code.pt",
@@ -117,29 +114,27 @@ class UnofficialDeformDemo(object):
         params = self.request.params
         start = params.get("start")
         end = params.get("end")
-        hl_lines = None
         if start and end:
-            start = int(start)
-            end = int(end)
-            hl_lines = list(range(start, end))
-        code = open(inspect.getsourcefile(self.__class__), "r").read()
-        code = code.encode("utf-8")
-        formatter = HtmlFormatter(
-            linenos="table",
-            lineanchors="line",
-            cssclass="hightlight ",
-            hl_lines=hl_lines,
-        )
-        html = highlight(code, PythonLexer(), formatter)
-        return {"code": html, "demos": self.get_demos()}
+            try:
+                start = int(start)
+                end = int(end)
+            except ValueError:
+                raise HTTPBadRequest("start and end must be line numbers")
+        else:
+            start = end = None
+        module = get_highlighted_module(inspect.getsourcefile(self.__class__))
+        etag = module.etag_for(self.request.application_url, start, end)
+        if etag in self.request.if_none_match:
+            return HTTPNotModified(etag=etag)
+        self.request.response.etag = etag
+        return {"code": module.render(start, end), "demos": self.get_demos()}
+
+    def get_demo(self):
+        demos = get_demo_registry(self.request.registry)
+        return demos.get("unofficial-deformdemo", self.request.view_name)
 
     def get_title(self):
-        # gross hack; avert your eyes
-        frame = sys._getframe(3)
-        attr = frame.f_locals["attr"]
-        inst = frame.f_locals["inst"]
-        method = getattr(inst, attr)
-        return method.demo
+        return self.get_demo().title
 
     @view_config(name="pygments.css", route_name="unofficial-deformdemo")
     def cssview(self):
@@ -153,19 +148,8 @@ class UnofficialDeformDemo(object):
         return {"demos": self.get_demos()}
 
     def get_demos(self):
-        def predicate(value):
-            if getattr(value, "demo", None) is not None:
-                return True
-
-        demos = inspect.getmembers(self, predicate)
-        L = []
-        for name, method in demos:
-            url = self.request.resource_url(
-                self.request.root, name, route_name="unofficial-deformdemo"
-            )
-            L.append((method.demo, url))
-        L.sort()
-        return L
+        demos = get_demo_registry(self.request.registry)
+        return demos.links(self.request, "unofficial-deformdemo")
 
     # Unofficial Deform Demo Forms Start Here.
 